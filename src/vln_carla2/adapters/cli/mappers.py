@@ -18,7 +18,9 @@ from vln_carla2.adapters.cli.dto import SpawnVehicleRequest as AdapterSpawnVehic
 from vln_carla2.adapters.cli.dto import VehicleRefInput as AdapterVehicleRefInput
 from vln_carla2.usecases.cli.dto import (
     ExpRunRequest,
+    LaunchParams,
     OperatorRunRequest,
+    RuntimeConnectionParams,
     SceneRunRequest,
     SpawnVehicleRequest,
     SpectatorFollowRequest,
@@ -28,25 +30,17 @@ from vln_carla2.usecases.cli.dto import (
     VehicleSpawnRequest,
 )
 
+_LaunchCommand = SceneRunCommand | OperatorRunCommand | ExpRunCommand | TrackingRunCommand
+_ConnectionCommand = (
+    _LaunchCommand | VehicleListCommand | VehicleSpawnCommand | SpectatorFollowCommand
+)
+
 
 def to_scene_run_request(command: SceneRunCommand) -> SceneRunRequest:
     return SceneRunRequest(
-        host=command.host,
-        port=command.port,
-        timeout_seconds=command.timeout_seconds,
-        map_name=command.map_name,
-        mode=command.mode,
-        fixed_delta_seconds=command.fixed_delta_seconds,
-        no_rendering=command.no_rendering,
+        conn=_to_connection_params(command),
+        launch=_to_launch_params(command),
         tick_sleep_seconds=command.tick_sleep_seconds,
-        offscreen=command.offscreen,
-        launch_carla=command.launch_carla,
-        reuse_existing_carla=command.reuse_existing_carla,
-        carla_exe=command.carla_exe,
-        carla_startup_timeout_seconds=command.carla_startup_timeout_seconds,
-        quality_level=command.quality_level,
-        with_sound=command.with_sound,
-        keep_carla_server=command.keep_carla_server,
         scene_import=command.scene_import,
         scene_export_path=command.scene_export_path,
         export_episode_spec=command.export_episode_spec,
@@ -62,22 +56,9 @@ def to_scene_run_request(command: SceneRunCommand) -> SceneRunRequest:
 
 def to_operator_run_request(command: OperatorRunCommand) -> OperatorRunRequest:
     return OperatorRunRequest(
-        host=command.host,
-        port=command.port,
-        timeout_seconds=command.timeout_seconds,
-        map_name=command.map_name,
-        mode=command.mode,
-        fixed_delta_seconds=command.fixed_delta_seconds,
-        no_rendering=command.no_rendering,
+        conn=_to_connection_params(command),
+        launch=_to_launch_params(command),
         tick_sleep_seconds=command.tick_sleep_seconds,
-        offscreen=command.offscreen,
-        launch_carla=command.launch_carla,
-        reuse_existing_carla=command.reuse_existing_carla,
-        carla_exe=command.carla_exe,
-        carla_startup_timeout_seconds=command.carla_startup_timeout_seconds,
-        quality_level=command.quality_level,
-        with_sound=command.with_sound,
-        keep_carla_server=command.keep_carla_server,
         follow=_to_vehicle_ref(command.follow),
         z=command.z,
         spawn_request=_to_spawn_request(command.spawn_request),
@@ -91,22 +72,9 @@ def to_operator_run_request(command: OperatorRunCommand) -> OperatorRunRequest:
 
 def to_exp_run_request(command: ExpRunCommand) -> ExpRunRequest:
     return ExpRunRequest(
-        host=command.host,
-        port=command.port,
-        timeout_seconds=command.timeout_seconds,
-        map_name=command.map_name,
-        mode=command.mode,
-        fixed_delta_seconds=command.fixed_delta_seconds,
-        no_rendering=command.no_rendering,
+        conn=_to_connection_params(command),
+        launch=_to_launch_params(command),
         tick_sleep_seconds=command.tick_sleep_seconds,
-        offscreen=command.offscreen,
-        launch_carla=command.launch_carla,
-        reuse_existing_carla=command.reuse_existing_carla,
-        carla_exe=command.carla_exe,
-        carla_startup_timeout_seconds=command.carla_startup_timeout_seconds,
-        quality_level=command.quality_level,
-        with_sound=command.with_sound,
-        keep_carla_server=command.keep_carla_server,
         episode_spec=command.episode_spec,
         control_target=_to_vehicle_ref(command.control_target),
         forward_distance_m=command.forward_distance_m,
@@ -117,22 +85,9 @@ def to_exp_run_request(command: ExpRunCommand) -> ExpRunRequest:
 
 def to_tracking_run_request(command: TrackingRunCommand) -> TrackingRunRequest:
     return TrackingRunRequest(
-        host=command.host,
-        port=command.port,
-        timeout_seconds=command.timeout_seconds,
-        map_name=command.map_name,
-        mode=command.mode,
-        fixed_delta_seconds=command.fixed_delta_seconds,
-        no_rendering=command.no_rendering,
+        conn=_to_connection_params(command),
+        launch=_to_launch_params(command),
         tick_sleep_seconds=command.tick_sleep_seconds,
-        offscreen=command.offscreen,
-        launch_carla=command.launch_carla,
-        reuse_existing_carla=command.reuse_existing_carla,
-        carla_exe=command.carla_exe,
-        carla_startup_timeout_seconds=command.carla_startup_timeout_seconds,
-        quality_level=command.quality_level,
-        with_sound=command.with_sound,
-        keep_carla_server=command.keep_carla_server,
         episode_spec=command.episode_spec,
         control_target=_to_vehicle_ref(command.control_target),
         target_speed_mps=command.target_speed_mps,
@@ -173,26 +128,14 @@ def to_tracking_run_request(command: TrackingRunCommand) -> TrackingRunRequest:
 
 def to_vehicle_list_request(command: VehicleListCommand) -> VehicleListRequest:
     return VehicleListRequest(
-        host=command.host,
-        port=command.port,
-        timeout_seconds=command.timeout_seconds,
-        map_name=command.map_name,
-        mode=command.mode,
-        fixed_delta_seconds=command.fixed_delta_seconds,
-        no_rendering=command.no_rendering,
+        conn=_to_connection_params(command),
         output_format=command.output_format,
     )
 
 
 def to_vehicle_spawn_request(command: VehicleSpawnCommand) -> VehicleSpawnRequest:
     return VehicleSpawnRequest(
-        host=command.host,
-        port=command.port,
-        timeout_seconds=command.timeout_seconds,
-        map_name=command.map_name,
-        mode=command.mode,
-        fixed_delta_seconds=command.fixed_delta_seconds,
-        no_rendering=command.no_rendering,
+        conn=_to_connection_params(command),
         output_format=command.output_format,
         spawn_request=_to_spawn_request(command.spawn_request),
     )
@@ -200,6 +143,14 @@ def to_vehicle_spawn_request(command: VehicleSpawnCommand) -> VehicleSpawnReques
 
 def to_spectator_follow_request(command: SpectatorFollowCommand) -> SpectatorFollowRequest:
     return SpectatorFollowRequest(
+        conn=_to_connection_params(command),
+        follow=_to_vehicle_ref(command.follow),
+        z=command.z,
+    )
+
+
+def _to_connection_params(command: _ConnectionCommand) -> RuntimeConnectionParams:
+    return RuntimeConnectionParams(
         host=command.host,
         port=command.port,
         timeout_seconds=command.timeout_seconds,
@@ -207,8 +158,19 @@ def to_spectator_follow_request(command: SpectatorFollowCommand) -> SpectatorFol
         mode=command.mode,
         fixed_delta_seconds=command.fixed_delta_seconds,
         no_rendering=command.no_rendering,
-        follow=_to_vehicle_ref(command.follow),
-        z=command.z,
+    )
+
+
+def _to_launch_params(command: _LaunchCommand) -> LaunchParams:
+    return LaunchParams(
+        offscreen=command.offscreen,
+        launch_carla=command.launch_carla,
+        reuse_existing_carla=command.reuse_existing_carla,
+        carla_exe=command.carla_exe,
+        carla_startup_timeout_seconds=command.carla_startup_timeout_seconds,
+        quality_level=command.quality_level,
+        with_sound=command.with_sound,
+        keep_carla_server=command.keep_carla_server,
     )
 
 
@@ -24,6 +24,7 @@ from vln_carla2.usecases.cli.dto import (
     ExpWorkflowExecution,
     OperatorRunRequest,
     OperatorWorkflowExecution,
+    RuntimeConnectionParams,
     SceneRunRequest,
     SpawnVehicleRequest,
     SpectatorFollowRequest,
@@ -49,14 +50,14 @@ class CliWorkflowGateway(CliWorkflowPort):
 
     def run_scene_workflow(self, request: SceneRunRequest) -> None:
         settings = SceneEditorSettings(
-            host=request.host,
-            port=request.port,
-            timeout_seconds=request.timeout_seconds,
-            map_name=request.map_name,
-            synchronous_mode=request.mode == "sync",
-            fixed_delta_seconds=request.fixed_delta_seconds,
-            no_rendering_mode=request.no_rendering,
-            offscreen_mode=request.offscreen,
+            host=request.conn.host,
+            port=request.conn.port,
+            timeout_seconds=request.conn.timeout_seconds,
+            map_name=request.conn.map_name,
+            synchronous_mode=request.conn.mode == "sync",
+            fixed_delta_seconds=request.conn.fixed_delta_seconds,
+            no_rendering_mode=request.conn.no_rendering,
+            offscreen_mode=request.launch.offscreen,
             tick_sleep_seconds=request.tick_sleep_seconds,
             scene_import_path=request.scene_import,
             scene_export_path=request.scene_export_path,
@@ -78,14 +79,14 @@ class CliWorkflowGateway(CliWorkflowPort):
 
     def run_operator_workflow(self, request: OperatorRunRequest) -> OperatorWorkflowExecution:
         settings = OperatorWorkflowSettings(
-            host=request.host,
-            port=request.port,
-            timeout_seconds=request.timeout_seconds,
-            map_name=request.map_name,
-            synchronous_mode=request.mode == "sync",
-            fixed_delta_seconds=request.fixed_delta_seconds,
-            no_rendering_mode=request.no_rendering,
-            offscreen_mode=request.offscreen,
+            host=request.conn.host,
+            port=request.conn.port,
+            timeout_seconds=request.conn.timeout_seconds,
+            map_name=request.conn.map_name,
+            synchronous_mode=request.conn.mode == "sync",
+            fixed_delta_seconds=request.conn.fixed_delta_seconds,
+            no_rendering_mode=request.conn.no_rendering,
+            offscreen_mode=request.launch.offscreen,
             tick_sleep_seconds=request.tick_sleep_seconds,
             spectator_initial_z=request.z,
             vehicle_ref=_to_operator_vehicle_ref(request.follow),
@@ -108,13 +109,13 @@ class CliWorkflowGateway(CliWorkflowPort):
     def run_exp_workflow(self, request: ExpRunRequest) -> ExpWorkflowExecution:
         settings = ExpRunSettings(
             episode_spec_path=request.episode_spec,
-            host=request.host,
-            port=request.port,
-            timeout_seconds=request.timeout_seconds,
-            synchronous_mode=request.mode == "sync",
-            fixed_delta_seconds=request.fixed_delta_seconds,
-            no_rendering_mode=request.no_rendering,
-            offscreen_mode=request.offscreen,
+            host=request.conn.host,
+            port=request.conn.port,
+            timeout_seconds=request.conn.timeout_seconds,
+            synchronous_mode=request.conn.mode == "sync",
+            fixed_delta_seconds=request.conn.fixed_delta_seconds,
+            no_rendering_mode=request.conn.no_rendering,
+            offscreen_mode=request.launch.offscreen,
             control_target=_to_operator_vehicle_ref(request.control_target),
             forward_distance_m=request.forward_distance_m,
             target_speed_mps=request.target_speed_mps,
@@ -142,13 +143,13 @@ class CliWorkflowGateway(CliWorkflowPort):
     def run_tracking_workflow(self, request: TrackingRunRequest) -> TrackingWorkflowExecution:
         settings = TrackingRunSettings(
             episode_spec_path=request.episode_spec,
-            host=request.host,
-            port=request.port,
-            timeout_seconds=request.timeout_seconds,
-            synchronous_mode=request.mode == "sync",
-            fixed_delta_seconds=request.fixed_delta_seconds,
-            no_rendering_mode=request.no_rendering,
-            offscreen_mode=request.offscreen,
+            host=request.conn.host,
+            port=request.conn.port,
+            timeout_seconds=request.conn.timeout_seconds,
+            synchronous_mode=request.conn.mode == "sync",
+            fixed_delta_seconds=request.conn.fixed_delta_seconds,
+            no_rendering_mode=request.conn.no_rendering,
+            offscreen_mode=request.launch.offscreen,
             control_target=_to_operator_vehicle_ref(request.control_target),
             target_speed_mps=request.target_speed_mps,
             max_steps=request.max_steps,
@@ -236,16 +237,7 @@ class CliWorkflowGateway(CliWorkflowPort):
         *,
         follow_vehicle_id: int,
     ) -> None:
-        session_config = self._build_session_config(
-            host=request.host,
-            port=request.port,
-            timeout_seconds=request.timeout_seconds,
-            map_name=request.map_name,
-            mode=request.mode,
-            fixed_delta_seconds=request.fixed_delta_seconds,
-            no_rendering=request.no_rendering,
-            offscreen=False,
-        )
+        session_config = self._build_session_config(request.conn, offscreen=False)
         settings = SceneEditorSettings(
             host=session_config.host,
             port=session_config.port,
@@ -275,16 +267,7 @@ class CliWorkflowGateway(CliWorkflowPort):
         operation: Callable[[OperatorContainer, Any], T],
         sleep_seconds: float = 0.0,
     ) -> T:
-        session_config = self._build_session_config(
-            host=request.host,
-            port=request.port,
-            timeout_seconds=request.timeout_seconds,
-            map_name=request.map_name,
-            mode=request.mode,
-            fixed_delta_seconds=request.fixed_delta_seconds,
-            no_rendering=request.no_rendering,
-            offscreen=False,
-        )
+        session_config = self._build_session_config(request.conn, offscreen=False)
         with managed_carla_session(session_config) as session:
             container = build_operator_container(
                 world=session.world,
@@ -295,24 +278,18 @@ class CliWorkflowGateway(CliWorkflowPort):
 
     def _build_session_config(
         self,
+        conn: RuntimeConnectionParams,
         *,
-        host: str,
-        port: int,
-        timeout_seconds: float,
-        map_name: str,
-        mode: str,
-        fixed_delta_seconds: float,
-        no_rendering: bool,
         offscreen: bool,
     ) -> CarlaSessionConfig:
         return CarlaSessionConfig(
-            host=host,
-            port=port,
-            timeout_seconds=timeout_seconds,
-            map_name=map_name,
-            synchronous_mode=mode == "sync",
-            fixed_delta_seconds=fixed_delta_seconds,
-            no_rendering_mode=no_rendering,
+            host=conn.host,
+            port=conn.port,
+            timeout_seconds=conn.timeout_seconds,
+            map_name=conn.map_name,
+            synchronous_mode=conn.mode == "sync",
+            fixed_delta_seconds=conn.fixed_delta_seconds,
+            no_rendering_mode=conn.no_rendering,
             offscreen_mode=offscreen,
         )
 
@@ -11,10 +11,16 @@ from vln_carla2.infrastructure.carla.state_reader import CarlaVehicleStateReader
 from vln_carla2.usecases.control.run_control_loop import RunControlLoop
 
 
+@dataclass(slots=True)
 class StdoutLogger:
     """Small logger adapter for CLI usage."""
 
-    def info(self, message: str) -> None:
+    def is_info_enabled(self) -> bool:
+        return True
+
+    def info(self, message: str, *args: object) -> None:
+        if args:
+            message = message % args
         print(f"[INFO] {message}")
 
     def warn(self, message: str) -> None:
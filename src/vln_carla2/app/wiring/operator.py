@@ -18,6 +18,7 @@ from vln_carla2.usecases.shared.vehicle_ref import VehicleRefInput
 from vln_carla2.usecases.runtime.resolve_vehicle_ref import ResolveVehicleRef
 from vln_carla2.usecases.runtime.run_operator_loop import RunOperatorLoop
 from vln_carla2.usecases.runtime.run_operator_workflow import (
+    OPERATOR_WORKFLOW_STRATEGIES,
     OperatorWorkflowRequest,
     OperatorWorkflowResult,
     OperatorWorkflowStrategy,
@@ -149,7 +150,7 @@ class OperatorWorkflowSettings:
             raise ValueError("tick_sleep_seconds must be >= 0")
         if not self.map_name:
             raise ValueError("map_name must not be empty")
-        if self.strategy not in {"serial", "parallel"}:
+        if self.strategy not in OPERATOR_WORKFLOW_STRATEGIES:
             raise ValueError("strategy must be 'serial' or 'parallel'")
         if self.steps <= 0:
             raise ValueError("steps must be > 0")
@@ -284,7 +284,7 @@ def run_tracking_workflow(settings: TrackingRunSettings) -> TrackingRunResult:
     with managed_carla_session(session_config) as session:
         imported_objects = ImportSceneTemplate(
             store=scene_store,
-            spawner=CarlaSceneObjectSpawnerAdapter(session.world),
+            spawner=CarlaSceneObjectSpawnerAdapter(session.world, client=session.client),
             expected_map_name=scene_template.map_name,
         ).run(scene_json_path)
 
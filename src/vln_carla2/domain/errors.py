@@ -0,0 +1,5 @@
+"""Domain-level error types shared across slices."""
+
+
+class ActorMissingError(RuntimeError):
+    """Raised when a referenced simulator actor no longer exists."""
@@ -1,13 +1,20 @@
 """Domain port for converting obstacle point sets to forbidden zones."""
 
-from typing import Iterable, Protocol
+from typing import TYPE_CHECKING, Iterable, Protocol
 
 from vln_carla2.domain.model.forbidden_zone import ForbiddenZone
 from vln_carla2.domain.model.point2d import Point2D
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class ObstaclePointsToForbiddenZonePort(Protocol):
     """Build one forbidden zone from obstacle points."""
 
     def build(self, obstacle_points: Iterable[Point2D]) -> ForbiddenZone:
         ...
+
+    def build_from_array(self, xy: "np.ndarray") -> ForbiddenZone:
+        """Build from an (N, 2) array of obstacle x/y coordinates."""
+        ...
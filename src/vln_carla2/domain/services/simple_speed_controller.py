@@ -5,6 +5,11 @@ from dataclasses import dataclass
 from vln_carla2.domain.model.simple_command import ControlCommand, TargetSpeedCommand
 from vln_carla2.domain.model.vehicle_state import VehicleState
 
+# ControlCommand is immutable, so the fixed outputs can be shared across steps.
+_COAST_COMMAND = ControlCommand(throttle=0.0, brake=0.0, steer=0.0)
+_FULL_THROTTLE_COMMAND = ControlCommand(throttle=1.0, brake=0.0, steer=0.0)
+_FULL_BRAKE_COMMAND = ControlCommand(throttle=0.0, brake=1.0, steer=0.0)
+
 
 @dataclass(slots=True)
 class SimpleSpeedController:
@@ -17,10 +22,14 @@ class SimpleSpeedController:
     def compute(self, state: VehicleState, target: TargetSpeedCommand) -> ControlCommand:
         error = target.target_speed_mps - state.speed_mps
         if abs(error) <= self.speed_tolerance:
-            return ControlCommand(throttle=0.0, brake=0.0, steer=0.0)
+            return _COAST_COMMAND
         if error > 0.0:
-            throttle = min(1.0, max(0.0, error * self.throttle_gain))
-            return ControlCommand(throttle=throttle, brake=0.0, steer=0.0)
-        brake = min(1.0, max(0.0, (-error) * self.brake_gain))
-        return ControlCommand(throttle=0.0, brake=brake, steer=0.0)
+            throttle = error * self.throttle_gain
+            if throttle >= 1.0:
+                return _FULL_THROTTLE_COMMAND
+            return ControlCommand(throttle=max(0.0, throttle), brake=0.0, steer=0.0)
+        brake = (-error) * self.brake_gain
+        if brake >= 1.0:
+            return _FULL_BRAKE_COMMAND
+        return ControlCommand(throttle=0.0, brake=max(0.0, brake), steer=0.0)
 
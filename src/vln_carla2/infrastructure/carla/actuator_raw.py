@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from vln_carla2.domain.errors import ActorMissingError
 from vln_carla2.domain.model.simple_command import ControlCommand
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.infrastructure.carla.types import require_carla
@@ -15,13 +16,16 @@ class CarlaRawMotionActuator(MotionActuator):
         self._world = world
 
     def apply(self, vehicle_id: VehicleId, command: ControlCommand) -> None:
+        self.apply_raw(vehicle_id, command.throttle, command.brake, command.steer)
+
+    def apply_raw(self, vehicle_id: VehicleId, throttle: float, brake: float, steer: float) -> None:
         vehicle = self._require_vehicle(vehicle_id)
         carla = require_carla()
         vehicle.apply_control(
             carla.VehicleControl(
-                throttle=command.throttle,
-                brake=command.brake,
-                steer=command.steer,
+                throttle=throttle,
+                brake=brake,
+                steer=steer,
                 hand_brake=False,
                 reverse=False,
                 manual_gear_shift=False,
@@ -31,5 +35,5 @@ class CarlaRawMotionActuator(MotionActuator):
     def _require_vehicle(self, vehicle_id: VehicleId) -> Any:
         actor = self._world.get_actor(vehicle_id.value)
         if actor is None:
-            raise RuntimeError(f"Vehicle actor not found: id={vehicle_id.value}")
+            raise ActorMissingError(f"Vehicle actor not found: id={vehicle_id.value}")
         return actor
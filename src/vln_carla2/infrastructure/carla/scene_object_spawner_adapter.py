@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 from vln_carla2.domain.model.scene_template import SceneObject
 from vln_carla2.infrastructure.carla.spawner import spawn_vehicle
-from vln_carla2.usecases.scene.ports.scene_object_spawner import SceneObjectSpawnerPort
+from vln_carla2.infrastructure.carla.types import require_carla
+from vln_carla2.usecases.scene.ports.scene_object_spawner import SceneObjectBatchSpawnerPort
 
 
-class CarlaSceneObjectSpawnerAdapter(SceneObjectSpawnerPort):
-    """Spawn one scene object into CARLA world."""
+class CarlaSceneObjectSpawnerAdapter(SceneObjectBatchSpawnerPort):
+    """Spawn scene objects into CARLA world, batched when a client is available."""
 
-    def __init__(self, world: Any) -> None:
+    def __init__(self, world: Any, client: Any | None = None) -> None:
         self._world = world
+        self._client = client
+        self._blueprint_cache: dict[str, Any] = {}
 
     def spawn(self, obj: SceneObject) -> None:
         spawn_vehicle(
@@ -24,5 +27,61 @@ class CarlaSceneObjectSpawnerAdapter(SceneObjectSpawnerPort):
             spawn_z=obj.pose.z,
             spawn_yaw=obj.pose.yaw,
             role_name=obj.role_name,
+            blueprint_cache=self._blueprint_cache,
         )
 
+    def spawn_batch(self, objs: Sequence[SceneObject]) -> int:
+        if self._client is None:
+            for obj in objs:
+                self.spawn(obj)
+            return len(objs)
+
+        carla = require_carla()
+        blueprints = self._blueprint_cache
+        library: Any = None
+        commands: list[Any] = []
+        for obj in objs:
+            blueprint = blueprints.get(obj.blueprint_id)
+            if blueprint is None:
+                if library is None:
+                    library = self._world.get_blueprint_library()
+                matches = library.filter(obj.blueprint_id)
+                if not matches:
+                    raise RuntimeError(f"No blueprint matched filter: {obj.blueprint_id}")
+                blueprint = blueprints[obj.blueprint_id] = matches[0]
+            # SpawnActor snapshots the blueprint, so reusing it across roles is safe.
+            if blueprint.has_attribute("role_name"):
+                blueprint.set_attribute("role_name", obj.role_name)
+            pose = obj.pose
+            transform = carla.Transform(
+                carla.Location(x=float(pose.x), y=float(pose.y), z=float(pose.z)),
+                carla.Rotation(pitch=0.0, yaw=float(pose.yaw), roll=0.0),
+            )
+            commands.append(carla.command.SpawnActor(blueprint, transform))
+
+        if not commands:
+            return 0
+        responses = self._client.apply_batch_sync(commands, False)
+        failed: tuple[SceneObject, str] | None = None
+        spawned_ids: list[int] = []
+        for obj, response in zip(objs, responses):
+            if response.error:
+                if failed is None:
+                    failed = (obj, response.error)
+            else:
+                spawned_ids.append(response.actor_id)
+        if failed is None:
+            return len(commands)
+
+        # The batch is not atomic; remove what did spawn so a failed import leaves no actors.
+        if spawned_ids:
+            self._client.apply_batch_sync(
+                [carla.command.DestroyActor(actor_id) for actor_id in spawned_ids],
+                False,
+            )
+        obj, error = failed
+        pose = obj.pose
+        raise RuntimeError(
+            "Failed to spawn vehicle at fixed point "
+            f"(x={pose.x}, y={pose.y}, z={pose.z}, yaw={pose.yaw}): {error}"
+        )
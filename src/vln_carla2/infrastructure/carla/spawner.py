@@ -13,15 +13,24 @@ def spawn_vehicle(
     spawn_z: float,
     spawn_yaw: float,
     role_name: str = "ego",
+    blueprint_cache: dict[str, Any] | None = None,
 ) -> Any:
-    """Spawn one vehicle at a fixed transform."""
+    """Spawn one vehicle at a fixed transform.
+
+    `blueprint_cache` maps filters to already resolved blueprints; fetching the
+    blueprint library is a server round trip, so callers spawning repeatedly pass one.
+    """
     carla = require_carla()
 
-    blueprints = world.get_blueprint_library().filter(blueprint_filter)
-    if not blueprints:
-        raise RuntimeError(f"No blueprint matched filter: {blueprint_filter}")
+    blueprint = None if blueprint_cache is None else blueprint_cache.get(blueprint_filter)
+    if blueprint is None:
+        blueprints = world.get_blueprint_library().filter(blueprint_filter)
+        if not blueprints:
+            raise RuntimeError(f"No blueprint matched filter: {blueprint_filter}")
+        blueprint = blueprints[0]
+        if blueprint_cache is not None:
+            blueprint_cache[blueprint_filter] = blueprint
 
-    blueprint = blueprints[0]
     if blueprint.has_attribute("role_name"):
         blueprint.set_attribute("role_name", role_name)
 
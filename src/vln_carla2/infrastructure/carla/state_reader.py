@@ -3,6 +3,7 @@
 import math
 from typing import Any
 
+from vln_carla2.domain.errors import ActorMissingError
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.domain.model.vehicle_state import VehicleState
 from vln_carla2.usecases.control.ports.vehicle_state_reader import VehicleStateReader
@@ -41,7 +42,7 @@ class CarlaVehicleStateReader(VehicleStateReader):
     def _require_vehicle(self, vehicle_id: VehicleId) -> Any:
         actor = self._world.get_actor(vehicle_id.value)
         if actor is None:
-            raise RuntimeError(f"Vehicle actor not found: id={vehicle_id.value}")
+            raise ActorMissingError(f"Vehicle actor not found: id={vehicle_id.value}")
         return actor
 
     def _forbidden_zone_probe_points(
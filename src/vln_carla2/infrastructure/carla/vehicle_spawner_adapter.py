@@ -15,6 +15,7 @@ class CarlaVehicleSpawnerAdapter(VehicleSpawnerPort):
 
     def __init__(self, world: Any) -> None:
         self._world = world
+        self._blueprint_cache: dict[str, Any] = {}
 
     def spawn(self, request: SpawnVehicleRequest) -> VehicleDescriptor:
         actor = spawn_vehicle(
@@ -25,6 +26,7 @@ class CarlaVehicleSpawnerAdapter(VehicleSpawnerPort):
             spawn_z=request.spawn_z,
             spawn_yaw=request.spawn_yaw,
             role_name=request.role_name,
+            blueprint_cache=self._blueprint_cache,
         )
         return to_vehicle_descriptor(
             actor,
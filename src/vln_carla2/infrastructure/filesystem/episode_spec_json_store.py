@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import json
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Mapping, cast
 
+import msgspec
+
 from vln_carla2.domain.model.episode_spec import EpisodeSpec, EpisodeTransform
 
 
@@ -19,7 +22,7 @@ class EpisodeSpecJsonStore:
     def load(self, path: str) -> EpisodeSpec:
         target = Path(path)
         try:
-            payload = json.loads(target.read_text(encoding="utf-8"))
+            payload = json.loads(target.read_bytes())
         except OSError as exc:
             raise RuntimeError(f"failed to read episode spec file: {target}") from exc
         except json.JSONDecodeError as exc:
@@ -27,11 +30,12 @@ class EpisodeSpecJsonStore:
         return self._parse_spec(payload)
 
     def save(self, spec: EpisodeSpec, path: str | None) -> str:
+        self._require_finite_transform(spec.start_transform, "start_transform")
+        self._require_finite_transform(spec.goal_transform, "goal_transform")
         target = Path(path) if path is not None else self.cwd / "episode_spec.json"
         target.parent.mkdir(parents=True, exist_ok=True)
         payload = self._to_payload(spec)
-        text = json.dumps(payload, ensure_ascii=False, indent=2)
-        target.write_text(text + "\n", encoding="utf-8")
+        target.write_bytes(msgspec.json.format(msgspec.json.encode(payload), indent=2) + b"\n")
         return str(target)
 
     def resolve_scene_json_path(
@@ -106,6 +110,17 @@ class EpisodeSpecJsonStore:
         except ValueError as exc:
             raise ValueError(f"episode spec {parent_key}.{key} must be number") from exc
 
+    def _require_finite_transform(self, transform: EpisodeTransform, key: str) -> None:
+        """Reject NaN/inf values, which msgspec would write as null and load() rejects."""
+        isfinite = math.isfinite
+        if not (
+            isfinite(transform.x)
+            and isfinite(transform.y)
+            and isfinite(transform.z)
+            and isfinite(transform.yaw)
+        ):
+            raise ValueError(f"episode spec {key} must be finite: {transform}")
+
     def _to_payload(self, spec: EpisodeSpec) -> dict[str, object]:
         return {
             "schema_version": spec.schema_version,
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import math
+import mmap
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Mapping, cast
+from typing import Any, BinaryIO, Callable, Iterable, Mapping, cast
+
+import msgspec
 
 from vln_carla2.domain.model.scene_template import (
     SceneObject,
@@ -15,6 +19,23 @@ from vln_carla2.domain.model.scene_template import (
     SceneTemplate,
 )
 
+try:
+    import ijson as _ijson  # pyright: ignore[reportMissingTypeStubs]  # type: ignore[import-untyped]
+except ModuleNotFoundError:
+    _ijson = None
+
+_STREAM_THRESHOLD_BYTES = 1 << 20
+_HEADER_KEYS = ("schema_version", "map_name")
+_SCALAR_EVENTS = ("string", "number", "boolean", "null")
+# Objects encoded per write, so peak memory stays bounded for large templates.
+_SAVE_CHUNK_OBJECTS = 1024
+
+
+def _require_ijson() -> Any:
+    if _ijson is None:
+        raise ModuleNotFoundError("ijson package is required for streaming scene template loads.")
+    return _ijson
+
 
 def _default_now() -> datetime:
     return datetime.now()
@@ -26,11 +47,14 @@ class SceneTemplateJsonStore:
 
     now_fn: Callable[[], datetime] = _default_now
     cwd: Path = field(default_factory=Path.cwd)
+    stream_threshold_bytes: int = _STREAM_THRESHOLD_BYTES
 
     def load(self, path: str) -> SceneTemplate:
         target = Path(path)
+        if self._should_stream(target):
+            return self._load_streaming(target)
         try:
-            payload = json.loads(target.read_text(encoding="utf-8"))
+            payload = json.loads(target.read_bytes())
         except OSError as exc:
             raise RuntimeError(f"failed to read scene template file: {target}") from exc
         except json.JSONDecodeError as exc:
@@ -38,15 +62,41 @@ class SceneTemplateJsonStore:
         return self._parse_template(payload)
 
     def save(self, template: SceneTemplate, path: str | None) -> str:
+        self._require_finite_poses(template)
         target = Path(path) if path is not None else self._resolve_default_export_path()
         target.parent.mkdir(parents=True, exist_ok=True)
-        payload = self._to_payload(template)
-        text = json.dumps(payload, ensure_ascii=False, indent=2)
-        target.write_text(text + "\n", encoding="utf-8")
+        with target.open("wb") as fh:
+            self._write_payload(template, fh)
         return str(target)
 
+    def _should_stream(self, target: Path) -> bool:
+        if _ijson is None:
+            return False
+        try:
+            return target.stat().st_size > self.stream_threshold_bytes
+        except OSError:
+            return False
+
+    def _load_streaming(self, target: Path) -> SceneTemplate:
+        """Parse large templates object-by-object straight from the page cache."""
+        ijson = _require_ijson()
+        try:
+            with target.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._parse_template_events(
+                    ijson.parse(mm, use_float=True),
+                    new_builder=ijson.ObjectBuilder,
+                )
+        except OSError as exc:
+            raise RuntimeError(f"failed to read scene template file: {target}") from exc
+        except ijson.JSONError as exc:
+            raise ValueError(f"invalid scene template json: {target}") from exc
+
     def _resolve_default_export_path(self) -> Path:
-        timestamp = self.now_fn().strftime("%Y%m%d_%H%M%S")
+        now = self.now_fn()
+        timestamp = (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
         stem = f"scene_export_{timestamp}"
         candidate = self.cwd / f"{stem}.json"
         if not candidate.exists():
@@ -67,26 +117,80 @@ class SceneTemplateJsonStore:
         raw_schema = payload_dict.get("schema_version")
         raw_map = payload_dict.get("map_name")
         raw_objects = payload_dict.get("objects")
-
-        if type(raw_schema) is not int:
-            raise ValueError("scene template schema_version must be int")
-        if not isinstance(raw_map, str) or not raw_map:
-            raise ValueError("scene template map_name must be non-empty string")
-        if not isinstance(raw_objects, list):
-            raise ValueError("scene template objects must be list")
+        self._validate_header(raw_schema=raw_schema, raw_map=raw_map, raw_objects=raw_objects)
 
         raw_objects_list = cast(list[object], raw_objects)
+        strings: dict[str, str] = {}
         objects: list[SceneObject] = []
         for item in raw_objects_list:
-            objects.append(self._parse_object(item))
+            objects.append(self._parse_object(item, strings))
 
         return SceneTemplate.from_iterable(
-            schema_version=raw_schema,
-            map_name=raw_map,
+            schema_version=cast(int, raw_schema),
+            map_name=cast(str, raw_map),
             objects=objects,
         )
 
-    def _parse_object(self, payload: Any) -> SceneObject:
+    def _parse_template_events(
+        self,
+        events: Iterable[tuple[str, str, Any]],
+        *,
+        new_builder: Callable[[], Any],
+    ) -> SceneTemplate:
+        header: dict[str, object] = {}
+        strings: dict[str, str] = {}
+        objects: list[SceneObject] = []
+        builder: Any = None
+
+        for prefix, event, value in events:
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "objects.item" and event in ("end_map", "end_array"):
+                    objects.append(self._parse_object(builder.value, strings))
+                    builder = None
+            elif prefix == "objects.item" and header.get("objects") is objects:
+                if event in ("start_map", "start_array"):
+                    builder = new_builder()
+                    builder.event(event, value)
+                else:
+                    objects.append(self._parse_object(value, strings))
+            elif prefix == "":
+                if event not in ("start_map", "map_key", "end_map"):
+                    raise ValueError("scene template payload must be object")
+            elif prefix == "objects":
+                if event == "start_array":
+                    header["objects"] = objects
+                elif event not in ("end_array", "end_map", "map_key"):
+                    header["objects"] = value
+            elif prefix in _HEADER_KEYS:
+                if event in _SCALAR_EVENTS:
+                    header[prefix] = value
+                elif event in ("start_map", "start_array"):
+                    header[prefix] = None
+
+        raw_schema = header.get("schema_version")
+        raw_map = header.get("map_name")
+        self._validate_header(
+            raw_schema=raw_schema,
+            raw_map=raw_map,
+            raw_objects=header.get("objects"),
+        )
+        return SceneTemplate.from_iterable(
+            schema_version=cast(int, raw_schema),
+            map_name=cast(str, raw_map),
+            objects=objects,
+        )
+
+    def _validate_header(self, *, raw_schema: object, raw_map: object, raw_objects: object) -> None:
+        if type(raw_schema) is not int:
+            raise ValueError("scene template schema_version must be int")
+        if not isinstance(raw_map, str) or not raw_map:
+            raise ValueError("scene template map_name must be non-empty string")
+        if not isinstance(raw_objects, list):
+            raise ValueError("scene template objects must be list")
+
+    def _parse_object(self, payload: Any, strings: dict[str, str]) -> SceneObject:
+        """Parse one object; `strings` shares equal blueprint/role strings within one load."""
         if not isinstance(payload, dict):
             raise ValueError("scene object must be object")
         payload_dict = cast(dict[str, object], payload)
@@ -105,8 +209,8 @@ class SceneTemplateJsonStore:
 
         return SceneObject(
             kind=kind,
-            blueprint_id=raw_blueprint,
-            role_name=raw_role,
+            blueprint_id=strings.setdefault(raw_blueprint, raw_blueprint),
+            role_name=strings.setdefault(raw_role, raw_role),
             pose=ScenePose(
                 x=self._parse_float_field(payload_dict, "x"),
                 y=self._parse_float_field(payload_dict, "y"),
@@ -126,20 +230,59 @@ class SceneTemplateJsonStore:
         except ValueError as exc:
             raise ValueError(f"scene object {key} must be number") from exc
 
-    def _to_payload(self, template: SceneTemplate) -> dict[str, object]:
-        return {
-            "schema_version": template.schema_version,
-            "map_name": template.map_name,
-            "objects": [self._object_to_payload(obj) for obj in template.objects],
-        }
-
-    def _object_to_payload(self, obj: SceneObject) -> dict[str, object]:
-        return {
-            "kind": obj.kind.value,
-            "blueprint_id": obj.blueprint_id,
-            "role_name": obj.role_name,
-            "x": obj.pose.x,
-            "y": obj.pose.y,
-            "z": obj.pose.z,
-            "yaw": obj.pose.yaw,
-        }
+    def _require_finite_poses(self, template: SceneTemplate) -> None:
+        """Reject NaN/inf poses, which msgspec would write as null and load() rejects."""
+        isfinite = math.isfinite
+        for obj in template.objects:
+            pose = obj.pose
+            if not (
+                isfinite(pose.x) and isfinite(pose.y) and isfinite(pose.z) and isfinite(pose.yaw)
+            ):
+                raise ValueError(
+                    f"scene object pose must be finite: role_name={obj.role_name} pose={pose}"
+                )
+
+    def _write_payload(self, template: SceneTemplate, fh: BinaryIO) -> None:
+        """Write the template as 2-space indented JSON, encoding objects chunk by chunk."""
+        header = msgspec.json.format(
+            msgspec.json.encode(
+                {
+                    "schema_version": template.schema_version,
+                    "map_name": template.map_name,
+                    "objects": [],
+                }
+            ),
+            indent=2,
+        )
+        objects = template.objects
+        if not objects:
+            fh.write(header + b"\n")
+            return
+
+        # The header ends with `"objects": []\n}`; keep everything up to the `[`.
+        fh.write(header[: -len(b"]\n}")])
+        for start in range(0, len(objects), _SAVE_CHUNK_OBJECTS):
+            rows = msgspec.json.format(
+                msgspec.json.encode(
+                    [
+                        {
+                            "kind": obj.kind.value,
+                            "blueprint_id": obj.blueprint_id,
+                            "role_name": obj.role_name,
+                            "x": pose.x,
+                            "y": pose.y,
+                            "z": pose.z,
+                            "yaw": pose.yaw,
+                        }
+                        for obj in objects[start : start + _SAVE_CHUNK_OBJECTS]
+                        for pose in (obj.pose,)
+                    ]
+                ),
+                indent=2,
+            )
+            if start:
+                fh.write(b",")
+            # Drop the chunk's own brackets and indent its rows one level deeper; JSON strings
+            # never contain raw newlines, so every b"\n" here is formatting.
+            fh.write(rows[1:-2].replace(b"\n", b"\n  "))
+        fh.write(b"\n  ]\n}\n")
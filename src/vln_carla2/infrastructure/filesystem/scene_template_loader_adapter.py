@@ -1,11 +1,18 @@
 """Filesystem adapter for exp-input map metadata lookups."""
 
+import os
 from dataclasses import dataclass, field
+from typing import cast
 
 from vln_carla2.infrastructure.filesystem.episode_spec_json_store import EpisodeSpecJsonStore
 from vln_carla2.infrastructure.filesystem.scene_template_json_store import SceneTemplateJsonStore
 from vln_carla2.usecases.cli.ports.scene_template_loader import SceneTemplateLoaderPort
 
+_MAP_NAME_CACHE_SIZE = 32
+
+# (path, st_mtime_ns) for every file the cached map name was read from.
+_FileStamps = tuple[tuple[str, int], ...]
+
 
 @dataclass(slots=True)
 class SceneTemplateLoaderAdapter(SceneTemplateLoaderPort):
@@ -13,14 +20,51 @@ class SceneTemplateLoaderAdapter(SceneTemplateLoaderPort):
 
     store: SceneTemplateJsonStore = field(default_factory=SceneTemplateJsonStore)
     episode_store: EpisodeSpecJsonStore = field(default_factory=EpisodeSpecJsonStore)
+    _map_name_cache: dict[str, tuple[_FileStamps, str]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
 
     def load_map_name(self, path: str) -> str:
+        cached = self._map_name_cache.get(path)
+        if cached is not None and _stamps_are_current(cached[0]):
+            return cached[1]
+
+        stamps: tuple[tuple[str, int] | None, ...] = (_file_stamp(path),)
         try:
-            return self.store.load(path).map_name
+            map_name = self.store.load(path).map_name
         except Exception:
             episode_spec = self.episode_store.load(path)
             scene_json_path = self.episode_store.resolve_scene_json_path(
                 episode_spec=episode_spec,
                 episode_spec_path=path,
             )
-            return self.store.load(scene_json_path).map_name
+            stamps += (_file_stamp(scene_json_path),)
+            map_name = self.store.load(scene_json_path).map_name
+
+        # Inputs that cannot be stat-ed are never cached.
+        if None not in stamps:
+            self._remember(path, cast(_FileStamps, stamps), map_name)
+        return map_name
+
+    def _remember(self, path: str, stamps: _FileStamps, map_name: str) -> None:
+        cache = self._map_name_cache
+        cache.pop(path, None)
+        if len(cache) >= _MAP_NAME_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[path] = (stamps, map_name)
+
+
+def _file_stamp(path: str) -> tuple[str, int] | None:
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stamps_are_current(stamps: _FileStamps) -> bool:
+    try:
+        return all(os.stat(path).st_mtime_ns == mtime_ns for path, mtime_ns in stamps)
+    except OSError:
+        return False
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
 from typing import Literal
 
+import msgspec
+
 from vln_carla2.domain.model.episode_spec import EpisodeTransform
 from vln_carla2.usecases.shared.vehicle_dto import SpawnVehicleRequest
 from vln_carla2.usecases.shared.vehicle_ref import VehicleRefInput
@@ -15,8 +16,9 @@ QualityLevel = Literal["Low", "Epic"]
 TrackingPlanner = Literal["waypoint", "hybrid_forward"]
 
 
-@dataclass(frozen=True, slots=True)
-class SceneRunRequest:
+class RuntimeConnectionParams(msgspec.Struct, frozen=True, gc=False):
+    """CARLA connection and world settings shared by every CLI request."""
+
     host: str
     port: int
     timeout_seconds: float
@@ -24,7 +26,11 @@ class SceneRunRequest:
     mode: RuntimeMode
     fixed_delta_seconds: float
     no_rendering: bool
-    tick_sleep_seconds: float
+
+
+class LaunchParams(msgspec.Struct, frozen=True, gc=False):
+    """Local CARLA server launch options shared by the run requests."""
+
     offscreen: bool
     launch_carla: bool
     reuse_existing_carla: bool
@@ -33,6 +39,12 @@ class SceneRunRequest:
     quality_level: QualityLevel
     with_sound: bool
     keep_carla_server: bool
+
+
+class SceneRunRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
+    launch: LaunchParams
+    tick_sleep_seconds: float
     scene_import: str | None
     scene_export_path: str | None
     export_episode_spec: bool
@@ -41,24 +53,10 @@ class SceneRunRequest:
     tick_log_path: str | None
 
 
-@dataclass(frozen=True, slots=True)
-class OperatorRunRequest:
-    host: str
-    port: int
-    timeout_seconds: float
-    map_name: str
-    mode: RuntimeMode
-    fixed_delta_seconds: float
-    no_rendering: bool
+class OperatorRunRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
+    launch: LaunchParams
     tick_sleep_seconds: float
-    offscreen: bool
-    launch_carla: bool
-    reuse_existing_carla: bool
-    carla_exe: str | None
-    carla_startup_timeout_seconds: float
-    quality_level: QualityLevel
-    with_sound: bool
-    keep_carla_server: bool
     follow: VehicleRefInput
     z: float
     spawn_request: SpawnVehicleRequest
@@ -69,24 +67,10 @@ class OperatorRunRequest:
     operator_warmup_ticks: int
 
 
-@dataclass(frozen=True, slots=True)
-class ExpRunRequest:
-    host: str
-    port: int
-    timeout_seconds: float
-    map_name: str
-    mode: RuntimeMode
-    fixed_delta_seconds: float
-    no_rendering: bool
+class ExpRunRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
+    launch: LaunchParams
     tick_sleep_seconds: float
-    offscreen: bool
-    launch_carla: bool
-    reuse_existing_carla: bool
-    carla_exe: str | None
-    carla_startup_timeout_seconds: float
-    quality_level: QualityLevel
-    with_sound: bool
-    keep_carla_server: bool
     episode_spec: str
     control_target: VehicleRefInput
     forward_distance_m: float
@@ -94,24 +78,10 @@ class ExpRunRequest:
     max_steps: int
 
 
-@dataclass(frozen=True, slots=True)
-class TrackingRunRequest:
-    host: str
-    port: int
-    timeout_seconds: float
-    map_name: str
-    mode: RuntimeMode
-    fixed_delta_seconds: float
-    no_rendering: bool
+class TrackingRunRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
+    launch: LaunchParams
     tick_sleep_seconds: float
-    offscreen: bool
-    launch_carla: bool
-    reuse_existing_carla: bool
-    carla_exe: str | None
-    carla_startup_timeout_seconds: float
-    quality_level: QualityLevel
-    with_sound: bool
-    keep_carla_server: bool
     episode_spec: str
     control_target: VehicleRefInput
     target_speed_mps: float
@@ -149,46 +119,24 @@ class TrackingRunRequest:
     embed_forbidden_zone: bool = False
 
 
-@dataclass(frozen=True, slots=True)
-class VehicleListRequest:
-    host: str
-    port: int
-    timeout_seconds: float
-    map_name: str
-    mode: RuntimeMode
-    fixed_delta_seconds: float
-    no_rendering: bool
+class VehicleListRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
     output_format: Literal["table", "json"]
 
 
-@dataclass(frozen=True, slots=True)
-class VehicleSpawnRequest:
-    host: str
-    port: int
-    timeout_seconds: float
-    map_name: str
-    mode: RuntimeMode
-    fixed_delta_seconds: float
-    no_rendering: bool
+class VehicleSpawnRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
     output_format: Literal["table", "json"]
     spawn_request: SpawnVehicleRequest
 
 
-@dataclass(frozen=True, slots=True)
-class SpectatorFollowRequest:
-    host: str
-    port: int
-    timeout_seconds: float
-    map_name: str
-    mode: RuntimeMode
-    fixed_delta_seconds: float
-    no_rendering: bool
+class SpectatorFollowRequest(msgspec.Struct, frozen=True, gc=False):
+    conn: RuntimeConnectionParams
     follow: VehicleRefInput
     z: float
 
 
-@dataclass(frozen=True, slots=True)
-class LaunchCarlaServerRequest:
+class LaunchCarlaServerRequest(msgspec.Struct, frozen=True, gc=False):
     executable_path: str
     rpc_port: int
     offscreen: bool
@@ -197,21 +145,22 @@ class LaunchCarlaServerRequest:
     quality_level: QualityLevel
 
 
-@dataclass(frozen=True, slots=True)
-class RuntimeSessionRecord:
+class RuntimeSessionRecord(msgspec.Struct, frozen=True, gc=False):
     host: str
     port: int
     offscreen_mode: bool
 
 
-@dataclass(frozen=True, slots=True)
-class LaunchReport:
+class LaunchReport(msgspec.Struct, frozen=True, gc=False):
     reused_existing_server: bool = False
     launched_server_pid: int | None = None
 
 
-@dataclass(frozen=True, slots=True)
-class OperatorWorkflowExecution:
+# LaunchReport is frozen, so every result can share one empty instance.
+_EMPTY_LAUNCH_REPORT = LaunchReport()
+
+
+class OperatorWorkflowExecution(msgspec.Struct, frozen=True, gc=False):
     strategy: WorkflowStrategy
     vehicle_source: str
     actor_id: int
@@ -219,8 +168,7 @@ class OperatorWorkflowExecution:
     control_steps: int
 
 
-@dataclass(frozen=True, slots=True)
-class ExpWorkflowExecution:
+class ExpWorkflowExecution(msgspec.Struct, frozen=True, gc=False):
     control_target: VehicleRefInput
     actor_id: int
     scene_map_name: str
@@ -234,8 +182,7 @@ class ExpWorkflowExecution:
     metrics_path: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
-class TrackingWorkflowExecution:
+class TrackingWorkflowExecution(msgspec.Struct, frozen=True, gc=False):
     control_target: VehicleRefInput
     actor_id: int
     scene_map_name: str
@@ -254,48 +201,43 @@ class TrackingWorkflowExecution:
     camera_frames: int = 0
 
 
-@dataclass(frozen=True, slots=True)
-class SceneRunResult:
+class SceneRunResult(msgspec.Struct, frozen=True, gc=False):
     mode: RuntimeMode
     host: str
     port: int
     interrupted: bool = False
-    launch_report: LaunchReport = field(default_factory=LaunchReport)
+    launch_report: LaunchReport = _EMPTY_LAUNCH_REPORT
     warnings: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True, slots=True)
-class OperatorRunResult:
+class OperatorRunResult(msgspec.Struct, frozen=True, gc=False):
     host: str
     port: int
     execution: OperatorWorkflowExecution | None = None
     interrupted: bool = False
-    launch_report: LaunchReport = field(default_factory=LaunchReport)
+    launch_report: LaunchReport = _EMPTY_LAUNCH_REPORT
     warnings: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True, slots=True)
-class ExpRunResult:
+class ExpRunResult(msgspec.Struct, frozen=True, gc=False):
     host: str
     port: int
     execution: ExpWorkflowExecution | None = None
     interrupted: bool = False
-    launch_report: LaunchReport = field(default_factory=LaunchReport)
+    launch_report: LaunchReport = _EMPTY_LAUNCH_REPORT
     warnings: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True, slots=True)
-class TrackingRunResult:
+class TrackingRunResult(msgspec.Struct, frozen=True, gc=False):
     host: str
     port: int
     execution: TrackingWorkflowExecution | None = None
     interrupted: bool = False
-    launch_report: LaunchReport = field(default_factory=LaunchReport)
+    launch_report: LaunchReport = _EMPTY_LAUNCH_REPORT
     warnings: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True, slots=True)
-class SpectatorFollowResult:
+class SpectatorFollowResult(msgspec.Struct, frozen=True, gc=False):
     mode: RuntimeMode
     host: str
     port: int
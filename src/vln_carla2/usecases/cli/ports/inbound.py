@@ -24,6 +24,8 @@ from vln_carla2.usecases.shared.vehicle_dto import VehicleDescriptor
 class CliApplicationUseCasePort(Protocol):
     """Use cases consumed by the CLI adapter."""
 
+    __slots__ = ()
+
     def run_scene(self, request: SceneRunRequest) -> SceneRunResult:
         ...
 
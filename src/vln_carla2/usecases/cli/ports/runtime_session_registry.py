@@ -10,6 +10,8 @@ from vln_carla2.usecases.cli.dto import RuntimeSessionRecord
 class RuntimeSessionRegistryPort(Protocol):
     """Persist/read runtime session metadata for host:port lookups."""
 
+    __slots__ = ()
+
     def record_session(
         self,
         record: RuntimeSessionRecord,
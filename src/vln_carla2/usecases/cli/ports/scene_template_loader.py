@@ -8,5 +8,7 @@ from typing import Protocol
 class SceneTemplateLoaderPort(Protocol):
     """Loads map metadata from exp input paths used by CLI orchestration."""
 
+    __slots__ = ()
+
     def load_map_name(self, path: str) -> str:
         ...
@@ -10,6 +10,8 @@ from vln_carla2.usecases.cli.dto import LaunchCarlaServerRequest
 class CarlaServerControlPort(Protocol):
     """Abstract local CARLA server process operations."""
 
+    __slots__ = ()
+
     def is_loopback_host(self, host: str) -> bool:
         ...
 
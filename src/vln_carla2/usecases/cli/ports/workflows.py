@@ -23,6 +23,8 @@ from vln_carla2.usecases.shared.vehicle_dto import VehicleDescriptor
 class CliWorkflowPort(Protocol):
     """Facade over app-level composition/wiring execution helpers."""
 
+    __slots__ = ()
+
     def run_scene_workflow(self, request: SceneRunRequest) -> None:
         ...
 
@@ -6,14 +6,17 @@ from dataclasses import dataclass
 from typing import Any
 
 from vln_carla2.usecases.cli.dto import (
+    _EMPTY_LAUNCH_REPORT,
     ExpRunRequest,
     ExpRunResult,
     TrackingRunRequest,
     TrackingRunResult,
     LaunchCarlaServerRequest,
+    LaunchParams,
     LaunchReport,
     OperatorRunRequest,
     OperatorRunResult,
+    RuntimeConnectionParams,
     RuntimeSessionRecord,
     SceneRunRequest,
     SceneRunResult,
@@ -35,14 +38,24 @@ _WARN_NO_RENDERING = (
     "--no-rendering applies world settings, but window visibility depends on existing "
     "CARLA server startup flags."
 )
+# Indexed by (offscreen warning bit) | (no-rendering warning bit << 1).
+_WARNING_TABLE: tuple[tuple[str, ...], ...] = (
+    (),
+    (_WARN_OFFSCREEN,),
+    (_WARN_NO_RENDERING,),
+    (_WARN_OFFSCREEN, _WARN_NO_RENDERING),
+)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class _LaunchDecision:
     launch_report: LaunchReport
     launched_process: Any | None = None
 
 
+_NO_LAUNCH_DECISION = _LaunchDecision(launch_report=_EMPTY_LAUNCH_REPORT)
+
+
 @dataclass(slots=True)
 class CliApplicationService(CliApplicationUseCasePort):
     """Use-case facade consumed by CLI adapter."""
@@ -53,8 +66,8 @@ class CliApplicationService(CliApplicationUseCasePort):
     scene_template_loader: SceneTemplateLoaderPort
 
     def run_scene(self, request: SceneRunRequest) -> SceneRunResult:
-        warnings = self._collect_runtime_warnings(request)
-        launch_decision = self._prepare_launch_if_needed(request)
+        warnings = self._collect_runtime_warnings(request.conn, request.launch)
+        launch_decision = self._prepare_launch_if_needed(request.conn, request.launch)
         interrupted = False
         try:
             self.workflows.run_scene_workflow(request)
@@ -65,24 +78,25 @@ class CliApplicationService(CliApplicationUseCasePort):
         except Exception as exc:
             raise CliRuntimeError(f"runtime failed: {exc}") from exc
         finally:
-            self._cleanup_launch_if_needed(
-                request=request,
+            warnings = self._cleanup_launch_if_needed(
+                conn=request.conn,
+                launch=request.launch,
                 launch_decision=launch_decision,
                 warnings=warnings,
             )
 
         return SceneRunResult(
-            mode=request.mode,
-            host=request.host,
-            port=request.port,
+            mode=request.conn.mode,
+            host=request.conn.host,
+            port=request.conn.port,
             interrupted=interrupted,
             launch_report=launch_decision.launch_report,
-            warnings=tuple(warnings),
+            warnings=warnings,
         )
 
     def run_operator(self, request: OperatorRunRequest) -> OperatorRunResult:
-        warnings = self._collect_runtime_warnings(request)
-        launch_decision = self._prepare_launch_if_needed(request)
+        warnings = self._collect_runtime_warnings(request.conn, request.launch)
+        launch_decision = self._prepare_launch_if_needed(request.conn, request.launch)
         interrupted = False
         execution = None
         try:
@@ -92,31 +106,32 @@ class CliApplicationService(CliApplicationUseCasePort):
         except Exception as exc:
             raise CliRuntimeError(f"operator workflow failed: {exc}") from exc
         finally:
-            self._cleanup_launch_if_needed(
-                request=request,
+            warnings = self._cleanup_launch_if_needed(
+                conn=request.conn,
+                launch=request.launch,
                 launch_decision=launch_decision,
                 warnings=warnings,
             )
 
         return OperatorRunResult(
-            host=request.host,
-            port=request.port,
+            host=request.conn.host,
+            port=request.conn.port,
             execution=execution,
             interrupted=interrupted,
             launch_report=launch_decision.launch_report,
-            warnings=tuple(warnings),
+            warnings=warnings,
         )
 
     def run_exp(self, request: ExpRunRequest) -> ExpRunResult:
-        warnings = self._collect_runtime_warnings(request)
-        launch_decision = _LaunchDecision(launch_report=LaunchReport())
+        warnings = self._collect_runtime_warnings(request.conn, request.launch)
+        launch_decision = _NO_LAUNCH_DECISION
         try:
             # Validate exp input path early so launch map override is deterministic.
             self.scene_template_loader.load_map_name(request.episode_spec)
         except Exception as exc:
             raise CliRuntimeError(f"exp workflow argument validation failed: {exc}") from exc
 
-        launch_decision = self._prepare_launch_if_needed(request)
+        launch_decision = self._prepare_launch_if_needed(request.conn, request.launch)
         interrupted = False
         execution = None
         try:
@@ -126,29 +141,30 @@ class CliApplicationService(CliApplicationUseCasePort):
         except Exception as exc:
             raise CliRuntimeError(f"exp workflow failed: {exc}") from exc
         finally:
-            self._cleanup_launch_if_needed(
-                request=request,
+            warnings = self._cleanup_launch_if_needed(
+                conn=request.conn,
+                launch=request.launch,
                 launch_decision=launch_decision,
                 warnings=warnings,
             )
 
         return ExpRunResult(
-            host=request.host,
-            port=request.port,
+            host=request.conn.host,
+            port=request.conn.port,
             execution=execution,
             interrupted=interrupted,
             launch_report=launch_decision.launch_report,
-            warnings=tuple(warnings),
+            warnings=warnings,
         )
 
     def run_tracking(self, request: TrackingRunRequest) -> TrackingRunResult:
-        warnings = self._collect_runtime_warnings(request)
-        launch_decision = _LaunchDecision(launch_report=LaunchReport())
+        warnings = self._collect_runtime_warnings(request.conn, request.launch)
+        launch_decision = _NO_LAUNCH_DECISION
         if request.target_tick_log_path is not None and request.planner != "waypoint":
             raise CliUsageError("--planner cannot be used with --target-tick-log-path")
         if request.embed_forbidden_zone and request.planner != "hybrid_forward":
             raise CliUsageError("--embed-forbidden-zone requires --planner hybrid_forward")
-        if request.enable_camera_log and request.no_rendering:
+        if request.enable_camera_log and request.conn.no_rendering:
             raise CliUsageError("--enable-camera-log cannot be used with --no-rendering")
         try:
             # Validate input path early so launch map override is deterministic.
@@ -156,7 +172,7 @@ class CliApplicationService(CliApplicationUseCasePort):
         except Exception as exc:
             raise CliRuntimeError(f"tracking workflow argument validation failed: {exc}") from exc
 
-        launch_decision = self._prepare_launch_if_needed(request)
+        launch_decision = self._prepare_launch_if_needed(request.conn, request.launch)
         interrupted = False
         execution = None
         try:
@@ -166,19 +182,20 @@ class CliApplicationService(CliApplicationUseCasePort):
         except Exception as exc:
             raise CliRuntimeError(f"tracking workflow failed: {exc}") from exc
         finally:
-            self._cleanup_launch_if_needed(
-                request=request,
+            warnings = self._cleanup_launch_if_needed(
+                conn=request.conn,
+                launch=request.launch,
                 launch_decision=launch_decision,
                 warnings=warnings,
             )
 
         return TrackingRunResult(
-            host=request.host,
-            port=request.port,
+            host=request.conn.host,
+            port=request.conn.port,
             execution=execution,
             interrupted=interrupted,
             launch_report=launch_decision.launch_report,
-            warnings=tuple(warnings),
+            warnings=warnings,
         )
 
     def list_vehicles(self, request: VehicleListRequest) -> list[VehicleDescriptor]:
@@ -197,9 +214,9 @@ class CliApplicationService(CliApplicationUseCasePort):
         try:
             if self._read_session_offscreen_mode(request):
                 return SpectatorFollowResult(
-                    mode=request.mode,
-                    host=request.host,
-                    port=request.port,
+                    mode=request.conn.mode,
+                    host=request.conn.host,
+                    port=request.conn.port,
                     skipped_offscreen=True,
                 )
         except Exception as exc:
@@ -219,14 +236,17 @@ class CliApplicationService(CliApplicationUseCasePort):
             raise CliRuntimeError(f"spectator follow failed: {exc}") from exc
 
         return SpectatorFollowResult(
-            mode=request.mode,
-            host=request.host,
-            port=request.port,
+            mode=request.conn.mode,
+            host=request.conn.host,
+            port=request.conn.port,
             interrupted=interrupted,
         )
 
     def _read_session_offscreen_mode(self, request: SpectatorFollowRequest) -> bool:
-        offscreen_mode = self.runtime_registry.read_offscreen_mode(request.host, request.port)
+        offscreen_mode = self.runtime_registry.read_offscreen_mode(
+            request.conn.host,
+            request.conn.port,
+        )
         if offscreen_mode is None:
             return False
         return offscreen_mode
@@ -244,62 +264,64 @@ class CliApplicationService(CliApplicationUseCasePort):
 
     def _prepare_launch_if_needed(
         self,
-        request: SceneRunRequest | OperatorRunRequest | ExpRunRequest | TrackingRunRequest,
+        conn: RuntimeConnectionParams,
+        launch: LaunchParams,
     ) -> _LaunchDecision:
-        if not request.launch_carla:
-            return _LaunchDecision(launch_report=LaunchReport())
-        return self._maybe_launch_carla(request)
+        if not launch.launch_carla:
+            return _NO_LAUNCH_DECISION
+        return self._maybe_launch_carla(conn, launch)
 
     def _cleanup_launch_if_needed(
         self,
         *,
-        request: SceneRunRequest | OperatorRunRequest | ExpRunRequest | TrackingRunRequest,
+        conn: RuntimeConnectionParams,
+        launch: LaunchParams,
         launch_decision: _LaunchDecision,
-        warnings: list[str],
-    ) -> None:
+        warnings: tuple[str, ...],
+    ) -> tuple[str, ...]:
         if launch_decision.launched_process is None:
-            return
-        if request.keep_carla_server:
-            return
+            return warnings
+        if launch.keep_carla_server:
+            return warnings
 
         try:
             self.server_control.terminate_server(launch_decision.launched_process)
-            self.runtime_registry.clear_session(request.host, request.port)
+            self.runtime_registry.clear_session(conn.host, conn.port)
         except Exception as exc:
-            warnings.append(f"failed to terminate launched CARLA process: {exc}")
+            return (*warnings, f"failed to terminate launched CARLA process: {exc}")
+        return warnings
 
     def _collect_runtime_warnings(
         self,
-        request: SceneRunRequest | OperatorRunRequest | ExpRunRequest | TrackingRunRequest,
-    ) -> list[str]:
-        warnings: list[str] = []
-        if request.offscreen and not request.launch_carla:
-            warnings.append(_WARN_OFFSCREEN)
-        if request.no_rendering and not request.launch_carla:
-            warnings.append(_WARN_NO_RENDERING)
-        return warnings
+        conn: RuntimeConnectionParams,
+        launch: LaunchParams,
+    ) -> tuple[str, ...]:
+        if launch.launch_carla:
+            return _WARNING_TABLE[0]
+        return _WARNING_TABLE[bool(launch.offscreen) | (bool(conn.no_rendering) << 1)]
 
     def _maybe_launch_carla(
         self,
-        request: SceneRunRequest | OperatorRunRequest | ExpRunRequest | TrackingRunRequest,
+        conn: RuntimeConnectionParams,
+        launch: LaunchParams,
     ) -> _LaunchDecision:
-        if not self.server_control.is_loopback_host(request.host):
+        if not self.server_control.is_loopback_host(conn.host):
             raise CliUsageError(
-                f"--launch-carla only supports local host, got host={request.host}"
+                f"--launch-carla only supports local host, got host={conn.host}"
             )
 
-        if self.server_control.is_server_reachable(request.host, request.port):
-            if not request.reuse_existing_carla:
+        if self.server_control.is_server_reachable(conn.host, conn.port):
+            if not launch.reuse_existing_carla:
                 raise CliUsageError(
                     "CARLA already reachable on "
-                    f"{request.host}:{request.port}. "
+                    f"{conn.host}:{conn.port}. "
                     "Stop existing CARLA or add --reuse-existing-carla."
                 )
             return _LaunchDecision(
                 launch_report=LaunchReport(reused_existing_server=True),
             )
 
-        if not request.carla_exe:
+        if not launch.carla_exe:
             raise CliUsageError(
                 "--carla-exe is required when --launch-carla is set "
                 "(or set CARLA_UE4_EXE)"
@@ -309,26 +331,26 @@ class CliApplicationService(CliApplicationUseCasePort):
         try:
             launched_process = self.server_control.launch_server(
                 LaunchCarlaServerRequest(
-                    executable_path=request.carla_exe,
-                    rpc_port=request.port,
-                    offscreen=request.offscreen,
-                    no_rendering=request.no_rendering,
-                    no_sound=not request.with_sound,
-                    quality_level=request.quality_level,
+                    executable_path=launch.carla_exe,
+                    rpc_port=conn.port,
+                    offscreen=launch.offscreen,
+                    no_rendering=conn.no_rendering,
+                    no_sound=not launch.with_sound,
+                    quality_level=launch.quality_level,
                 )
             )
             self.server_control.wait_until_ready(
-                host=request.host,
-                port=request.port,
-                timeout_seconds=request.carla_startup_timeout_seconds,
+                host=conn.host,
+                port=conn.port,
+                timeout_seconds=launch.carla_startup_timeout_seconds,
                 process=launched_process,
             )
             owner_pid = self.server_control.process_pid(launched_process)
             self.runtime_registry.record_session(
                 RuntimeSessionRecord(
-                    host=request.host,
-                    port=request.port,
-                    offscreen_mode=bool(request.offscreen),
+                    host=conn.host,
+                    port=conn.port,
+                    offscreen_mode=bool(launch.offscreen),
                 ),
                 owner_pid=owner_pid,
             )
@@ -6,8 +6,11 @@ from typing import Protocol
 class Logger(Protocol):
     """Minimal logging API for use cases."""
 
-    def info(self, message: str) -> None:
-        """Log info message."""
+    def is_info_enabled(self) -> bool:
+        """Return whether info messages are emitted."""
+
+    def info(self, message: str, *args: object) -> None:
+        """Log info message, %-formatting it with args only when emitted."""
 
     def warn(self, message: str) -> None:
         """Log warning message."""
@@ -11,6 +11,9 @@ from vln_carla2.usecases.control.ports.logger import Logger
 from vln_carla2.usecases.control.ports.motion_actuator import MotionActuator
 from vln_carla2.usecases.control.ports.vehicle_state_reader import VehicleStateReader
 
+_STEP_LOG_TEMPLATE = "step=%d frame=%d speed_mps=%.3f throttle=%.3f brake=%.3f"
+_STOP_LOG_TEMPLATE = "step=%d stop_before_apply=true speed_mps=%.3f frame=%d"
+
 
 class SpeedController(Protocol):
     """Protocol for speed controller implementations."""
@@ -52,43 +55,50 @@ class RunControlLoop:
         if max_steps <= 0:
             raise ValueError("max_steps must be > 0")
 
-        speed_samples: list[float] = []
+        log_info_on = self.logger.is_info_enabled()
+        speed_sum = 0.0
         last_speed_mps = 0.0
         last_frame = -1
         executed_steps = 0
+        logger_info = self.logger.info
+        read = self.state_reader.read
+        compute = self.controller.compute
+        apply = self.motion_actuator.apply
+        tick = self.clock.tick
 
         for step in range(1, max_steps + 1):
             if before_step is not None:
                 before_step(step)
-            state = self.state_reader.read(vehicle_id)
+            state = read(vehicle_id)
             if on_state is not None:
                 on_state(state)
             if stop_before_apply is not None and stop_before_apply(step, state):
-                self.logger.info(
-                    "step="
-                    f"{step} stop_before_apply=true speed_mps={state.speed_mps:.3f} "
-                    f"frame={state.frame}"
-                )
+                if log_info_on:
+                    logger_info(
+                        _STOP_LOG_TEMPLATE,
+                        step,
+                        state.speed_mps,
+                        state.frame,
+                    )
                 break
-            command = self.controller.compute(state, target)
-            self.motion_actuator.apply(vehicle_id, command)
-            frame = self.clock.tick()
-
-            self.logger.info(
-                "step="
-                f"{step} frame={frame} speed_mps={state.speed_mps:.3f} "
-                f"throttle={command.throttle:.3f} brake={command.brake:.3f}"
-            )
+            command = compute(state, target)
+            apply(vehicle_id, command)
+            frame = tick()
+
+            if log_info_on:
+                logger_info(
+                    _STEP_LOG_TEMPLATE,
+                    step,
+                    frame,
+                    state.speed_mps,
+                    command.throttle,
+                    command.brake,
+                )
 
-            speed_samples.append(state.speed_mps)
+            speed_sum += state.speed_mps
             last_speed_mps = state.speed_mps
             last_frame = frame
             executed_steps += 1
 
-        avg_speed_mps = sum(speed_samples) / len(speed_samples) if speed_samples else 0.0
-        return LoopResult(
-            executed_steps=executed_steps,
-            last_speed_mps=last_speed_mps,
-            avg_speed_mps=avg_speed_mps,
-            last_frame=last_frame,
-        )
+        avg_speed_mps = speed_sum / executed_steps if executed_steps else 0.0
+        return LoopResult(executed_steps, last_speed_mps, avg_speed_mps, last_frame)
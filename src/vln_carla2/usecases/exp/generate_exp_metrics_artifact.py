@@ -29,6 +29,13 @@ class ExpMetricsRequest:
     def __post_init__(self) -> None:
         if not self.episode_spec_path or not self.episode_spec_path.strip():
             raise ValueError("episode_spec_path must not be empty")
+        if (
+            type(self.final_x) is float
+            and type(self.final_y) is float
+            and type(self.goal_x) is float
+            and type(self.goal_y) is float
+        ):
+            return
         object.__setattr__(self, "final_x", float(self.final_x))
         object.__setattr__(self, "final_y", float(self.final_y))
         object.__setattr__(self, "goal_x", float(self.goal_x))
@@ -80,9 +87,13 @@ class GenerateExpMetricsArtifact:
         )
 
     def _resolve_output_path(self, *, episode_spec_path: str) -> Path:
-        run_id = self.now_fn().strftime("%Y%m%d_%H%M%S")
+        now = self.now_fn()
+        run_id = (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
         episode_dir = self._resolve_episode_dir_name(episode_spec_path=episode_spec_path)
-        return self.runs_root / run_id / "results" / episode_dir / self.metrics_filename
+        return Path(self.runs_root, run_id, "results", episode_dir, self.metrics_filename)
 
     def _resolve_episode_dir_name(self, *, episode_spec_path: str) -> str:
         episode_spec = Path(episode_spec_path)
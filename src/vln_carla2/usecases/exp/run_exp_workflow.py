@@ -10,7 +10,7 @@ from vln_carla2.domain.model.forbidden_zone import ForbiddenZone
 from vln_carla2.domain.model.simple_command import TargetSpeedCommand
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.domain.model.vehicle_state import VehicleState
-from vln_carla2.domain.services.forbidden_zone_rules import has_entered_forbidden_zone
+from vln_carla2.domain.services.forbidden_zone_rules import is_vehicle_state_in_forbidden_zone
 from vln_carla2.usecases.control.api import LoopResult, RunControlLoop
 
 
@@ -52,27 +52,39 @@ class ExpWorkflowResult:
 
 @dataclass(slots=True)
 class RunExpWorkflow:
-    """Run forward-motion demo and evaluate forbidden-zone entry from motion log."""
+    """Run forward-motion demo and track forbidden-zone entry per sampled state."""
 
     control_loop: RunControlLoop
     follow_vehicle_topdown: FollowVehicleProtocol
 
     def run(self, request: ExpWorkflowRequest) -> ExpWorkflowResult:
         target = TargetSpeedCommand(request.target_speed_mps)
-        motion_log: list[VehicleState] = []
-        start_xy: tuple[float, float] | None = None
+        forward_distance_sq = request.forward_distance_m * request.forward_distance_m
+        forbidden_zone = request.forbidden_zone
+        start_x = 0.0
+        start_y = 0.0
+        start_set = False
+        last_state: VehicleState | None = None
+        sample_count = 0
+        zone_entered = False
 
         def _on_state(state: VehicleState) -> None:
-            nonlocal start_xy
-            motion_log.append(state)
-            if start_xy is None:
-                start_xy = (state.x, state.y)
+            nonlocal start_x, start_y, start_set, last_state, sample_count, zone_entered
+            last_state = state
+            sample_count += 1
+            if not zone_entered:
+                zone_entered = is_vehicle_state_in_forbidden_zone(state=state, zone=forbidden_zone)
+            if not start_set:
+                start_x = state.x
+                start_y = state.y
+                start_set = True
 
         def _stop_before_apply(_step: int, state: VehicleState) -> bool:
-            if start_xy is None:
+            if not start_set:
                 return False
-            traveled = _distance_xy(start_xy[0], start_xy[1], state.x, state.y)
-            return traveled >= request.forward_distance_m
+            dx = state.x - start_x
+            dy = state.y - start_y
+            return dx * dx + dy * dy >= forward_distance_sq
 
         def _before_step(_step: int) -> None:
             if not self.follow_vehicle_topdown.follow_once():
@@ -88,24 +100,13 @@ class RunExpWorkflow:
             on_state=_on_state,
             stop_before_apply=_stop_before_apply,
         )
-        if not motion_log:
+        if last_state is None:
             raise RuntimeError("no vehicle states were sampled during exp workflow")
-        if start_xy is None:  # pragma: no cover - start_xy always set with non-empty log
-            raise RuntimeError("internal error: missing start position")
-
-        last_state = motion_log[-1]
-        traveled_distance_m = _distance_xy(start_xy[0], start_xy[1], last_state.x, last_state.y)
-        entered_forbidden_zone = has_entered_forbidden_zone(
-            motion_log,
-            request.forbidden_zone,
-        )
+
+        traveled_distance_m = math.hypot(last_state.x - start_x, last_state.y - start_y)
         return ExpWorkflowResult(
             control_loop_result=control_loop_result,
-            sampled_states=len(motion_log),
+            sampled_states=sample_count,
             traveled_distance_m=traveled_distance_m,
-            entered_forbidden_zone=entered_forbidden_zone,
+            entered_forbidden_zone=zone_entered,
         )
-
-
-def _distance_xy(x1: float, y1: float, x2: float, y2: float) -> float:
-    return math.hypot(x2 - x1, y2 - y1)
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Callable
 
 from vln_carla2.usecases.runtime.ports.follow_vehicle import FollowVehicleProtocol
 from vln_carla2.usecases.runtime.ports.keyboard_input import KeyboardInputProtocol
 from vln_carla2.usecases.runtime.ports.move_spectator import MoveSpectatorProtocol
 
+_SLEEP_SLICE_SECONDS = 0.001
+_SLEEP_SLICE_NS = 1_000_000
+# Upper bound on the spin tail; slower slices are recorded as this so one
+# outlier cannot turn every later wait into a busy spin.
+_MAX_SPIN_NS = 2_000_000
+# Power of two so the ring index wraps with a mask.
+_SLEEP_HISTORY_SIZE = 64
+
 
 @dataclass(slots=True)
 class RunOperatorLoop:
@@ -20,6 +28,9 @@ class RunOperatorLoop:
     1) keyboard free move
     2) follow override attempt
     3) tick / wait_for_tick
+
+    `run` sleeps between iterations before polling input, so each tick applies
+    the freshest keyboard snapshot.
     """
 
     world: Any
@@ -28,6 +39,52 @@ class RunOperatorLoop:
     keyboard_input: KeyboardInputProtocol | None = None
     move_spectator: MoveSpectatorProtocol | None = None
     follow_vehicle_topdown: FollowVehicleProtocol | None = None
+    # Observed durations of recent 1 ms sleeps, seeded with the nominal slice.
+    _sleep_history: list[int] = field(
+        default_factory=lambda: [_SLEEP_SLICE_NS] * _SLEEP_HISTORY_SIZE,
+        init=False,
+        repr=False,
+    )
+    _sleep_history_index: int = field(default=0, init=False, repr=False)
+    _worst_sleep_ns: int = field(default=_SLEEP_SLICE_NS, init=False, repr=False)
+    # Per-iteration handlers resolved once from the optional collaborators above.
+    _handlers: tuple[Callable[[], object], ...] = field(default=(), init=False, repr=False)
+    # Tick call for the configured mode, bound once so ticking needs no mode branch.
+    _tick_impl: Callable[[], int] = field(init=False, repr=False)
+    # `sleep_seconds` as integer nanoseconds for perf_counter_ns deadline math.
+    _sleep_ns: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._sleep_ns = round(self.sleep_seconds * 1e9)
+
+        handlers: list[Callable[[], object]] = []
+        keyboard_input = self.keyboard_input
+        move_spectator = self.move_spectator
+        if keyboard_input is not None and move_spectator is not None:
+            read_snapshot = keyboard_input.read_snapshot
+            move = move_spectator.move
+
+            def _move_from_keyboard() -> None:
+                move(snapshot=read_snapshot())
+
+            handlers.append(_move_from_keyboard)
+        if self.follow_vehicle_topdown is not None:
+            handlers.append(self.follow_vehicle_topdown.follow_once)
+        self._handlers = tuple(handlers)
+
+        if self.synchronous_mode:
+            world_tick = self.world.tick
+
+            def _tick() -> int:
+                return int(world_tick())
+
+        else:
+            wait_for_tick = self.world.wait_for_tick
+
+            def _tick() -> int:
+                return int(wait_for_tick().frame)
+
+        self._tick_impl = _tick
 
     def step(self, *, with_tick: bool = True, with_sleep: bool = True) -> int | None:
         """
@@ -35,46 +92,67 @@ class RunOperatorLoop:
 
         Returns tick frame when `with_tick=True`, otherwise returns None.
         """
-        self._handle_keyboard_once()
-        self._handle_follow_once()
+        for handler in self._handlers:
+            handler()
 
         if not with_tick:
             return None
 
-        frame = self._tick_once()
+        frame = self._tick_impl()
         if self.synchronous_mode and with_sleep:
-            time.sleep(self.sleep_seconds)
+            self._sleep(self._sleep_ns)
         return frame
 
+    def step_input(self, _step: int) -> None:
+        """Run one input iteration without tick/sleep; usable as a control-loop hook."""
+        for handler in self._handlers:
+            handler()
+
     def run(self, *, max_ticks: int | None = None) -> int:
         """Run until interrupted or until max_ticks is reached."""
+        synchronous_mode = self.synchronous_mode
+        sleep_ns = self._sleep_ns
+        sleep = self._sleep
+        tick = self._tick_impl
+        handlers = self._handlers
         executed_ticks = 0
-        running = True
-
-        while running:
-            if max_ticks is not None and executed_ticks >= max_ticks:
-                break
 
-            self.step(with_tick=True, with_sleep=True)
+        while max_ticks is None or executed_ticks < max_ticks:
+            if executed_ticks and synchronous_mode:
+                sleep(sleep_ns)
+            for handler in handlers:
+                handler()
+            tick()
             executed_ticks += 1
 
         return executed_ticks
 
-    def _tick_once(self) -> int:
-        if self.synchronous_mode:
-            return int(self.world.tick())
-
-        snapshot = self.world.wait_for_tick()
-        return int(snapshot.frame)
-
-    def _handle_keyboard_once(self) -> None:
-        if self.keyboard_input is None or self.move_spectator is None:
-            return
-        snapshot = self.keyboard_input.read_snapshot()
-        self.move_spectator.move(snapshot=snapshot)
-
-    def _handle_follow_once(self) -> None:
-        if self.follow_vehicle_topdown is None:
-            return
-        self.follow_vehicle_topdown.follow_once()
+    def _sleep(self, duration_ns: int) -> None:
+        """Sleep for `duration_ns` without overshooting by the OS timer resolution.
 
+        Sleeps in 1 ms slices while the remaining time exceeds the worst recently
+        observed slice (capped at `_MAX_SPIN_NS`), then spins on the performance
+        counter for the rest.
+        """
+        perf_counter_ns = time.perf_counter_ns
+        now_ns = perf_counter_ns()
+        deadline_ns = now_ns + duration_ns
+        history = self._sleep_history
+        mask = _SLEEP_HISTORY_SIZE - 1
+
+        while deadline_ns - now_ns > self._worst_sleep_ns:
+            time.sleep(_SLEEP_SLICE_SECONDS)
+            after_ns = perf_counter_ns()
+            observed_ns = min(after_ns - now_ns, _MAX_SPIN_NS)
+            index = self._sleep_history_index
+            evicted_ns = history[index]
+            history[index] = observed_ns
+            self._sleep_history_index = (index + 1) & mask
+            if observed_ns >= self._worst_sleep_ns:
+                self._worst_sleep_ns = observed_ns
+            elif evicted_ns == self._worst_sleep_ns:
+                self._worst_sleep_ns = max(history)
+            now_ns = after_ns
+
+        while perf_counter_ns() < deadline_ns:
+            pass
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Literal
+from typing import Callable, Literal, get_args
 
 from vln_carla2.domain.model.simple_command import TargetSpeedCommand
 from vln_carla2.domain.model.vehicle_id import VehicleId
@@ -17,6 +17,8 @@ from vln_carla2.usecases.runtime.spawn_vehicle import SpawnVehicle
 OperatorWorkflowStrategy = Literal["serial", "parallel"]
 VehicleAcquireSource = Literal["resolved", "spawned"]
 
+OPERATOR_WORKFLOW_STRATEGIES: frozenset[str] = frozenset(get_args(OperatorWorkflowStrategy))
+
 
 @dataclass(frozen=True, slots=True)
 class OperatorWorkflowRequest:
@@ -31,7 +33,7 @@ class OperatorWorkflowRequest:
     operator_warmup_ticks: int = 1
 
     def __post_init__(self) -> None:
-        if self.strategy not in {"serial", "parallel"}:
+        if self.strategy not in OPERATOR_WORKFLOW_STRATEGIES:
             raise ValueError("strategy must be 'serial' or 'parallel'")
         if self.target_speed_mps < 0:
             raise ValueError("target_speed_mps must be >= 0")
@@ -80,18 +82,14 @@ class RunOperatorWorkflow:
                 max_steps=request.steps,
             )
         else:
-
-            def _before_step(_step: int) -> None:
-                nonlocal operator_ticks
-                operator_runtime.step(with_tick=False, with_sleep=False)
-                operator_ticks += 1
-
             control_result = control_loop.run(
                 vehicle_id=vehicle_id,
                 target=target,
                 max_steps=request.steps,
-                before_step=_before_step,
+                before_step=operator_runtime.step_input,
             )
+            # Without stop_before_apply, before_step runs exactly once per executed step.
+            operator_ticks = control_result.executed_steps
 
         return OperatorWorkflowResult(
             selected_vehicle=selected_vehicle,
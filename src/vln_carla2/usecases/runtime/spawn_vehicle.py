@@ -1,6 +1,7 @@
 """Use case for spawning one vehicle actor."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable
 
 from vln_carla2.usecases.runtime.ports.vehicle_dto import SpawnVehicleRequest, VehicleDescriptor
 from vln_carla2.usecases.runtime.ports.vehicle_spawner import VehicleSpawnerPort
@@ -11,7 +12,12 @@ class SpawnVehicle:
     """Spawn one vehicle and return the created descriptor."""
 
     spawner: VehicleSpawnerPort
+    # Bound straight to spawner.spawn; the use case adds no logic of its own.
+    run: Callable[[SpawnVehicleRequest], VehicleDescriptor] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
-    def run(self, request: SpawnVehicleRequest) -> VehicleDescriptor:
-        return self.spawner.spawn(request)
-
+    def __post_init__(self) -> None:
+        self.run = self.spawner.spawn
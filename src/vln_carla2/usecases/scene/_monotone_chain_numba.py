@@ -0,0 +1,63 @@
+"""Andrew's monotone chain hull kernel, optionally Numba-compiled."""
+
+from __future__ import annotations
+
+from typing import Callable, MutableSequence, Sequence
+
+try:
+    import numba as _numba
+except ModuleNotFoundError:
+    _numba = None
+
+
+def monotone_chain_kernel(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    hull: MutableSequence[int],
+) -> int:
+    """Write counter-clockwise hull indices of sorted points into `hull`; return their count.
+
+    Points must be unique and in lexicographic (x, y) order, and `hull` must hold
+    2 * len(xs) entries. Plain lists keep the interpreted path fast; NumPy arrays
+    are what the compiled `monotone_chain_jit` takes.
+    """
+    n = len(xs)
+    top = 0
+
+    for index in range(n):
+        x = xs[index]
+        y = ys[index]
+        while top >= 2:
+            origin = hull[top - 2]
+            last = hull[top - 1]
+            ox = xs[origin]
+            oy = ys[origin]
+            if (xs[last] - ox) * (y - oy) - (ys[last] - oy) * (x - ox) > 0.0:
+                break
+            top -= 1
+        hull[top] = index
+        top += 1
+
+    lower_top = top + 1
+    for index in range(n - 2, -1, -1):
+        x = xs[index]
+        y = ys[index]
+        while top >= lower_top:
+            origin = hull[top - 2]
+            last = hull[top - 1]
+            ox = xs[origin]
+            oy = ys[origin]
+            if (xs[last] - ox) * (y - oy) - (ys[last] - oy) * (x - ox) > 0.0:
+                break
+            top -= 1
+        hull[top] = index
+        top += 1
+
+    # The upper chain ends on the first point again.
+    return top - 1
+
+
+# fastmath stays off (the njit default) so cross-product signs match the Python path.
+monotone_chain_jit: Callable[..., int] | None = (
+    None if _numba is None else _numba.njit(cache=True)(monotone_chain_kernel)
+)
@@ -5,11 +5,20 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable
 
+import numpy as np
+
 from vln_carla2.domain.model.forbidden_zone import ForbiddenZone
 from vln_carla2.domain.model.point2d import Point2D
 from vln_carla2.domain.ports.obstacle_points_to_forbidden_zone import (
     ObstaclePointsToForbiddenZonePort,
 )
+from vln_carla2.usecases.scene._monotone_chain_numba import (
+    monotone_chain_jit,
+    monotone_chain_kernel,
+)
+
+# Below this size the JIT call overhead outweighs the compiled loop.
+_JIT_MIN_POINTS = 64
 
 
 @dataclass(slots=True)
@@ -17,34 +26,45 @@ class AndrewMonotoneChainForbiddenZoneBuilder(ObstaclePointsToForbiddenZonePort)
     """Construct convex polygon hull from obstacle points."""
 
     def build(self, obstacle_points: Iterable[Point2D]) -> ForbiddenZone:
-        points = self._normalize_points(obstacle_points)
-        if len(points) < 3:
-            raise ValueError("at least 3 unique obstacle points are required")
+        return self._build_from_normalized(self._normalize_points(obstacle_points))
 
-        lower: list[Point2D] = []
-        for point in points:
-            while len(lower) >= 2 and _cross(lower[-2], lower[-1], point) <= 0.0:
-                lower.pop()
-            lower.append(point)
+    def build_from_array(self, xy: np.ndarray) -> ForbiddenZone:
+        return self._build_from_normalized(_normalize_xy(xy))
 
-        upper: list[Point2D] = []
-        for point in reversed(points):
-            while len(upper) >= 2 and _cross(upper[-2], upper[-1], point) <= 0.0:
-                upper.pop()
-            upper.append(point)
+    def _build_from_normalized(self, xy: np.ndarray) -> ForbiddenZone:
+        if len(xy) < 3:
+            raise ValueError("at least 3 unique obstacle points are required")
 
-        hull = lower[:-1] + upper[:-1]
+        hull: list[int] | np.ndarray
+        if monotone_chain_jit is not None and len(xy) >= _JIT_MIN_POINTS:
+            hull = np.empty(2 * len(xy), dtype=np.int64)
+            size = monotone_chain_jit(
+                np.ascontiguousarray(xy[:, 0]),
+                np.ascontiguousarray(xy[:, 1]),
+                hull,
+            )
+        else:
+            hull = [0] * (2 * len(xy))
+            size = monotone_chain_kernel(xy[:, 0].tolist(), xy[:, 1].tolist(), hull)
+        hull = hull[:size]
         if len(hull) < 3:
             raise ValueError("obstacle points are collinear; forbidden zone area is zero")
 
-        return ForbiddenZone(vertices=tuple(hull))
+        vertices = xy[hull].tolist()
+        return ForbiddenZone(vertices=tuple(Point2D(x=x, y=y) for x, y in vertices))
 
-    def _normalize_points(self, points: Iterable[Point2D]) -> list[Point2D]:
+    def _normalize_points(self, points: Iterable[Point2D]) -> np.ndarray:
         unique = {(float(point.x), float(point.y)) for point in points}
-        return [Point2D(x=x, y=y) for x, y in sorted(unique)]
+        return np.array(sorted(unique), dtype=np.float64).reshape(-1, 2)
 
 
-def _cross(origin: Point2D, point_a: Point2D, point_b: Point2D) -> float:
-    return (point_a.x - origin.x) * (point_b.y - origin.y) - (
-        point_a.y - origin.y
-    ) * (point_b.x - origin.x)
+def _normalize_xy(xy: np.ndarray) -> np.ndarray:
+    """Return unique rows of an (N, 2) array in lexicographic (x, y) order."""
+    xy = np.asarray(xy, dtype=np.float64)
+    if xy.ndim != 2 or xy.shape[1] != 2:
+        raise ValueError("obstacle point array must have shape (N, 2)")
+    xy = xy[np.lexsort((xy[:, 1], xy[:, 0]))]
+    keep = np.empty(len(xy), dtype=bool)
+    keep[:1] = True
+    np.any(xy[1:] != xy[:-1], axis=1, out=keep[1:])
+    return xy[keep]
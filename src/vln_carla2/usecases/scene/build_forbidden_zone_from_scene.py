@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from vln_carla2.domain.model.forbidden_zone import ForbiddenZone
-from vln_carla2.domain.model.point2d import Point2D
 from vln_carla2.domain.model.scene_template import SceneObjectKind
 from vln_carla2.domain.ports.obstacle_points_to_forbidden_zone import (
     ObstaclePointsToForbiddenZonePort,
@@ -16,6 +17,8 @@ from vln_carla2.domain.services.scene_template_rules import (
 )
 from vln_carla2.usecases.scene.ports.scene_template_loader import SceneTemplateLoaderPort
 
+_XY_DTYPE = np.dtype((np.float64, 2))
+
 
 @dataclass(slots=True)
 class BuildForbiddenZoneFromScene:
@@ -34,12 +37,12 @@ class BuildForbiddenZoneFromScene:
                 template_map_name=template.map_name,
             )
 
-        obstacle_points = [
-            Point2D(x=obj.pose.x, y=obj.pose.y)
-            for obj in template.objects
-            if obj.kind == SceneObjectKind.BARREL
-        ]
-        if not obstacle_points:
+        barrel = SceneObjectKind.BARREL
+        obstacle_xy = np.fromiter(
+            ((obj.pose.x, obj.pose.y) for obj in template.objects if obj.kind == barrel),
+            dtype=_XY_DTYPE,
+        )
+        if not len(obstacle_xy):
             raise ValueError("scene template contains no barrel objects")
-        return self.zone_builder.build(obstacle_points)
+        return self.zone_builder.build_from_array(obstacle_xy)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Sequence
 
 from vln_carla2.domain.model.episode_spec import (
     EPISODE_SPEC_SCHEMA_V1,
@@ -52,37 +53,41 @@ class ExportSceneTemplate:
         if self.episode_spec_store is None:
             raise RuntimeError("episode spec export is unavailable in current runtime.")
 
-        spec_path = self._resolve_episode_spec_export_path(
-            scene_path=scene_path,
+        scene_file = Path(scene_path)
+        spec_file = self._resolve_episode_spec_export_path(
+            scene_file=scene_file,
             explicit_scene_path=save_path is not None,
         )
         episode_spec = self._build_episode_spec(
             objects=objects,
-            scene_path=scene_path,
-            spec_path=spec_path,
+            scene_file=scene_file,
+            spec_file=spec_file,
         )
-        self.episode_spec_store.save(episode_spec, spec_path)
+        self.episode_spec_store.save(episode_spec, os.fspath(spec_file))
         return scene_path
 
     def _build_episode_spec(
         self,
         *,
-        objects: list[SceneObject],
-        scene_path: str,
-        spec_path: str,
+        objects: Sequence[SceneObject],
+        scene_file: Path,
+        spec_file: Path,
     ) -> EpisodeSpec:
+        # Bucket only the roles the spec needs, so objects are scanned once.
+        by_role: dict[str, list[SceneObject]] = {"ego": [], "goal": []}
+        for obj in objects:
+            matches = by_role.get(obj.role_name)
+            if matches is not None:
+                matches.append(obj)
         ego = self._pick_unique_object(
-            objects=objects,
+            candidates=by_role["ego"],
             role_name="ego",
         )
         goal = self._pick_unique_object(
-            objects=objects,
+            candidates=by_role["goal"],
             role_name="goal",
             kind=SceneObjectKind.GOAL_VEHICLE,
         )
-        scene_file = Path(scene_path)
-        spec_file = Path(spec_path)
-
         scene_json_path = self._scene_path_relative_to_spec(
             scene_file=scene_file,
             spec_file=spec_file,
@@ -112,44 +117,48 @@ class ExportSceneTemplate:
     def _pick_unique_object(
         self,
         *,
-        objects: list[SceneObject],
+        candidates: list[SceneObject],
         role_name: str,
         kind: SceneObjectKind | None = None,
     ) -> SceneObject:
-        candidates = [
-            obj
-            for obj in objects
-            if obj.role_name == role_name and (kind is None or obj.kind is kind)
-        ]
-        if len(candidates) != 1:
+        found: SceneObject | None = None
+        count = 0
+        for obj in candidates:
+            if kind is None or obj.kind is kind:
+                if found is None:
+                    found = obj
+                count += 1
+        if found is None or count != 1:
             if kind is None:
                 raise ValueError(
                     f"episode spec export requires exactly one role '{role_name}', "
-                    f"got {len(candidates)}"
+                    f"got {count}"
                 )
             raise ValueError(
                 "episode spec export requires exactly one goal object "
-                f"(role='goal' kind='{kind.value}'), got {len(candidates)}"
+                f"(role='goal' kind='{kind.value}'), got {count}"
             )
-        return candidates[0]
+        return found
 
     def _resolve_episode_spec_export_path(
         self,
         *,
-        scene_path: str,
+        scene_file: Path,
         explicit_scene_path: bool,
-    ) -> str:
-        scene_file = Path(scene_path)
+    ) -> Path:
         if explicit_scene_path:
-            return str(scene_file.parent / "episode_spec.json")
+            return scene_file.parent / "episode_spec.json"
         if self.episode_spec_export_dir is not None and self.episode_spec_export_dir.strip():
-            return str(Path(self.episode_spec_export_dir) / "episode_spec.json")
-        return str(scene_file.parent / "episode_spec.json")
+            return Path(self.episode_spec_export_dir) / "episode_spec.json"
+        return scene_file.parent / "episode_spec.json"
 
     def _scene_path_relative_to_spec(self, *, scene_file: Path, spec_file: Path) -> str:
+        spec_dir = spec_file.parent
+        # The common export layout keeps both files in one directory.
+        if scene_file.parent == spec_dir:
+            return scene_file.name
         try:
-            rel_path = os.path.relpath(scene_file, start=spec_file.parent)
+            return os.path.relpath(scene_file, start=spec_dir)
         except ValueError:
             return str(scene_file)
-        return str(Path(rel_path))
 
@@ -9,13 +9,16 @@ from vln_carla2.domain.services.scene_template_rules import (
     assert_map_matches,
     assert_supported_schema,
 )
-from vln_carla2.usecases.scene.ports.scene_object_spawner import SceneObjectSpawnerPort
+from vln_carla2.usecases.scene.ports.scene_object_spawner import (
+    SceneObjectBatchSpawnerPort,
+    SceneObjectSpawnerPort,
+)
 from vln_carla2.usecases.scene.ports.scene_template_store import SceneTemplateStorePort
 
 
 @dataclass(slots=True)
 class ImportSceneTemplate:
-    """Load scene template and spawn objects sequentially."""
+    """Load scene template and spawn its objects, batched when the spawner supports it."""
 
     store: SceneTemplateStorePort
     spawner: SceneObjectSpawnerPort
@@ -29,12 +32,16 @@ class ImportSceneTemplate:
             template_map_name=template.map_name,
         )
 
-        imported = 0
-        for obj in template.objects:
-            # Goal markers are exported for episode metadata only, not spawned into CARLA.
-            if obj.kind is SceneObjectKind.GOAL_VEHICLE:
-                continue
-            self.spawner.spawn(obj)
-            imported += 1
-        return imported
+        # Goal markers are exported for episode metadata only, not spawned into CARLA.
+        spawnable = [
+            obj for obj in template.objects if obj.kind is not SceneObjectKind.GOAL_VEHICLE
+        ]
+        spawner = self.spawner
+        if isinstance(spawner, SceneObjectBatchSpawnerPort):
+            return spawner.spawn_batch(spawnable)
+
+        spawn = spawner.spawn
+        for obj in spawnable:
+            spawn(obj)
+        return len(spawnable)
 
@@ -21,18 +21,14 @@ class EditorInputSnapshot:
     pressed_spawn_goal: bool = False
     pressed_export_scene: bool = False
 
+    @property
+    def any_spawn_pressed(self) -> bool:
+        return self.pressed_spawn_vehicle or self.pressed_spawn_barrel or self.pressed_spawn_goal
+
     @classmethod
     def zero(cls) -> "EditorInputSnapshot":
-        return cls(
-            held_dx=0.0,
-            held_dy=0.0,
-            held_dz=0.0,
-            held_throttle=0.0,
-            held_brake=0.0,
-            held_steer=0.0,
-            pressed_toggle_mode=False,
-            pressed_spawn_vehicle=False,
-            pressed_spawn_barrel=False,
-            pressed_spawn_goal=False,
-            pressed_export_scene=False,
-        )
+        return _ZERO_SNAPSHOT
+
+
+# Frozen, so one all-zero instance can be shared by every idle tick.
+_ZERO_SNAPSHOT = EditorInputSnapshot()
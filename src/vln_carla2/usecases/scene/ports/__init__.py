@@ -2,11 +2,12 @@
 
 from .episode_spec_store import EpisodeSpecStorePort
 from .scene_object_recorder import SceneObjectRecorderPort
-from .scene_object_spawner import SceneObjectSpawnerPort
+from .scene_object_spawner import SceneObjectBatchSpawnerPort, SceneObjectSpawnerPort
 from .scene_template_store import SceneTemplateStorePort
 
 __all__ = [
     "EpisodeSpecStorePort",
+    "SceneObjectBatchSpawnerPort",
     "SceneObjectRecorderPort",
     "SceneObjectSpawnerPort",
     "SceneTemplateStorePort",
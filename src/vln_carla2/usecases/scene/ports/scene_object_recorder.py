@@ -1,6 +1,6 @@
 """Port for recording exported scene objects."""
 
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from vln_carla2.domain.model.scene_template import SceneObject
 
@@ -11,5 +11,5 @@ class SceneObjectRecorderPort(Protocol):
     def record(self, obj: SceneObject) -> None:
         ...
 
-    def snapshot(self) -> list[SceneObject]:
+    def snapshot(self) -> Sequence[SceneObject]:
         ...
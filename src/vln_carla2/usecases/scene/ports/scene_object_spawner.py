@@ -1,6 +1,6 @@
 """Port for spawning one scene-template object."""
 
-from typing import Protocol
+from typing import Protocol, Sequence, runtime_checkable
 
 from vln_carla2.domain.model.scene_template import SceneObject
 
@@ -10,3 +10,12 @@ class SceneObjectSpawnerPort(Protocol):
 
     def spawn(self, obj: SceneObject) -> None:
         ...
+
+
+@runtime_checkable
+class SceneObjectBatchSpawnerPort(SceneObjectSpawnerPort, Protocol):
+    """Spawner that can also submit many scene objects in one round trip."""
+
+    def spawn_batch(self, objs: Sequence[SceneObject]) -> int:
+        """Spawn all objects and return how many were spawned."""
+        ...
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 from vln_carla2.domain.model.scene_template import SceneObject
 from vln_carla2.usecases.scene.ports.scene_object_recorder import (
@@ -19,13 +20,21 @@ class RecordSpawnedSceneObject(SceneObjectRecorderPort):
     """In-memory recorder for scene objects spawned in current session."""
 
     _objects: list[SceneObject] = field(default_factory=_new_scene_object_list)
+    _append: Callable[[SceneObject], None] = field(init=False, repr=False)
+    # Recording is append-only, so the length tells whether the cached snapshot is stale.
+    _snapshot: tuple[SceneObject, ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._append = self._objects.append
 
     def run(self, obj: SceneObject) -> None:
-        self._objects.append(obj)
+        self._append(obj)
 
     def record(self, obj: SceneObject) -> None:
-        self.run(obj)
+        self._append(obj)
 
-    def snapshot(self) -> list[SceneObject]:
-        return list(self._objects)
+    def snapshot(self) -> tuple[SceneObject, ...]:
+        if len(self._snapshot) != len(self._objects):
+            self._snapshot = tuple(self._objects)
+        return self._snapshot
 
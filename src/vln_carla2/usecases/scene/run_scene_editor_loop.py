@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Callable, Protocol
 
-from vln_carla2.domain.services.spectator_rules import clamp_z
 from vln_carla2.usecases.scene.input_snapshot import EditorInputSnapshot
 from vln_carla2.usecases.scene.models import EditorMode, EditorState
 from vln_carla2.usecases.shared.input_snapshot import InputSnapshot
@@ -104,11 +104,39 @@ class RunSceneEditorLoop:
         default=False,
         repr=False,
     )
+    # Follow-height clamp specialized to the configured bounds.
+    _clamp_follow_z: Callable[[float], float] = field(init=False, repr=False)
+    # (pressed-flag getter, action) per spawn hotkey, in dispatch order. Actions for ports
+    # missing at construction only report that the hotkey is unavailable.
+    _spawn_table: tuple[
+        tuple[Callable[[EditorInputSnapshot], bool], Callable[[], None]],
+        ...,
+    ] = field(init=False, default=(), repr=False)
+    _export_action: Callable[[], None] = field(init=False, repr=False)
+    _move: Callable[[InputSnapshot], None] | None = field(init=False, default=None, repr=False)
 
     def __post_init__(self) -> None:
         if self.max_follow_z < self.min_follow_z:
             raise ValueError("max_follow_z must be >= min_follow_z")
+        self._clamp_follow_z = _make_clamp(self.min_follow_z, self.max_follow_z)
         self.state.follow_z = self._clamp_follow_z(self.state.follow_z)
+        self._spawn_table = (
+            (
+                attrgetter("pressed_spawn_vehicle"),
+                self._spawn_action(self.spawn_vehicle_at_spectator_xy, "vehicle"),
+            ),
+            (
+                attrgetter("pressed_spawn_barrel"),
+                self._spawn_action(self.spawn_barrel_at_spectator_xy, "barrel"),
+            ),
+            (
+                attrgetter("pressed_spawn_goal"),
+                self._spawn_action(self.spawn_goal_at_spectator_xy, "goal"),
+            ),
+        )
+        self._export_action = self._make_export_action()
+        if self.move_spectator is not None:
+            self._move = self.move_spectator.move
 
     def step(self, *, with_tick: bool = True, with_sleep: bool = True) -> int | None:
         """Execute one scene editor iteration and optionally tick/sleep."""
@@ -171,10 +199,11 @@ class RunSceneEditorLoop:
         self.state.mode = EditorMode.FOLLOW
 
     def _handle_free_mode(self, input_snapshot: EditorInputSnapshot) -> None:
-        if self.move_spectator is None:
+        move = self._move
+        if move is None:
             return
-        self.move_spectator.move(
-            snapshot=InputSnapshot(
+        move(
+            InputSnapshot(
                 dx=input_snapshot.held_dx,
                 dy=input_snapshot.held_dy,
                 dz=input_snapshot.held_dz,
@@ -193,47 +222,58 @@ class RunSceneEditorLoop:
             self._warned_missing_follow_runtime = False
 
     def _handle_spawn_hotkeys(self, input_snapshot: EditorInputSnapshot) -> None:
-        if not self.allow_spawn_vehicle_hotkey:
+        if not self.allow_spawn_vehicle_hotkey or not input_snapshot.any_spawn_pressed:
             return
 
-        if input_snapshot.pressed_spawn_vehicle:
-            if self.spawn_vehicle_at_spectator_xy is None:
-                self._error("spawn vehicle hotkey is unavailable in current runtime.")
-            else:
-                try:
-                    self.spawn_vehicle_at_spectator_xy.run()
-                except Exception as exc:
-                    self._error(f"spawn vehicle failed: {exc}")
-
-        if input_snapshot.pressed_spawn_barrel:
-            if self.spawn_barrel_at_spectator_xy is None:
-                self._error("spawn barrel hotkey is unavailable in current runtime.")
-            else:
-                try:
-                    self.spawn_barrel_at_spectator_xy.run()
-                except Exception as exc:
-                    self._error(f"spawn barrel failed: {exc}")
-
-        if input_snapshot.pressed_spawn_goal:
-            if self.spawn_goal_at_spectator_xy is None:
-                self._error("spawn goal hotkey is unavailable in current runtime.")
-            else:
-                try:
-                    self.spawn_goal_at_spectator_xy.run()
-                except Exception as exc:
-                    self._error(f"spawn goal failed: {exc}")
+        for is_pressed, action in self._spawn_table:
+            if is_pressed(input_snapshot):
+                action()
 
     def _handle_export_hotkey(self, input_snapshot: EditorInputSnapshot) -> None:
-        if not input_snapshot.pressed_export_scene:
-            return
-        if self.export_scene is None:
-            self._error("scene export hotkey is unavailable in current runtime.")
-            return
-        try:
-            path = self.export_scene.run()
-            self._info(f"scene exported: {path}")
-        except Exception as exc:
-            self._error(f"scene export failed: {exc}")
+        if input_snapshot.pressed_export_scene:
+            self._export_action()
+
+    def _spawn_action(
+        self,
+        spawner: SceneEditorSpawnVehicleProtocol | None,
+        label: str,
+    ) -> Callable[[], None]:
+        if spawner is None:
+
+            def _unavailable() -> None:
+                self._error(f"spawn {label} hotkey is unavailable in current runtime.")
+
+            return _unavailable
+
+        run = spawner.run
+
+        def _spawn() -> None:
+            try:
+                run()
+            except Exception as exc:
+                self._error(f"spawn {label} failed: {exc}")
+
+        return _spawn
+
+    def _make_export_action(self) -> Callable[[], None]:
+        export_scene = self.export_scene
+        if export_scene is None:
+
+            def _unavailable() -> None:
+                self._error("scene export hotkey is unavailable in current runtime.")
+
+            return _unavailable
+
+        run = export_scene.run
+
+        def _export() -> None:
+            try:
+                path = run()
+                self._info(f"scene exported: {path}")
+            except Exception as exc:
+                self._error(f"scene export failed: {exc}")
+
+        return _export
 
     def _handle_manual_control(self, input_snapshot: EditorInputSnapshot) -> None:
         active = self._manual_control_active(input_snapshot)
@@ -270,9 +310,6 @@ class RunSceneEditorLoop:
         self._warn("follow mode active but follow target is unavailable.")
         self._warned_missing_follow_runtime = True
 
-    def _clamp_follow_z(self, value: float) -> float:
-        return clamp_z(value, self.min_follow_z, self.max_follow_z)
-
     def _tick_once(self) -> int:
         if self.synchronous_mode:
             return int(self.world.tick())
@@ -290,3 +327,14 @@ class RunSceneEditorLoop:
         self.error_fn(f"[ERROR] {message}")
 
 
+def _make_clamp(min_z: float, max_z: float) -> Callable[[float], float]:
+    """Return a clamp to [min_z, max_z] with the bounds bound as closure cells."""
+
+    def _clamp(z: float) -> float:
+        if z < min_z:
+            return min_z
+        if z > max_z:
+            return max_z
+        return z
+
+    return _clamp
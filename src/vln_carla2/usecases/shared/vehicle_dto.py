@@ -15,7 +15,8 @@ class VehicleDescriptor:
     z: float
 
     def __post_init__(self) -> None:
-        if type(self.actor_id) is not int or self.actor_id <= 0:
+        actor_id = self.actor_id
+        if type(actor_id) is not int or actor_id <= 0:
             raise ValueError("VehicleDescriptor.actor_id must be positive int")
         if not self.type_id:
             raise ValueError("VehicleDescriptor.type_id must not be empty")
@@ -0,0 +1,51 @@
+"""Optional Numba-compiled kernel for the per-step route searches."""
+
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+import numpy as np
+
+try:
+    import numba as _numba
+except ModuleNotFoundError:
+    _numba = None
+
+
+def route_search_kernel(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    arc_m: np.ndarray,
+    x: float,
+    y: float,
+    start_index: int,
+    lookahead_distance_m: float,
+    arc_slack_m: float,
+) -> tuple[int, int]:
+    """Return (nearest index, lookahead index) for one vehicle position."""
+    n = xs.shape[0]
+    nearest = min(max(start_index, 0), n - 1)
+    best = math.inf
+    for index in range(nearest, n):
+        dx = xs[index] - x
+        dy = ys[index] - y
+        distance_sq = dx * dx + dy * dy
+        if distance_sq < best:
+            best = distance_sq
+            nearest = index
+
+    threshold = arc_m[nearest] + lookahead_distance_m - math.sqrt(best) - arc_slack_m
+    start = max(nearest, int(np.searchsorted(arc_m, threshold)))
+    lookahead_sq = lookahead_distance_m * lookahead_distance_m
+    for index in range(start, n):
+        dx = xs[index] - x
+        dy = ys[index] - y
+        if dx * dx + dy * dy >= lookahead_sq:
+            return nearest, index
+    return nearest, n - 1
+
+
+route_search_jit: Callable[..., tuple[int, int]] | None = (
+    None if _numba is None else _numba.njit(cache=True)(route_search_kernel)
+)
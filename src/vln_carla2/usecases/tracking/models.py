@@ -14,6 +14,8 @@ class RoutePoint:
     yaw_deg: float
 
     def __post_init__(self) -> None:
+        if type(self.x) is float and type(self.y) is float and type(self.yaw_deg) is float:
+            return
         object.__setattr__(self, "x", float(self.x))
         object.__setattr__(self, "y", float(self.y))
         object.__setattr__(self, "yaw_deg", float(self.yaw_deg))
@@ -28,6 +30,8 @@ class TrackingGoal:
     yaw_deg: float
 
     def __post_init__(self) -> None:
+        if type(self.x) is float and type(self.y) is float and type(self.yaw_deg) is float:
+            return
         object.__setattr__(self, "x", float(self.x))
         object.__setattr__(self, "y", float(self.y))
         object.__setattr__(self, "yaw_deg", float(self.yaw_deg))
@@ -62,44 +66,27 @@ class TrackingConfig:
     no_progress_min_improvement_m: float = 0.1
 
     def __post_init__(self) -> None:
-        if self.target_speed_mps < 0.0:
-            raise ValueError("target_speed_mps must be >= 0")
-        if self.max_steps <= 0:
-            raise ValueError("max_steps must be > 0")
-        if self.dt_seconds <= 0.0:
-            raise ValueError("dt_seconds must be > 0")
-        if self.route_step_m <= 0.0:
-            raise ValueError("route_step_m must be > 0")
-        if self.route_max_points <= 0:
-            raise ValueError("route_max_points must be > 0")
-        if self.lookahead_min_m <= 0.0:
-            raise ValueError("lookahead_min_m must be > 0")
-        if self.lookahead_max_m < self.lookahead_min_m:
-            raise ValueError("lookahead_max_m must be >= lookahead_min_m")
-        if self.lookahead_base_m < 0.0:
-            raise ValueError("lookahead_base_m must be >= 0")
-        if self.wheelbase_m <= 0.0:
-            raise ValueError("wheelbase_m must be > 0")
-        if self.max_steer_angle_deg <= 0.0:
-            raise ValueError("max_steer_angle_deg must be > 0")
-        if not 0.0 <= self.max_throttle <= 1.0:
-            raise ValueError("max_throttle must be in [0, 1]")
-        if not 0.0 <= self.max_brake <= 1.0:
-            raise ValueError("max_brake must be in [0, 1]")
-        if self.goal_distance_tolerance_m <= 0.0:
-            raise ValueError("goal_distance_tolerance_m must be > 0")
-        if not 0.0 <= self.goal_yaw_tolerance_deg <= 180.0:
-            raise ValueError("goal_yaw_tolerance_deg must be in [0, 180]")
-        if self.slowdown_distance_m <= 0.0:
-            raise ValueError("slowdown_distance_m must be > 0")
-        if not 0.0 <= self.min_slow_speed_mps <= self.target_speed_mps:
-            raise ValueError("min_slow_speed_mps must be in [0, target_speed_mps]")
-        if self.steer_rate_limit_per_step <= 0.0:
-            raise ValueError("steer_rate_limit_per_step must be > 0")
-        if self.no_progress_max_steps <= 0:
-            raise ValueError("no_progress_max_steps must be > 0")
-        if self.no_progress_min_improvement_m <= 0.0:
-            raise ValueError("no_progress_min_improvement_m must be > 0")
+        validate_tracking_fields(
+            target_speed_mps=self.target_speed_mps,
+            max_steps=self.max_steps,
+            dt_seconds=self.dt_seconds,
+            route_step_m=self.route_step_m,
+            route_max_points=self.route_max_points,
+            lookahead_base_m=self.lookahead_base_m,
+            lookahead_min_m=self.lookahead_min_m,
+            lookahead_max_m=self.lookahead_max_m,
+            wheelbase_m=self.wheelbase_m,
+            max_steer_angle_deg=self.max_steer_angle_deg,
+            max_throttle=self.max_throttle,
+            max_brake=self.max_brake,
+            goal_distance_tolerance_m=self.goal_distance_tolerance_m,
+            goal_yaw_tolerance_deg=self.goal_yaw_tolerance_deg,
+            slowdown_distance_m=self.slowdown_distance_m,
+            min_slow_speed_mps=self.min_slow_speed_mps,
+            steer_rate_limit_per_step=self.steer_rate_limit_per_step,
+            no_progress_max_steps=self.no_progress_max_steps,
+            no_progress_min_improvement_m=self.no_progress_min_improvement_m,
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -126,6 +113,24 @@ class TrackingStepTrace:
     def __post_init__(self) -> None:
         if self.step <= 0:
             raise ValueError("step must be > 0")
+        if (
+            type(self.frame) is int
+            and type(self.actual_x) is float
+            and type(self.actual_y) is float
+            and type(self.actual_yaw_deg) is float
+            and type(self.actual_speed_mps) is float
+            and type(self.target_x) is float
+            and type(self.target_y) is float
+            and type(self.target_yaw_deg) is float
+            and type(self.distance_to_goal_m) is float
+            and type(self.yaw_error_deg) is float
+            and type(self.target_speed_mps) is float
+            and type(self.lookahead_distance_m) is float
+            and type(self.throttle) is float
+            and type(self.brake) is float
+            and type(self.steer) is float
+        ):
+            return
         object.__setattr__(self, "frame", int(self.frame))
         object.__setattr__(self, "actual_x", float(self.actual_x))
         object.__setattr__(self, "actual_y", float(self.actual_y))
@@ -141,3 +146,66 @@ class TrackingStepTrace:
         object.__setattr__(self, "throttle", float(self.throttle))
         object.__setattr__(self, "brake", float(self.brake))
         object.__setattr__(self, "steer", float(self.steer))
+
+
+def validate_tracking_fields(
+    *,
+    target_speed_mps: float,
+    max_steps: int,
+    dt_seconds: float,
+    route_step_m: float,
+    route_max_points: int,
+    lookahead_base_m: float,
+    lookahead_min_m: float,
+    lookahead_max_m: float,
+    wheelbase_m: float,
+    max_steer_angle_deg: float,
+    max_throttle: float,
+    max_brake: float,
+    goal_distance_tolerance_m: float,
+    goal_yaw_tolerance_deg: float,
+    slowdown_distance_m: float,
+    min_slow_speed_mps: float,
+    steer_rate_limit_per_step: float,
+    no_progress_max_steps: int,
+    no_progress_min_improvement_m: float,
+) -> None:
+    """Raise ValueError for out-of-range tracking configuration values."""
+    if target_speed_mps < 0.0:
+        raise ValueError("target_speed_mps must be >= 0")
+    if max_steps <= 0:
+        raise ValueError("max_steps must be > 0")
+    if dt_seconds <= 0.0:
+        raise ValueError("dt_seconds must be > 0")
+    if route_step_m <= 0.0:
+        raise ValueError("route_step_m must be > 0")
+    if route_max_points <= 0:
+        raise ValueError("route_max_points must be > 0")
+    if lookahead_min_m <= 0.0:
+        raise ValueError("lookahead_min_m must be > 0")
+    if lookahead_max_m < lookahead_min_m:
+        raise ValueError("lookahead_max_m must be >= lookahead_min_m")
+    if lookahead_base_m < 0.0:
+        raise ValueError("lookahead_base_m must be >= 0")
+    if wheelbase_m <= 0.0:
+        raise ValueError("wheelbase_m must be > 0")
+    if max_steer_angle_deg <= 0.0:
+        raise ValueError("max_steer_angle_deg must be > 0")
+    if not 0.0 <= max_throttle <= 1.0:
+        raise ValueError("max_throttle must be in [0, 1]")
+    if not 0.0 <= max_brake <= 1.0:
+        raise ValueError("max_brake must be in [0, 1]")
+    if goal_distance_tolerance_m <= 0.0:
+        raise ValueError("goal_distance_tolerance_m must be > 0")
+    if not 0.0 <= goal_yaw_tolerance_deg <= 180.0:
+        raise ValueError("goal_yaw_tolerance_deg must be in [0, 180]")
+    if slowdown_distance_m <= 0.0:
+        raise ValueError("slowdown_distance_m must be > 0")
+    if not 0.0 <= min_slow_speed_mps <= target_speed_mps:
+        raise ValueError("min_slow_speed_mps must be in [0, target_speed_mps]")
+    if steer_rate_limit_per_step <= 0.0:
+        raise ValueError("steer_rate_limit_per_step must be > 0")
+    if no_progress_max_steps <= 0:
+        raise ValueError("no_progress_max_steps must be > 0")
+    if no_progress_min_improvement_m <= 0.0:
+        raise ValueError("no_progress_min_improvement_m must be > 0")
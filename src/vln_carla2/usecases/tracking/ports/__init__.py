@@ -2,13 +2,14 @@
 
 from .clock import Clock
 from .logger import Logger
-from .motion_actuator import MotionActuator
+from .motion_actuator import MotionActuator, RawMotionActuator
 from .route_planner import RoutePlannerPort
 from .vehicle_state_reader import VehicleStateReader
 
 __all__ = [
     "VehicleStateReader",
     "MotionActuator",
+    "RawMotionActuator",
     "Clock",
     "Logger",
     "RoutePlannerPort",
@@ -6,12 +6,14 @@ from typing import Protocol
 class Logger(Protocol):
     """Minimal logger API."""
 
-    def info(self, message: str) -> None:
-        ...
+    def is_info_enabled(self) -> bool:
+        """Return whether info messages are emitted."""
+
+    def info(self, message: str, *args: object) -> None:
+        """Log info message, %-formatting it with args only when emitted."""
 
     def warn(self, message: str) -> None:
         ...
 
     def error(self, message: str) -> None:
         ...
-
@@ -1,6 +1,6 @@
 """Motion actuator port for tracking use case."""
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 from vln_carla2.domain.model.simple_command import ControlCommand
 from vln_carla2.domain.model.vehicle_id import VehicleId
@@ -10,5 +10,14 @@ class MotionActuator(Protocol):
     """Applies one control command to tracked vehicle."""
 
     def apply(self, vehicle_id: VehicleId, command: ControlCommand) -> None:
+        """Raise ActorMissingError when the vehicle actor no longer exists."""
         ...
 
+
+@runtime_checkable
+class RawMotionActuator(MotionActuator, Protocol):
+    """Actuator that can also take control values without a ControlCommand."""
+
+    def apply_raw(self, vehicle_id: VehicleId, throttle: float, brake: float, steer: float) -> None:
+        """Apply already-clamped values; same errors as apply()."""
+        ...
@@ -10,5 +10,6 @@ class VehicleStateReader(Protocol):
     """Reads domain vehicle state for one tracked vehicle."""
 
     def read(self, vehicle_id: VehicleId) -> VehicleState:
+        """Raise ActorMissingError when the vehicle actor no longer exists."""
         ...
 
@@ -4,25 +4,39 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Sequence
 
+import numpy as np
+
+from vln_carla2.domain.errors import ActorMissingError
 from vln_carla2.domain.model.simple_command import ControlCommand
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.domain.model.vehicle_state import VehicleState
 from vln_carla2.domain.services.longitudinal_pid_controller import LongitudinalPidController
 from vln_carla2.domain.services.pure_pursuit_controller import PurePursuitController
+from vln_carla2.usecases.tracking._route_search_numba import route_search_jit
 from vln_carla2.usecases.tracking.models import (
     RoutePoint,
     TrackingConfig,
     TrackingGoal,
     TrackingStepTrace,
+    validate_tracking_fields,
 )
 from vln_carla2.usecases.tracking.ports.clock import Clock
 from vln_carla2.usecases.tracking.ports.logger import Logger
-from vln_carla2.usecases.tracking.ports.motion_actuator import MotionActuator
+from vln_carla2.usecases.tracking.ports.motion_actuator import MotionActuator, RawMotionActuator
 from vln_carla2.usecases.tracking.ports.route_planner import RoutePlannerPort
 from vln_carla2.usecases.tracking.ports.vehicle_state_reader import VehicleStateReader
 
+_STEP_LOG_TEMPLATE = (
+    "step=%d frame=%d speed_mps=%.3f target_speed_mps=%.3f dist_goal_m=%.3f "
+    "lookahead_m=%.3f steer=%.3f throttle=%.3f brake=%.3f"
+)
+_GOAL_LOG_TEMPLATE = "step=%d goal_reached=true dist_goal_m=%.3f yaw_error_deg=%.3f"
+
+# Absorbs cumsum rounding so the arc-length skip never passes a qualifying point.
+_ARC_SKIP_SLACK_M = 1e-6
+
 TerminationReason = Literal[
     "goal_reached",
     "max_steps",
@@ -65,22 +79,17 @@ class TrackingRequest:
     no_progress_min_improvement_m: float = 0.1
 
     def __post_init__(self) -> None:
-        # Reuse TrackingConfig validation as the source of truth for config fields.
-        TrackingConfig(
+        validate_tracking_fields(
             target_speed_mps=self.target_speed_mps,
             max_steps=self.max_steps,
             dt_seconds=self.dt_seconds,
             route_step_m=self.route_step_m,
             route_max_points=self.route_max_points,
             lookahead_base_m=self.lookahead_base_m,
-            lookahead_speed_gain=self.lookahead_speed_gain,
             lookahead_min_m=self.lookahead_min_m,
             lookahead_max_m=self.lookahead_max_m,
             wheelbase_m=self.wheelbase_m,
             max_steer_angle_deg=self.max_steer_angle_deg,
-            pid_kp=self.pid_kp,
-            pid_ki=self.pid_ki,
-            pid_kd=self.pid_kd,
             max_throttle=self.max_throttle,
             max_brake=self.max_brake,
             goal_distance_tolerance_m=self.goal_distance_tolerance_m,
@@ -128,19 +137,17 @@ class RunTrackingLoop:
 
         try:
             initial_state = self.state_reader.read(request.vehicle_id)
-        except RuntimeError as exc:
-            if _is_actor_missing_error(exc):
-                return _terminal_result(
-                    executed_steps=0,
-                    last_frame=-1,
-                    reached_goal=False,
-                    reason="actor_missing",
-                    state=None,
-                    goal=goal,
-                    route_points=(),
-                    step_traces=tuple(step_traces),
-                )
-            raise
+        except ActorMissingError:
+            return _terminal_result(
+                executed_steps=0,
+                last_frame=-1,
+                reached_goal=False,
+                reason="actor_missing",
+                state=None,
+                goal=goal,
+                route_points=(),
+                step_traces=tuple(step_traces),
+            )
 
         try:
             raw_route_points = self.route_planner.plan_route(
@@ -164,10 +171,7 @@ class RunTrackingLoop:
                 step_traces=tuple(step_traces),
             )
 
-        route_points = tuple(
-            RoutePoint(x=float(point.x), y=float(point.y), yaw_deg=float(point.yaw_deg))
-            for point in raw_route_points
-        )
+        route_points = _route_points(raw_route_points)
         if not route_points:
             self.logger.error("route planner returned empty route")
             return _terminal_result(
@@ -181,6 +185,7 @@ class RunTrackingLoop:
                 step_traces=tuple(step_traces),
             )
 
+        route = _route_arrays(route_points)
         longitudinal = LongitudinalPidController(
             kp=config.pid_kp,
             ki=config.pid_ki,
@@ -203,45 +208,74 @@ class RunTrackingLoop:
             y2=goal.y,
         )
         no_progress_steps = 0
+        log_info_on = self.logger.is_info_enabled()
+
+        # Run-constant values, read once instead of per step.
+        goal_x = goal.x
+        goal_y = goal.y
+        goal_yaw_deg = goal.yaw_deg
+        goal_distance_tolerance_m = config.goal_distance_tolerance_m
+        goal_yaw_tolerance_deg = config.goal_yaw_tolerance_deg
+        no_progress_max_steps = config.no_progress_max_steps
+        no_progress_min_improvement_m = config.no_progress_min_improvement_m
+        lookahead_base_m = config.lookahead_base_m
+        lookahead_speed_gain = config.lookahead_speed_gain
+        lookahead_min_m = config.lookahead_min_m
+        lookahead_max_m = config.lookahead_max_m
+        steer_rate_limit = config.steer_rate_limit_per_step
+        cruise_speed_mps = config.target_speed_mps
+        min_slow_speed_mps = config.min_slow_speed_mps
+        slowdown_distance_m = config.slowdown_distance_m
+        slowdown_speed_span_mps = cruise_speed_mps - min_slow_speed_mps
+        dt_seconds = config.dt_seconds
+        max_throttle = config.max_throttle
+        max_brake = config.max_brake
+        # Actuators implementing RawMotionActuator skip the per-step ControlCommand.
+        motion_actuator = self.motion_actuator
+        apply_raw = (
+            motion_actuator.apply_raw if isinstance(motion_actuator, RawMotionActuator) else None
+        )
+        vehicle_id = request.vehicle_id
+        read = self.state_reader.read
+        apply = motion_actuator.apply
+        tick = self.clock.tick
+        logger_info = self.logger.info
+        compute_steer = lateral.compute_steer
+        compute_acceleration = longitudinal.compute
+        append_trace = step_traces.append
 
         for step in range(1, config.max_steps + 1):
             try:
-                state = self.state_reader.read(request.vehicle_id)
-            except RuntimeError as exc:
-                if _is_actor_missing_error(exc):
-                    return _terminal_result(
-                        executed_steps=executed_steps,
-                        last_frame=last_frame,
-                        reached_goal=False,
-                        reason="actor_missing",
-                        state=last_state,
-                        goal=goal,
-                        route_points=route_points,
-                        step_traces=tuple(step_traces),
-                    )
-                raise
+                state = read(vehicle_id)
+            except ActorMissingError:
+                return _terminal_result(
+                    executed_steps=executed_steps,
+                    last_frame=last_frame,
+                    reached_goal=False,
+                    reason="actor_missing",
+                    state=last_state,
+                    goal=goal,
+                    route_points=route_points,
+                    step_traces=tuple(step_traces),
+                )
 
             last_state = state
-            distance_to_goal = _distance_xy(
-                x1=state.x,
-                y1=state.y,
-                x2=goal.x,
-                y2=goal.y,
-            )
-            yaw_error_deg = _absolute_yaw_error_deg(
-                yaw_deg=state.yaw_deg,
-                target_yaw_deg=goal.yaw_deg,
-            )
+            # Per-step math is inlined below; the helpers at module level are
+            # the reference forms used outside the loop.
+            distance_to_goal = math.hypot(goal_x - state.x, goal_y - state.y)
+            yaw_error_deg = abs((goal_yaw_deg - state.yaw_deg + 180.0) % 360.0 - 180.0)
 
             if (
-                distance_to_goal <= config.goal_distance_tolerance_m
-                and yaw_error_deg <= config.goal_yaw_tolerance_deg
+                distance_to_goal <= goal_distance_tolerance_m
+                and yaw_error_deg <= goal_yaw_tolerance_deg
             ):
-                self.logger.info(
-                    "step="
-                    f"{step} goal_reached=true dist_goal_m={distance_to_goal:.3f} "
-                    f"yaw_error_deg={yaw_error_deg:.3f}"
-                )
+                if log_info_on:
+                    logger_info(
+                        _GOAL_LOG_TEMPLATE,
+                        step,
+                        distance_to_goal,
+                        yaw_error_deg,
+                    )
                 return _terminal_result(
                     executed_steps=executed_steps,
                     last_frame=last_frame,
@@ -253,16 +287,16 @@ class RunTrackingLoop:
                     step_traces=tuple(step_traces),
                 )
 
-            if best_distance_to_goal - distance_to_goal >= config.no_progress_min_improvement_m:
+            if best_distance_to_goal - distance_to_goal >= no_progress_min_improvement_m:
                 best_distance_to_goal = distance_to_goal
                 no_progress_steps = 0
             else:
                 no_progress_steps += 1
-                if no_progress_steps >= config.no_progress_max_steps:
+                if no_progress_steps >= no_progress_max_steps:
                     self.logger.warn(
                         "step="
                         f"{step} no_progress=true dist_goal_m={distance_to_goal:.3f} "
-                        f"threshold_steps={config.no_progress_max_steps}"
+                        f"threshold_steps={no_progress_max_steps}"
                     )
                     return _terminal_result(
                         executed_steps=executed_steps,
@@ -275,25 +309,38 @@ class RunTrackingLoop:
                         step_traces=tuple(step_traces),
                     )
 
-            nearest_index = _nearest_route_index(
-                route_points=route_points,
-                x=state.x,
-                y=state.y,
-                start_index=max(0, nearest_index - 3),
-            )
-            lookahead_distance_m = _compute_lookahead_distance(
-                speed_mps=state.speed_mps,
-                config=config,
-            )
-            target_point = _select_lookahead_target(
-                route_points=route_points,
-                nearest_index=nearest_index,
-                x=state.x,
-                y=state.y,
-                lookahead_distance_m=lookahead_distance_m,
+            lookahead_distance_m = min(
+                lookahead_max_m,
+                max(lookahead_min_m, lookahead_base_m + lookahead_speed_gain * state.speed_mps),
             )
+            if route_search_jit is not None:
+                nearest_index, target_index = route_search_jit(
+                    route.xs,
+                    route.ys,
+                    route.arc_m,
+                    state.x,
+                    state.y,
+                    max(0, nearest_index - 3),
+                    lookahead_distance_m,
+                    _ARC_SKIP_SLACK_M,
+                )
+            else:
+                nearest_index = _nearest_route_index(
+                    route=route,
+                    x=state.x,
+                    y=state.y,
+                    start_index=max(0, nearest_index - 3),
+                )
+                target_index = _select_lookahead_index(
+                    route=route,
+                    nearest_index=nearest_index,
+                    x=state.x,
+                    y=state.y,
+                    lookahead_distance_m=lookahead_distance_m,
+                )
+            target_point = route_points[target_index]
 
-            raw_steer = lateral.compute_steer(
+            raw_steer = compute_steer(
                 ego_x=state.x,
                 ego_y=state.y,
                 ego_yaw_deg=state.yaw_deg,
@@ -301,56 +348,55 @@ class RunTrackingLoop:
                 target_y=target_point.y,
                 lookahead_distance_m=max(lookahead_distance_m, 1e-3),
             )
-            steer = _rate_limit(
-                value=raw_steer,
-                prev_value=prev_steer,
-                max_step_delta=config.steer_rate_limit_per_step,
+            steer = min(
+                prev_steer + steer_rate_limit,
+                max(prev_steer - steer_rate_limit, raw_steer),
             )
             prev_steer = steer
 
-            target_speed_mps = _target_speed_with_slowdown(
-                target_speed_mps=config.target_speed_mps,
-                min_slow_speed_mps=config.min_slow_speed_mps,
-                slowdown_distance_m=config.slowdown_distance_m,
-                distance_to_goal_m=distance_to_goal,
-            )
-            acceleration_command = longitudinal.compute(
+            if distance_to_goal >= slowdown_distance_m:
+                target_speed_mps = cruise_speed_mps
+            else:
+                # distance_to_goal is non-negative and below the slowdown
+                # distance here, so the ratio is already within [0, 1).
+                target_speed_mps = min_slow_speed_mps + (
+                    distance_to_goal / slowdown_distance_m
+                ) * slowdown_speed_span_mps
+            acceleration_command = compute_acceleration(
                 speed_mps=state.speed_mps,
                 target_speed_mps=target_speed_mps,
-                dt=config.dt_seconds,
+                dt=dt_seconds,
             )
             if acceleration_command >= 0.0:
-                throttle = min(config.max_throttle, acceleration_command)
+                throttle = min(max_throttle, acceleration_command)
                 brake = 0.0
             else:
                 throttle = 0.0
-                brake = min(config.max_brake, abs(acceleration_command))
-
-            command = ControlCommand(
-                throttle=throttle,
-                brake=brake,
-                steer=steer,
-            )
+                brake = min(max_brake, abs(acceleration_command))
 
             try:
-                self.motion_actuator.apply(request.vehicle_id, command)
-            except RuntimeError as exc:
-                if _is_actor_missing_error(exc):
-                    return _terminal_result(
-                        executed_steps=executed_steps,
-                        last_frame=last_frame,
-                        reached_goal=False,
-                        reason="actor_missing",
-                        state=state,
-                        goal=goal,
-                        route_points=route_points,
-                        step_traces=tuple(step_traces),
+                if apply_raw is not None:
+                    apply_raw(vehicle_id, throttle, brake, steer)
+                else:
+                    apply(
+                        vehicle_id,
+                        ControlCommand(throttle=throttle, brake=brake, steer=steer),
                     )
-                raise
+            except ActorMissingError:
+                return _terminal_result(
+                    executed_steps=executed_steps,
+                    last_frame=last_frame,
+                    reached_goal=False,
+                    reason="actor_missing",
+                    state=state,
+                    goal=goal,
+                    route_points=route_points,
+                    step_traces=tuple(step_traces),
+                )
 
-            last_frame = self.clock.tick()
+            last_frame = tick()
             executed_steps += 1
-            step_traces.append(
+            append_trace(
                 TrackingStepTrace(
                     step=step,
                     frame=last_frame,
@@ -371,13 +417,19 @@ class RunTrackingLoop:
                 )
             )
 
-            self.logger.info(
-                "step="
-                f"{step} frame={last_frame} speed_mps={state.speed_mps:.3f} "
-                f"target_speed_mps={target_speed_mps:.3f} dist_goal_m={distance_to_goal:.3f} "
-                f"lookahead_m={lookahead_distance_m:.3f} steer={steer:.3f} "
-                f"throttle={throttle:.3f} brake={brake:.3f}"
-            )
+            if log_info_on:
+                logger_info(
+                    _STEP_LOG_TEMPLATE,
+                    step,
+                    last_frame,
+                    state.speed_mps,
+                    target_speed_mps,
+                    distance_to_goal,
+                    lookahead_distance_m,
+                    steer,
+                    throttle,
+                    brake,
+                )
 
         return _terminal_result(
             executed_steps=executed_steps,
@@ -391,6 +443,17 @@ class RunTrackingLoop:
         )
 
 
+
+def _route_points(raw_route_points: Sequence[RoutePoint]) -> tuple[RoutePoint, ...]:
+    if all(type(point) is RoutePoint for point in raw_route_points):
+        # RoutePoint is frozen and already float-normalised; share the instances.
+        return tuple(raw_route_points)
+    return tuple(
+        RoutePoint(x=float(point.x), y=float(point.y), yaw_deg=float(point.yaw_deg))
+        for point in raw_route_points
+    )
+
+
 def _to_tracking_config(request: TrackingRequest) -> TrackingConfig:
     return TrackingConfig(
         target_speed_mps=request.target_speed_mps,
@@ -457,55 +520,89 @@ def _terminal_result(
     )
 
 
-def _compute_lookahead_distance(*, speed_mps: float, config: TrackingConfig) -> float:
-    value = config.lookahead_base_m + config.lookahead_speed_gain * speed_mps
-    return _clamp(value, min_value=config.lookahead_min_m, max_value=config.lookahead_max_m)
-
-
-def _target_speed_with_slowdown(
-    *,
-    target_speed_mps: float,
-    min_slow_speed_mps: float,
-    slowdown_distance_m: float,
-    distance_to_goal_m: float,
-) -> float:
-    if distance_to_goal_m >= slowdown_distance_m:
-        return target_speed_mps
-    ratio = _clamp(distance_to_goal_m / slowdown_distance_m, min_value=0.0, max_value=1.0)
-    return min_slow_speed_mps + ratio * (target_speed_mps - min_slow_speed_mps)
+@dataclass(frozen=True, slots=True)
+class _RouteArrays:
+    """Structure-of-arrays copy of the planned route for vectorized searches."""
+
+    xs: np.ndarray
+    ys: np.ndarray
+    # Cumulative polyline length up to each point; arc_m[0] == 0.
+    arc_m: np.ndarray
+    # Per-step search scratch, reused so the hot loop does not allocate.
+    scratch_x: np.ndarray
+    scratch_y: np.ndarray
+    scratch_mask: np.ndarray
+
+
+def _route_arrays(route_points: Sequence[RoutePoint]) -> _RouteArrays:
+    count = len(route_points)
+    xs = np.fromiter((point.x for point in route_points), dtype=np.float64, count=count)
+    ys = np.fromiter((point.y for point in route_points), dtype=np.float64, count=count)
+    arc_m = np.zeros(count, dtype=np.float64)
+    np.cumsum(np.hypot(np.diff(xs), np.diff(ys)), out=arc_m[1:])
+    return _RouteArrays(
+        xs=xs,
+        ys=ys,
+        arc_m=arc_m,
+        scratch_x=np.empty(count, dtype=np.float64),
+        scratch_y=np.empty(count, dtype=np.float64),
+        scratch_mask=np.empty(count, dtype=np.bool_),
+    )
 
 
 def _nearest_route_index(
     *,
-    route_points: tuple[RoutePoint, ...],
+    route: _RouteArrays,
     x: float,
     y: float,
     start_index: int,
 ) -> int:
-    best_index = _clamp_int(start_index, min_value=0, max_value=len(route_points) - 1)
-    best_distance = float("inf")
-    for idx in range(best_index, len(route_points)):
-        point = route_points[idx]
-        distance = _distance_xy(x1=x, y1=y, x2=point.x, y2=point.y)
-        if distance < best_distance:
-            best_distance = distance
-            best_index = idx
-    return best_index
-
-
-def _select_lookahead_target(
+    start = _clamp_int(start_index, min_value=0, max_value=len(route.xs) - 1)
+    dx = np.subtract(route.xs[start:], x, out=route.scratch_x[start:])
+    dy = np.subtract(route.ys[start:], y, out=route.scratch_y[start:])
+    dx *= dx
+    dy *= dy
+    dx += dy
+    # Squared distance keeps the ordering; argmin returns the first minimum,
+    # matching the forward scan it replaces.
+    return start + int(np.argmin(dx))
+
+
+def _select_lookahead_index(
     *,
-    route_points: tuple[RoutePoint, ...],
+    route: _RouteArrays,
     nearest_index: int,
     x: float,
     y: float,
     lookahead_distance_m: float,
-) -> RoutePoint:
-    for idx in range(nearest_index, len(route_points)):
-        point = route_points[idx]
-        if _distance_xy(x1=x, y1=y, x2=point.x, y2=point.y) >= lookahead_distance_m:
-            return point
-    return route_points[-1]
+) -> int:
+    # A point reached along the route after arc length a from the nearest point
+    # is at most nearest_distance + a away, so everything before the threshold
+    # below is still inside the lookahead circle and can be skipped.
+    nearest_distance = math.hypot(
+        float(route.xs[nearest_index]) - x,
+        float(route.ys[nearest_index]) - y,
+    )
+    arc_threshold = (
+        float(route.arc_m[nearest_index])
+        + lookahead_distance_m
+        - nearest_distance
+        - _ARC_SKIP_SLACK_M
+    )
+    start = max(nearest_index, int(np.searchsorted(route.arc_m, arc_threshold)))
+    dx = np.subtract(route.xs[start:], x, out=route.scratch_x[start:])
+    dy = np.subtract(route.ys[start:], y, out=route.scratch_y[start:])
+    dx *= dx
+    dy *= dy
+    dx += dy
+    beyond = np.greater_equal(
+        dx,
+        lookahead_distance_m * lookahead_distance_m,
+        out=route.scratch_mask[start:],
+    )
+    if not beyond.any():
+        return len(route.xs) - 1
+    return start + int(np.argmax(beyond))
 
 
 def _distance_xy(*, x1: float, y1: float, x2: float, y2: float) -> float:
@@ -521,19 +618,6 @@ def _normalize_angle_deg(angle_deg: float) -> float:
     return (angle_deg + 180.0) % 360.0 - 180.0
 
 
-def _rate_limit(*, value: float, prev_value: float, max_step_delta: float) -> float:
-    lower = prev_value - max_step_delta
-    upper = prev_value + max_step_delta
-    return _clamp(value, min_value=lower, max_value=upper)
-
-
-def _clamp(value: float, *, min_value: float, max_value: float) -> float:
-    return min(max_value, max(min_value, value))
-
-
 def _clamp_int(value: int, *, min_value: int, max_value: int) -> int:
     return min(max_value, max(min_value, value))
 
-
-def _is_actor_missing_error(exc: RuntimeError) -> bool:
-    return "Vehicle actor not found" in str(exc)
@@ -1,3 +1,4 @@
+import argparse
 import json
 from dataclasses import dataclass, field
 from typing import Any
@@ -5,6 +6,7 @@ from typing import Any
 import pytest
 
 from vln_carla2.adapters.cli.dispatch import CliDispatchConfig, dispatch_args
+from vln_carla2.adapters.cli.env import get_default_carla_exe, load_env_from_dotenv
 from vln_carla2.adapters.cli.parser import build_parser
 from vln_carla2.app import cli_main
 from vln_carla2.usecases.cli.dto import (
@@ -22,6 +24,65 @@ from vln_carla2.usecases.cli.errors import CliRuntimeError, CliUsageError
 from vln_carla2.usecases.runtime.ports.vehicle_dto import VehicleDescriptor
 
 
+# Frozen payloads returned by _FakeApp; every call shares the same instances.
+_OPERATOR_EXECUTION = OperatorWorkflowExecution(
+    strategy="parallel",
+    vehicle_source="resolved",
+    actor_id=7,
+    operator_ticks=3,
+    control_steps=5,
+)
+_EXP_EXECUTION = ExpWorkflowExecution(
+    control_target=VehicleRefInput(scheme="role", value="ego"),
+    actor_id=7,
+    scene_map_name="Town10HD_Opt",
+    imported_objects=1,
+    forward_distance_m=20.0,
+    traveled_distance_m=20.5,
+    entered_forbidden_zone=False,
+    control_steps=5,
+    metrics_path="runs/20260228_161718/results/ep_000001/metrics.json",
+)
+_TRACKING_EXECUTION = TrackingWorkflowExecution(
+    control_target=VehicleRefInput(scheme="role", value="ego"),
+    actor_id=7,
+    scene_map_name="Town10HD_Opt",
+    imported_objects=1,
+    reached_goal=True,
+    termination_reason="goal_reached",
+    executed_steps=12,
+    final_distance_to_goal_m=0.4,
+    final_yaw_error_deg=2.0,
+    route_points=120,
+    metrics_path="runs/20260228_161718/results/ep_000001/tracking_metrics.json",
+    camera_index_path="runs/20260228_161718/results/ep_000001/camera/front_rgb/index.json",
+    camera_output_dir="runs/20260228_161718/results/ep_000001/camera/front_rgb",
+    camera_frames=12,
+)
+_LISTED_VEHICLE = VehicleDescriptor(
+    actor_id=7,
+    type_id="vehicle.tesla.model3",
+    role_name="ego",
+    x=1.0,
+    y=2.0,
+    z=0.1,
+)
+_SPAWNED_VEHICLE = VehicleDescriptor(
+    actor_id=99,
+    type_id="vehicle.tesla.model3",
+    role_name="ego",
+    x=9.0,
+    y=8.0,
+    z=0.3,
+)
+
+
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    # Parsing never mutates the parser, so one instance serves the whole module.
+    return build_parser()
+
+
 @dataclass
 class _FakeApp:
     scene_calls: list[Any] = field(default_factory=list)
@@ -34,90 +95,43 @@ class _FakeApp:
 
     def run_scene(self, request: Any) -> SceneRunResult:
         self.scene_calls.append(request)
-        return SceneRunResult(mode=request.mode, host=request.host, port=request.port)
+        return SceneRunResult(mode=request.conn.mode, host=request.conn.host, port=request.conn.port)
 
     def run_operator(self, request: Any) -> OperatorRunResult:
         self.operator_calls.append(request)
         return OperatorRunResult(
-            host=request.host,
-            port=request.port,
-            execution=OperatorWorkflowExecution(
-                strategy="parallel",
-                vehicle_source="resolved",
-                actor_id=7,
-                operator_ticks=3,
-                control_steps=5,
-            ),
+            host=request.conn.host,
+            port=request.conn.port,
+            execution=_OPERATOR_EXECUTION,
         )
 
     def run_exp(self, request: Any) -> ExpRunResult:
         self.exp_calls.append(request)
         return ExpRunResult(
-            host=request.host,
-            port=request.port,
-            execution=ExpWorkflowExecution(
-                control_target=VehicleRefInput(scheme="role", value="ego"),
-                actor_id=7,
-                scene_map_name="Town10HD_Opt",
-                imported_objects=1,
-                forward_distance_m=20.0,
-                traveled_distance_m=20.5,
-                entered_forbidden_zone=False,
-                control_steps=5,
-                metrics_path="runs/20260228_161718/results/ep_000001/metrics.json",
-            ),
+            host=request.conn.host,
+            port=request.conn.port,
+            execution=_EXP_EXECUTION,
         )
 
     def run_tracking(self, request: Any) -> TrackingRunResult:
         self.tracking_calls.append(request)
         return TrackingRunResult(
-            host=request.host,
-            port=request.port,
-            execution=TrackingWorkflowExecution(
-                control_target=VehicleRefInput(scheme="role", value="ego"),
-                actor_id=7,
-                scene_map_name="Town10HD_Opt",
-                imported_objects=1,
-                reached_goal=True,
-                termination_reason="goal_reached",
-                executed_steps=12,
-                final_distance_to_goal_m=0.4,
-                final_yaw_error_deg=2.0,
-                route_points=120,
-                metrics_path="runs/20260228_161718/results/ep_000001/tracking_metrics.json",
-                camera_index_path="runs/20260228_161718/results/ep_000001/camera/front_rgb/index.json",
-                camera_output_dir="runs/20260228_161718/results/ep_000001/camera/front_rgb",
-                camera_frames=12,
-            ),
+            host=request.conn.host,
+            port=request.conn.port,
+            execution=_TRACKING_EXECUTION,
         )
 
     def list_vehicles(self, command: Any) -> list[VehicleDescriptor]:
         self.vehicle_list_calls.append(command)
-        return [
-            VehicleDescriptor(
-                actor_id=7,
-                type_id="vehicle.tesla.model3",
-                role_name="ego",
-                x=1.0,
-                y=2.0,
-                z=0.1,
-            )
-        ]
+        return [_LISTED_VEHICLE]
 
     def spawn_vehicle(self, command: Any) -> VehicleDescriptor:
         self.vehicle_spawn_calls.append(command)
-        return VehicleDescriptor(
-            actor_id=99,
-            type_id="vehicle.tesla.model3",
-            role_name="ego",
-            x=9.0,
-            y=8.0,
-            z=0.3,
-        )
+        return _SPAWNED_VEHICLE
 
     def run_spectator_follow(self, request: Any) -> SpectatorFollowResult:
         self.spectator_calls.append(request)
-        return SpectatorFollowResult(mode=request.mode, host=request.host, port=request.port)
+        return SpectatorFollowResult(mode=request.conn.mode, host=request.conn.host, port=request.conn.port)
 
 
 def test_main_delegates_to_adapter(monkeypatch) -> None:
@@ -159,6 +173,35 @@ def test_build_cli_dispatch_config_loads_env_then_reads_default(monkeypatch) ->
     assert config.default_carla_exe == "C:/CARLA/FromDotenv.exe"
 
 
+def _clear_carla_exe_env(monkeypatch) -> None:
+    # setenv first so monkeypatch restores the original state after the loader writes it.
+    monkeypatch.setenv("CARLA_UE4_EXE", "")
+    monkeypatch.delenv("CARLA_UE4_EXE")
+
+
+def test_load_env_from_dotenv_reads_carla_exe(monkeypatch, tmp_path) -> None:
+    _clear_carla_exe_env(monkeypatch)
+    dotenv = tmp_path / ".env.test.cli"
+    dotenv.write_text(
+        '# local overrides\nCARLA_UE4_EXE="C:/CARLA/FromDotenv.exe"\n',
+        encoding="utf-8",
+    )
+
+    load_env_from_dotenv(str(dotenv))
+
+    assert get_default_carla_exe() == "C:/CARLA/FromDotenv.exe"
+
+
+def test_load_env_from_dotenv_reads_carla_exe_with_bom(monkeypatch, tmp_path) -> None:
+    _clear_carla_exe_env(monkeypatch)
+    dotenv = tmp_path / ".env.test.cli"
+    dotenv.write_text("CARLA_UE4_EXE=C:/CARLA/FromBom.exe\n", encoding="utf-8-sig")
+
+    load_env_from_dotenv(str(dotenv))
+
+    assert get_default_carla_exe() == "C:/CARLA/FromBom.exe"
+
+
 def test_build_parser_uses_passed_carla_exe_default() -> None:
     parser = build_parser(default_carla_exe="C:/CARLA/FromApp.exe")
 
@@ -167,9 +210,7 @@ def test_build_parser_uses_passed_carla_exe_default() -> None:
     assert args.carla_exe == "C:/CARLA/FromApp.exe"
 
 
-def test_build_parser_supports_scene_run_episode_options() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_scene_run_episode_options(parser) -> None:
     args = parser.parse_args(
         [
             "scene",
@@ -187,9 +228,7 @@ def test_build_parser_supports_scene_run_episode_options() -> None:
     assert args.export_episode_spec is True
 
 
-def test_build_parser_supports_scene_run_manual_defaults() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_scene_run_manual_defaults(parser) -> None:
     args = parser.parse_args(["scene", "run"])
 
     assert args.manual_control_target is None
@@ -197,9 +236,7 @@ def test_build_parser_supports_scene_run_manual_defaults() -> None:
     assert args.tick_log_path is None
 
 
-def test_build_parser_supports_operator_run_defaults() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_operator_run_defaults(parser) -> None:
     args = parser.parse_args(["operator", "run"])
 
     assert args.follow == "role:ego"
@@ -210,9 +247,7 @@ def test_build_parser_supports_operator_run_defaults() -> None:
     assert args.operator_warmup_ticks == 1
 
 
-def test_build_parser_supports_exp_run_defaults() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_exp_run_defaults(parser) -> None:
     args = parser.parse_args(
         ["exp", "run", "--episode-spec", "datasets/town10hd_val_v1/episodes/ep_000001/episode_spec.json"]
     )
@@ -227,9 +262,7 @@ def test_build_parser_supports_exp_run_defaults() -> None:
     assert args.max_steps == 800
 
 
-def test_build_parser_supports_tracking_run_defaults() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_tracking_run_defaults(parser) -> None:
     args = parser.parse_args(
         [
             "tracking",
@@ -262,9 +295,7 @@ def test_build_parser_supports_tracking_run_defaults() -> None:
     assert args.planner == "waypoint"
 
 
-def test_build_parser_supports_tracking_run_embed_forbidden_zone_flag() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_tracking_run_embed_forbidden_zone_flag(parser) -> None:
     args = parser.parse_args(
         [
             "tracking",
@@ -281,9 +312,7 @@ def test_build_parser_supports_tracking_run_embed_forbidden_zone_flag() -> None:
     assert args.embed_forbidden_zone is True
 
 
-def test_build_parser_supports_tracking_run_target_tick_log_path() -> None:
-    parser = build_parser()
-
+def test_build_parser_supports_tracking_run_target_tick_log_path(parser) -> None:
     args = parser.parse_args(
         [
             "tracking",
@@ -298,9 +327,7 @@ def test_build_parser_supports_tracking_run_target_tick_log_path() -> None:
     assert args.target_tick_log_path == "runs/custom/scene_tick_log.json"
 
 
-def test_build_parser_rejects_tracking_planner_with_target_tick_log_path() -> None:
-    parser = build_parser()
-
+def test_build_parser_rejects_tracking_planner_with_target_tick_log_path(parser) -> None:
     with pytest.raises(SystemExit):
         parser.parse_args(
             [
@@ -316,9 +343,8 @@ def test_build_parser_rejects_tracking_planner_with_target_tick_log_path() -> No
         )
 
 
-def test_dispatch_vehicle_list_outputs_json(capsys) -> None:
+def test_dispatch_vehicle_list_outputs_json(capsys, parser) -> None:
     app = _FakeApp()
-    parser = build_parser()
     args = parser.parse_args(["vehicle", "list", "--format", "json"])
 
     exit_code = dispatch_args(args, app=app, parser=parser)
@@ -329,9 +355,8 @@ def test_dispatch_vehicle_list_outputs_json(capsys) -> None:
     assert app.vehicle_list_calls
 
 
-def test_dispatch_vehicle_spawn_outputs_json(capsys) -> None:
+def test_dispatch_vehicle_spawn_outputs_json(capsys, parser) -> None:
     app = _FakeApp()
-    parser = build_parser()
     args = parser.parse_args(["vehicle", "spawn", "--output", "json"])
 
     exit_code = dispatch_args(args, app=app, parser=parser)
@@ -342,9 +367,8 @@ def test_dispatch_vehicle_spawn_outputs_json(capsys) -> None:
     assert app.vehicle_spawn_calls
 
 
-def test_dispatch_exp_prints_metrics_path(capsys) -> None:
+def test_dispatch_exp_prints_metrics_path(capsys, parser) -> None:
     app = _FakeApp()
-    parser = build_parser()
     args = parser.parse_args(
         [
             "exp",
@@ -361,9 +385,8 @@ def test_dispatch_exp_prints_metrics_path(capsys) -> None:
     assert "metrics saved path=runs/20260228_161718/results/ep_000001/metrics.json" in stdout
 
 
-def test_dispatch_tracking_prints_summary(capsys) -> None:
+def test_dispatch_tracking_prints_summary(capsys, parser) -> None:
     app = _FakeApp()
-    parser = build_parser()
     args = parser.parse_args(
         [
             "tracking",
@@ -392,48 +415,29 @@ def test_dispatch_tracking_prints_summary(capsys) -> None:
     assert app.tracking_calls
 
 
-def test_dispatch_operator_rejects_invalid_follow_ref(capsys) -> None:
-    app = _FakeApp()
-    parser = build_parser()
-    args = parser.parse_args(["operator", "run", "--follow", "bad-ref"])
-
-    exit_code = dispatch_args(args, app=app, parser=parser)
-    stderr = capsys.readouterr().err
-
-    assert exit_code == 2
-    assert "Invalid vehicle ref" in stderr
-    assert not app.operator_calls
-
-
-def test_dispatch_spectator_rejects_invalid_follow_ref(capsys) -> None:
-    app = _FakeApp()
-    parser = build_parser()
-    args = parser.parse_args(["spectator", "follow", "--follow", "bad-ref"])
-
-    exit_code = dispatch_args(args, app=app, parser=parser)
-    stderr = capsys.readouterr().err
-
-    assert exit_code == 2
-    assert "Invalid vehicle ref" in stderr
-    assert not app.spectator_calls
-
-
-def test_dispatch_scene_rejects_invalid_manual_control_target(capsys) -> None:
+@pytest.mark.parametrize(
+    ("argv", "calls_attr"),
+    [
+        (["operator", "run", "--follow", "bad-ref"], "operator_calls"),
+        (["spectator", "follow", "--follow", "bad-ref"], "spectator_calls"),
+        (["scene", "run", "--manual-control-target", "bad-ref"], "scene_calls"),
+    ],
+    ids=["operator-follow", "spectator-follow", "scene-manual-control-target"],
+)
+def test_dispatch_rejects_invalid_vehicle_ref(capsys, parser, argv, calls_attr) -> None:
     app = _FakeApp()
-    parser = build_parser()
-    args = parser.parse_args(["scene", "run", "--manual-control-target", "bad-ref"])
+    args = parser.parse_args(argv)
 
     exit_code = dispatch_args(args, app=app, parser=parser)
     stderr = capsys.readouterr().err
 
     assert exit_code == 2
     assert "Invalid vehicle ref" in stderr
-    assert not app.scene_calls
+    assert not getattr(app, calls_attr)
 
 
-def test_dispatch_scene_enable_tick_log_without_target_maps_usage_error(capsys) -> None:
+def test_dispatch_scene_enable_tick_log_without_target_maps_usage_error(capsys, parser) -> None:
     app = _FakeApp()
-    parser = build_parser()
     args = parser.parse_args(["scene", "run", "--enable-tick-log"])
 
     def _raise_usage(_request: Any) -> None:
@@ -447,36 +451,31 @@ def test_dispatch_scene_enable_tick_log_without_target_maps_usage_error(capsys)
     assert "manual_control_target" in stderr
 
 
-def test_dispatch_maps_usage_error_to_exit_code_2(capsys) -> None:
-    app = _FakeApp()
-    parser = build_parser()
-    args = parser.parse_args(["scene", "run"])
-
-    def _raise_usage(_request: Any) -> None:
-        raise CliUsageError("bad usage")
-
-    app.run_scene = _raise_usage
-
-    exit_code = dispatch_args(args, app=app, parser=parser)
-    stderr = capsys.readouterr().err
-
-    assert exit_code == 2
-    assert "[ERROR] bad usage" in stderr
-
-
-def test_dispatch_maps_runtime_error_to_exit_code_1(capsys) -> None:
+@pytest.mark.parametrize(
+    ("error", "expected_exit_code", "expected_stderr"),
+    [
+        (CliUsageError("bad usage"), 2, "[ERROR] bad usage"),
+        (CliRuntimeError("runtime broke"), 1, "[ERROR] runtime broke"),
+    ],
+    ids=["usage-error", "runtime-error"],
+)
+def test_dispatch_maps_cli_errors_to_exit_codes(
+    capsys,
+    parser,
+    error,
+    expected_exit_code,
+    expected_stderr,
+) -> None:
     app = _FakeApp()
-    parser = build_parser()
     args = parser.parse_args(["scene", "run"])
 
-    def _raise_runtime(_request: Any) -> None:
-        raise CliRuntimeError("runtime broke")
+    def _raise(_request: Any) -> None:
+        raise error
 
-    app.run_scene = _raise_runtime
+    app.run_scene = _raise
 
     exit_code = dispatch_args(args, app=app, parser=parser)
     stderr = capsys.readouterr().err
 
-    assert exit_code == 1
-    assert "[ERROR] runtime broke" in stderr
-
+    assert exit_code == expected_exit_code
+    assert expected_stderr in stderr
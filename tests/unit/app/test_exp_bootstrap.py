@@ -92,7 +92,7 @@ def test_run_wires_exp_dependencies_and_returns_result(monkeypatch: pytest.Monke
     @contextmanager
     def fake_managed_session(config: exp.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -149,7 +149,7 @@ def test_run_tracking_workflow_wires_dependencies_and_returns_result(
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -328,7 +328,7 @@ def test_run_tracking_workflow_uses_tick_log_as_target_route(
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -449,7 +449,7 @@ def test_run_tracking_workflow_uses_hybrid_planner_route_adapter(
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -560,7 +560,7 @@ def test_run_tracking_workflow_hybrid_trajectory_log_includes_local_planning_map
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -720,7 +720,7 @@ def test_run_tracking_workflow_hybrid_embed_forbidden_zone_wires_and_logs_vertic
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -861,7 +861,7 @@ def test_run_tracking_workflow_hybrid_embed_forbidden_zone_build_failure_raises(
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **kwargs: Any) -> None:
@@ -1051,7 +1051,7 @@ def test_run_tracking_workflow_camera_recorder_default_path_and_result_fields(
     @contextmanager
     def fake_managed_session(config: tracking.CarlaSessionConfig):
         captured["session_config"] = config
-        yield SimpleNamespace(world=fake_world)
+        yield SimpleNamespace(world=fake_world, client=object())
 
     class FakeImportSceneTemplate:
         def __init__(self, **_kwargs: Any) -> None:
@@ -1174,7 +1174,7 @@ def test_run_tracking_workflow_camera_recorder_uses_custom_log_dir(
 
     @contextmanager
     def fake_managed_session(_config: tracking.CarlaSessionConfig):
-        yield SimpleNamespace(world=FakeWorld())
+        yield SimpleNamespace(world=FakeWorld(), client=object())
 
     class FakeSceneStore:
         def load(self, _path: str) -> SceneTemplate:
@@ -1281,7 +1281,7 @@ def test_run_tracking_workflow_camera_callback_error_raises_and_cleans_up(
 
     @contextmanager
     def fake_managed_session(_config: tracking.CarlaSessionConfig):
-        yield SimpleNamespace(world=FakeWorld())
+        yield SimpleNamespace(world=FakeWorld(), client=object())
 
     class FakeSceneStore:
         def load(self, _path: str) -> SceneTemplate:
@@ -1395,7 +1395,7 @@ def test_run_tracking_workflow_camera_start_failure_raises_and_cleans_up(
 
     @contextmanager
     def fake_managed_session(_config: tracking.CarlaSessionConfig):
-        yield SimpleNamespace(world=FakeWorld())
+        yield SimpleNamespace(world=FakeWorld(), client=object())
 
     class FakeSceneStore:
         def load(self, _path: str) -> SceneTemplate:
@@ -36,3 +36,18 @@ def test_compute_brakes_when_above_target() -> None:
     assert command.throttle == 0.0
     assert command.steer == 0.0
 
+
+def test_compute_reuses_fixed_commands_for_coast_and_saturation() -> None:
+    controller = SimpleSpeedController()
+    target = TargetSpeedCommand(5.0)
+
+    coast = controller.compute(state=_state_with_speed(5.0), target=target)
+    full_throttle = controller.compute(state=_state_with_speed(0.0), target=target)
+    full_brake = controller.compute(state=_state_with_speed(20.0), target=target)
+
+    assert (coast.throttle, coast.brake) == (0.0, 0.0)
+    assert controller.compute(state=_state_with_speed(5.1), target=target) is coast
+    assert (full_throttle.throttle, full_throttle.brake) == (1.0, 0.0)
+    assert controller.compute(state=_state_with_speed(0.5), target=target) is full_throttle
+    assert (full_brake.throttle, full_brake.brake) == (0.0, 1.0)
+    assert controller.compute(state=_state_with_speed(30.0), target=target) is full_brake
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+import pytest
+
 from vln_carla2.domain.model.scene_template import SceneObject, SceneObjectKind, ScenePose
 from vln_carla2.infrastructure.carla.scene_object_spawner_adapter import (
     CarlaSceneObjectSpawnerAdapter,
@@ -43,4 +45,121 @@ def test_scene_object_spawner_adapter_maps_scene_object_to_spawn_call(monkeypatc
         "spawn_z": 0.2,
         "spawn_yaw": 30.0,
         "role_name": "barrel",
+        "blueprint_cache": {},
     }
+
+
+class _FakeBlueprint:
+    def __init__(self, blueprint_id: str) -> None:
+        self.blueprint_id = blueprint_id
+        self.role_name = ""
+
+    def has_attribute(self, name: str) -> bool:
+        return name == "role_name"
+
+    def set_attribute(self, name: str, value: str) -> None:
+        self.role_name = value
+
+
+class _FakeLibrary:
+    def __init__(self) -> None:
+        self.filter_calls: list[str] = []
+
+    def filter(self, blueprint_filter: str) -> list[_FakeBlueprint]:
+        self.filter_calls.append(blueprint_filter)
+        return [_FakeBlueprint(blueprint_filter)]
+
+
+class _FakeWorld:
+    def __init__(self) -> None:
+        self.library = _FakeLibrary()
+
+    def get_blueprint_library(self) -> _FakeLibrary:
+        return self.library
+
+
+@dataclass
+class _FakeResponse:
+    error: str = ""
+    actor_id: int = 0
+
+
+class _FakeClient:
+    def __init__(self, errors: list[str]) -> None:
+        self.errors = errors
+        self.batches: list[list[Any]] = []
+
+    def apply_batch_sync(self, commands: list[Any], do_tick: bool) -> list[_FakeResponse]:
+        self.batches.append(commands)
+        if len(self.batches) > 1:
+            return [_FakeResponse() for _ in commands]
+        return [
+            _FakeResponse(error, actor_id=100 + index if not error else 0)
+            for index, error in enumerate(self.errors)
+        ]
+
+
+class _FakeCarla:
+    class command:
+        @staticmethod
+        def SpawnActor(blueprint: _FakeBlueprint, transform: Any) -> tuple[str, str, float]:
+            return (blueprint.blueprint_id, blueprint.role_name, transform[0][0])
+
+        @staticmethod
+        def DestroyActor(actor_id: int) -> tuple[str, int]:
+            return ("destroy", actor_id)
+
+    @staticmethod
+    def Transform(location: Any, rotation: Any) -> Any:
+        return (location, rotation)
+
+    @staticmethod
+    def Location(*, x: float, y: float, z: float) -> Any:
+        return (x, y, z)
+
+    @staticmethod
+    def Rotation(*, pitch: float, yaw: float, roll: float) -> Any:
+        return (pitch, yaw, roll)
+
+
+def _barrels(count: int) -> list[SceneObject]:
+    return [
+        SceneObject(
+            kind=SceneObjectKind.BARREL,
+            blueprint_id="static.prop.barrel",
+            role_name=f"barrel_{index}",
+            pose=ScenePose(x=float(index), y=0.0, z=0.2, yaw=0.0),
+        )
+        for index in range(count)
+    ]
+
+
+def test_scene_object_spawner_adapter_spawns_batch_in_one_round_trip(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "vln_carla2.infrastructure.carla.scene_object_spawner_adapter.require_carla",
+        lambda: _FakeCarla,
+    )
+    world = _FakeWorld()
+    client = _FakeClient(errors=["", ""])
+
+    spawned = CarlaSceneObjectSpawnerAdapter(world, client=client).spawn_batch(_barrels(2))
+
+    assert spawned == 2
+    assert world.library.filter_calls == ["static.prop.barrel"]
+    assert client.batches == [
+        [("static.prop.barrel", "barrel_0", 0.0), ("static.prop.barrel", "barrel_1", 1.0)]
+    ]
+
+
+def test_scene_object_spawner_adapter_batch_reports_failed_spawn(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "vln_carla2.infrastructure.carla.scene_object_spawner_adapter.require_carla",
+        lambda: _FakeCarla,
+    )
+    client = _FakeClient(errors=["", "collision at spawn position", ""])
+
+    with pytest.raises(RuntimeError, match="x=1.0.*collision at spawn position"):
+        CarlaSceneObjectSpawnerAdapter(_FakeWorld(), client=client).spawn_batch(_barrels(3))
+
+    assert len(client.batches) == 2
+    assert client.batches[1] == [("destroy", 100), ("destroy", 102)]
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 import pytest
 
+from vln_carla2.domain.errors import ActorMissingError
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.infrastructure.carla.state_reader import CarlaVehicleStateReader
 
@@ -116,5 +117,5 @@ def test_state_reader_reads_actor_origin_and_bbox_probe_points() -> None:
 def test_state_reader_raises_when_actor_missing() -> None:
     reader = CarlaVehicleStateReader(world=_World(actor=None))
 
-    with pytest.raises(RuntimeError, match="Vehicle actor not found"):
+    with pytest.raises(ActorMissingError, match="Vehicle actor not found"):
         reader.read(VehicleId(7))
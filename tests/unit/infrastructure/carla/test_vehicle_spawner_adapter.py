@@ -68,6 +68,7 @@ def test_vehicle_spawner_adapter_calls_spawner_and_returns_descriptor(monkeypatc
         "spawn_z": 3.0,
         "spawn_yaw": 90.0,
         "role_name": "npc",
+        "blueprint_cache": {},
     }
     assert got.actor_id == 77
     assert got.type_id == "vehicle.mini.cooper"
@@ -103,3 +104,66 @@ def test_vehicle_spawner_adapter_falls_back_to_requested_role_name(monkeypatch)
     assert got.actor_id == 88
     assert got.role_name == "ego"
 
+
+class _FakeBlueprint:
+    def has_attribute(self, name: str) -> bool:
+        return name == "role_name"
+
+    def set_attribute(self, name: str, value: str) -> None:
+        pass
+
+
+class _FakeLibrary:
+    def filter(self, blueprint_filter: str) -> list[_FakeBlueprint]:
+        return [_FakeBlueprint()]
+
+
+class _FakeWorld:
+    def __init__(self) -> None:
+        self.library_calls = 0
+        self.spawned_blueprints: list[_FakeBlueprint] = []
+
+    def get_blueprint_library(self) -> _FakeLibrary:
+        self.library_calls += 1
+        return _FakeLibrary()
+
+    def try_spawn_actor(self, blueprint: _FakeBlueprint, transform: Any) -> _FakeActor:
+        self.spawned_blueprints.append(blueprint)
+        return _FakeActor()
+
+
+class _FakeCarla:
+    @staticmethod
+    def Transform(location: Any, rotation: Any) -> Any:
+        return (location, rotation)
+
+    @staticmethod
+    def Location(**kwargs: float) -> Any:
+        return kwargs
+
+    @staticmethod
+    def Rotation(**kwargs: float) -> Any:
+        return kwargs
+
+
+def test_vehicle_spawner_adapter_fetches_blueprint_library_once(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "vln_carla2.infrastructure.carla.spawner.require_carla",
+        lambda: _FakeCarla,
+    )
+    world = _FakeWorld()
+    adapter = CarlaVehicleSpawnerAdapter(world=world)
+    request = SpawnVehicleRequest(
+        blueprint_filter="vehicle.mini.cooper",
+        spawn_x=1.0,
+        spawn_y=2.0,
+        spawn_z=3.0,
+        spawn_yaw=90.0,
+        role_name="npc",
+    )
+
+    adapter.spawn(request)
+    adapter.spawn(request)
+
+    assert world.library_calls == 1
+    assert world.spawned_blueprints[0] is world.spawned_blueprints[1]
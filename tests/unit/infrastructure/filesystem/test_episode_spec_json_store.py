@@ -58,6 +58,31 @@ def test_episode_spec_json_store_save_and_load_roundtrip() -> None:
     assert got == _spec()
 
 
+@pytest.mark.parametrize("bad_value", [float("nan"), float("inf"), float("-inf")])
+def test_episode_spec_json_store_save_rejects_non_finite_transform(bad_value: float) -> None:
+    case_dir = _case_dir("non_finite_transform")
+    store = EpisodeSpecJsonStore(cwd=case_dir)
+    spec = _spec()
+    bad_spec = EpisodeSpec(
+        schema_version=spec.schema_version,
+        episode_id=spec.episode_id,
+        scene_json_path=spec.scene_json_path,
+        start_transform=EpisodeTransform(x=bad_value, y=2.0, z=0.1, yaw=180.0),
+        goal_transform=spec.goal_transform,
+        instruction=spec.instruction,
+        max_steps=spec.max_steps,
+        seed=spec.seed,
+    )
+    target = case_dir / "episode_spec.json"
+
+    with pytest.raises(ValueError, match="episode spec start_transform must be finite"):
+        store.save(bad_spec, str(target))
+
+    assert not target.exists()
+    store.save(spec, str(target))
+    assert store.load(str(target)) == spec
+
+
 def test_episode_spec_json_store_resolves_scene_json_path_relative_to_spec() -> None:
     case_dir = _case_dir("resolve_scene")
     store = EpisodeSpecJsonStore(cwd=case_dir)
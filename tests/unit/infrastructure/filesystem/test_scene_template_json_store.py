@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from pathlib import Path
 
@@ -9,6 +10,7 @@ from vln_carla2.domain.model.scene_template import (
     ScenePose,
     SceneTemplate,
 )
+from vln_carla2.infrastructure.filesystem import scene_template_json_store
 from vln_carla2.infrastructure.filesystem.scene_template_json_store import SceneTemplateJsonStore
 
 
@@ -73,6 +75,62 @@ def test_scene_template_json_store_save_and_load_roundtrip() -> None:
     assert got == expected
 
 
+def test_scene_template_json_store_save_writes_objects_across_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(scene_template_json_store, "_SAVE_CHUNK_OBJECTS", 1)
+    case_dir = _case_dir("chunked_save")
+    store = SceneTemplateJsonStore(cwd=case_dir)
+    expected = _template()
+    target = case_dir / "scene.json"
+
+    store.save(expected, str(target))
+    text = target.read_text(encoding="utf-8")
+
+    assert store.load(str(target)) == expected
+    assert text == json.dumps(json.loads(text), indent=2) + "\n"
+
+
+@pytest.mark.parametrize("bad_value", [float("nan"), float("inf"), float("-inf")])
+def test_scene_template_json_store_save_rejects_non_finite_pose(bad_value: float) -> None:
+    case_dir = _case_dir("non_finite_pose")
+    store = SceneTemplateJsonStore(cwd=case_dir)
+    template = SceneTemplate.from_iterable(
+        schema_version=1,
+        map_name="Town10HD_Opt",
+        objects=[
+            SceneObject(
+                kind=SceneObjectKind.VEHICLE,
+                blueprint_id="vehicle.tesla.model3",
+                role_name="ego",
+                pose=ScenePose(x=1.0, y=bad_value, z=0.1, yaw=0.0),
+            )
+        ],
+    )
+    target = case_dir / "scene.json"
+
+    with pytest.raises(ValueError, match="scene object pose must be finite"):
+        store.save(template, str(target))
+
+    assert not target.exists()
+    store.save(_template(), str(target))
+    assert store.load(str(target)) == _template()
+
+
+@pytest.mark.parametrize("stream_threshold_bytes", [0, 1 << 20])
+def test_scene_template_json_store_load_shares_repeated_blueprint_strings(
+    stream_threshold_bytes: int,
+) -> None:
+    case_dir = _case_dir("shared_strings")
+    store = SceneTemplateJsonStore(cwd=case_dir, stream_threshold_bytes=stream_threshold_bytes)
+    target = case_dir / "scene.json"
+    store.save(_template(), str(target))
+
+    ego, goal = store.load(str(target)).objects
+
+    assert ego.blueprint_id is goal.blueprint_id
+
+
 def test_scene_template_json_store_uses_default_timestamp_filename() -> None:
     case_dir = _case_dir("default_name")
     fixed = datetime(2026, 2, 26, 12, 30, 45)
@@ -103,3 +161,25 @@ def test_scene_template_json_store_requires_valid_payload_shape() -> None:
 
     with pytest.raises(ValueError, match="scene object must be object"):
         store.load(str(target))
+
+
+def test_scene_template_json_store_streams_templates_above_threshold() -> None:
+    case_dir = _case_dir("streaming")
+    store = SceneTemplateJsonStore(cwd=case_dir, stream_threshold_bytes=0)
+    expected = _template()
+    target = case_dir / "scene.json"
+
+    save_path = store.save(expected, str(target))
+    got = store.load(save_path)
+
+    assert got == expected
+
+
+def test_scene_template_json_store_streaming_rejects_invalid_payload_shape() -> None:
+    case_dir = _case_dir("streaming_payload_shape")
+    target = case_dir / "broken.json"
+    target.write_text('{"schema_version": 1, "map_name": {"Town10HD_Opt": 1}, "objects": []}')
+    store = SceneTemplateJsonStore(cwd=case_dir, stream_threshold_bytes=0)
+
+    with pytest.raises(ValueError, match="map_name must be non-empty string"):
+        store.load(str(target))
@@ -1,4 +1,6 @@
+import os
 from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
 
@@ -47,6 +49,27 @@ class _FakeEpisodeStore:
         return "resolved/scene.json"
 
 
+CASE_ROOT = Path(".tmp_test_artifacts") / "scene_template_loader_adapter"
+
+
+@pytest.fixture(autouse=True)
+def _cleanup_case_root() -> None:
+    _remove_tree(CASE_ROOT)
+    yield
+    _remove_tree(CASE_ROOT)
+
+
+def _remove_tree(path: Path) -> None:
+    if not path.exists():
+        return
+    for child in sorted(path.rglob("*"), reverse=True):
+        if child.is_file():
+            child.unlink()
+        elif child.is_dir():
+            child.rmdir()
+    path.rmdir()
+
+
 def _template(map_name: str) -> SceneTemplate:
     return SceneTemplate(schema_version=1, map_name=map_name, objects=tuple())
 
@@ -96,3 +119,22 @@ def test_loader_raises_when_scene_and_episode_inputs_are_both_invalid() -> None:
 
     with pytest.raises(ValueError, match="episode parse failed"):
         adapter.load_map_name("broken.json")
+
+
+def test_loader_caches_map_name_until_file_mtime_changes() -> None:
+    CASE_ROOT.mkdir(parents=True, exist_ok=True)
+    scene_path = CASE_ROOT / "scene.json"
+    scene_path.write_text("{}", encoding="utf-8")
+    scene_store = _FakeSceneStore(template=_template("Town10HD_Opt"), calls=[])
+    adapter = SceneTemplateLoaderAdapter(store=scene_store, episode_store=_FakeEpisodeStore())
+
+    assert adapter.load_map_name(str(scene_path)) == "Town10HD_Opt"
+    assert adapter.load_map_name(str(scene_path)) == "Town10HD_Opt"
+    assert scene_store.calls == [str(scene_path)]
+
+    stat = scene_path.stat()
+    os.utime(scene_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    scene_store.template = _template("Town01")
+
+    assert adapter.load_map_name(str(scene_path)) == "Town01"
+    assert scene_store.calls == [str(scene_path), str(scene_path)]
@@ -9,8 +9,10 @@ import pytest
 from vln_carla2.usecases.cli.dto import (
     ExpRunRequest,
     ExpWorkflowExecution,
+    LaunchParams,
     OperatorRunRequest,
     OperatorWorkflowExecution,
+    RuntimeConnectionParams,
     RuntimeSessionRecord,
     SceneRunRequest,
     SpawnVehicleRequest,
@@ -209,6 +211,15 @@ def _build_service(
     )
 
 
+def _nest(payload: dict[str, Any]) -> dict[str, Any]:
+    conn = {name: payload.pop(name) for name in RuntimeConnectionParams.__struct_fields__}
+    payload["conn"] = RuntimeConnectionParams(**conn)
+    launch_fields = [name for name in LaunchParams.__struct_fields__ if name in payload]
+    if launch_fields:
+        payload["launch"] = LaunchParams(**{name: payload.pop(name) for name in launch_fields})
+    return payload
+
+
 def _scene_request(**overrides: Any) -> SceneRunRequest:
     payload = dict(
         host="127.0.0.1",
@@ -235,7 +246,7 @@ def _scene_request(**overrides: Any) -> SceneRunRequest:
         tick_log_path=None,
     )
     payload.update(overrides)
-    return SceneRunRequest(**payload)
+    return SceneRunRequest(**_nest(payload))
 
 
 def _exp_request(**overrides: Any) -> ExpRunRequest:
@@ -263,7 +274,7 @@ def _exp_request(**overrides: Any) -> ExpRunRequest:
         max_steps=800,
     )
     payload.update(overrides)
-    return ExpRunRequest(**payload)
+    return ExpRunRequest(**_nest(payload))
 
 
 def _spectator_request(**overrides: Any) -> SpectatorFollowRequest:
@@ -279,7 +290,7 @@ def _spectator_request(**overrides: Any) -> SpectatorFollowRequest:
         z=20.0,
     )
     payload.update(overrides)
-    return SpectatorFollowRequest(**payload)
+    return SpectatorFollowRequest(**_nest(payload))
 
 
 def _tracking_request(**overrides: Any) -> TrackingRunRequest:
@@ -337,7 +348,13 @@ def _tracking_request(**overrides: Any) -> TrackingRunRequest:
         embed_forbidden_zone=False,
     )
     payload.update(overrides)
-    return TrackingRunRequest(**payload)
+    return TrackingRunRequest(**_nest(payload))
+
+
+def test_service_instances_have_no_instance_dict() -> None:
+    service = _build_service()
+
+    assert not hasattr(service, "__dict__")
 
 
 def test_launch_with_non_loopback_host_raises_usage_error() -> None:
@@ -388,6 +405,40 @@ def test_launch_success_with_keep_true_keeps_server_alive() -> None:
     assert not registry.clears
 
 
+@pytest.mark.parametrize(
+    ("offscreen", "no_rendering", "expected_count"),
+    [(False, False, 0), (True, False, 1), (False, True, 1), (True, True, 2)],
+)
+def test_run_scene_reports_runtime_warnings_without_launch(
+    offscreen: bool,
+    no_rendering: bool,
+    expected_count: int,
+) -> None:
+    service = _build_service()
+
+    result = service.run_scene(_scene_request(offscreen=offscreen, no_rendering=no_rendering))
+
+    assert len(result.warnings) == expected_count
+    assert any("--offscreen" in w for w in result.warnings) is offscreen
+    assert any("--no-rendering" in w for w in result.warnings) is no_rendering
+
+
+def test_launch_terminate_failure_is_reported_as_warning() -> None:
+    @dataclass
+    class _FailingTerminateServer(_FakeServerControl):
+        def terminate_server(self, process: Any) -> None:
+            del process
+            raise RuntimeError("boom")
+
+    service = _build_service(server=_FailingTerminateServer())
+
+    result = service.run_scene(
+        _scene_request(launch_carla=True, offscreen=True, keep_carla_server=False)
+    )
+
+    assert result.warnings == ("failed to terminate launched CARLA process: boom",)
+
+
 def test_run_scene_value_error_maps_to_usage_error() -> None:
     @dataclass
     class _ValueErrorSceneWorkflows(_FakeWorkflows):
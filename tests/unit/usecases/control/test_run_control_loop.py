@@ -67,9 +67,13 @@ class FakeClock:
 @dataclass
 class FakeLogger:
     messages: list[str]
+    info_enabled: bool = True
 
-    def info(self, message: str) -> None:
-        self.messages.append(message)
+    def is_info_enabled(self) -> bool:
+        return self.info_enabled
+
+    def info(self, message: str, *args: object) -> None:
+        self.messages.append(message % args if args else message)
 
     def warn(self, message: str) -> None:
         self.messages.append(message)
@@ -178,3 +182,26 @@ def test_run_control_loop_supports_on_state_and_stop_before_apply_hooks() -> Non
     assert result.last_frame == 2
     assert sampled_frames == [1, 2, 3]
     assert stop_checks == [1, 2, 3]
+
+
+def test_run_control_loop_skips_step_logs_when_info_is_disabled() -> None:
+    events: list[str] = []
+    logger = FakeLogger(messages=[], info_enabled=False)
+    loop = RunControlLoop(
+        state_reader=FakeStateReader(states=[_state(1, 0.0), _state(2, 1.0)], events=events),
+        motion_actuator=FakeMotionActuator(events=events, applied=[]),
+        clock=FakeClock(events=events),
+        logger=logger,
+        controller=FakeController(events=events),
+    )
+
+    result = loop.run(
+        vehicle_id=VehicleId(5),
+        target=TargetSpeedCommand(3.0),
+        max_steps=2,
+        stop_before_apply=lambda step, _state: step >= 2,
+    )
+
+    assert result.executed_steps == 1
+    assert logger.messages == []
+
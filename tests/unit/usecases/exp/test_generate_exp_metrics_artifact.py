@@ -78,3 +78,20 @@ def test_generate_metrics_artifact_falls_back_to_episode_spec_stem() -> None:
     assert Path(result.metrics_path).as_posix() == (
         "runs/20260228_070001/results/episode_spec/metrics.json"
     )
+
+
+def test_metrics_request_coerces_non_float_coordinates() -> None:
+    request = ExpMetricsRequest(
+        episode_spec_path="episode_spec.json",
+        entered_forbidden_zone=False,
+        final_x=1,
+        final_y=2.0,
+        goal_x=3,
+        goal_y=4,
+    )
+
+    assert (request.final_x, request.final_y, request.goal_x, request.goal_y) == (1.0, 2.0, 3.0, 4.0)
+    assert all(
+        type(value) is float
+        for value in (request.final_x, request.final_y, request.goal_x, request.goal_y)
+    )
@@ -1,5 +1,8 @@
+import time
 from dataclasses import dataclass
 
+import pytest
+
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.usecases.runtime.follow_vehicle_topdown import FollowVehicleTopDown
 from vln_carla2.usecases.runtime.run_operator_loop import RunOperatorLoop
@@ -174,6 +177,73 @@ def test_run_operator_loop_keeps_order_move_then_follow_then_tick() -> None:
     assert events == ["read", "move", "follow", "tick"]
 
 
+def test_run_operator_loop_sleeps_before_polling_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+    monkeypatch.setattr(
+        RunOperatorLoop,
+        "_sleep",
+        lambda _self, _duration_ns: events.append("sleep"),
+    )
+    loop = RunOperatorLoop(
+        world=_FakeWorld(events),
+        synchronous_mode=True,
+        sleep_seconds=0.05,
+        keyboard_input=_FakeKeyboardInput(events),
+        move_spectator=_FakeMoveSpectator(events),
+        follow_vehicle_topdown=_FakeFollowVehicle(events),
+    )
+
+    executed = loop.run(max_ticks=2)
+
+    assert executed == 2
+    assert events == [
+        "read",
+        "move",
+        "follow",
+        "tick",
+        "sleep",
+        "read",
+        "move",
+        "follow",
+        "tick",
+    ]
+
+
+def test_run_operator_loop_sleep_reaches_deadline_and_tracks_slices() -> None:
+    loop = RunOperatorLoop(world=_FakeWorld([]), synchronous_mode=True, sleep_seconds=0.0)
+
+    started_ns = time.perf_counter_ns()
+    loop._sleep(5_000_000)
+    elapsed_ns = time.perf_counter_ns() - started_ns
+
+    assert elapsed_ns >= 5_000_000
+    assert loop._worst_sleep_ns == max(loop._sleep_history)
+    assert loop._sleep_history_index > 0
+
+
+def test_run_operator_loop_sleep_outlier_slice_does_not_force_spinning(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loop = RunOperatorLoop(world=_FakeWorld([]), synchronous_mode=True, sleep_seconds=0.0)
+    real_sleep = time.sleep
+    slices: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        # The first slice oversleeps well past a whole tick, like a descheduled thread.
+        real_sleep(0.02 if not slices else seconds)
+        slices.append(seconds)
+
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+
+    loop._sleep(5_000_000)
+    outlier_slices = len(slices)
+    loop._sleep(5_000_000)
+
+    assert outlier_slices == 1
+    assert len(slices) > outlier_slices
+    assert loop._worst_sleep_ns <= 2_000_000
+
+
 def test_run_operator_loop_step_can_skip_tick() -> None:
     events: list[str] = []
     world = _FakeWorld(events)
@@ -202,3 +272,36 @@ def test_legacy_follow_import_points_to_operator_usecase() -> None:
     assert LegacyFollow is FollowVehicleTopDown
 
 
+def test_run_operator_loop_step_input_runs_handlers_without_tick() -> None:
+    events: list[str] = []
+    world = _FakeWorld(events)
+    loop = RunOperatorLoop(
+        world=world,
+        synchronous_mode=True,
+        sleep_seconds=0.2,
+        keyboard_input=_FakeKeyboardInput(events),
+        move_spectator=_FakeMoveSpectator(events),
+        follow_vehicle_topdown=_FakeFollowVehicle(events),
+    )
+
+    loop.step_input(1)
+
+    assert events == ["read", "move", "follow"]
+    assert world.tick_calls == 0
+
+
+def test_run_operator_loop_without_handlers_only_ticks_and_sleeps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: list[str] = []
+    monkeypatch.setattr(
+        RunOperatorLoop,
+        "_sleep",
+        lambda _self, _duration_ns: events.append("sleep"),
+    )
+    loop = RunOperatorLoop(world=_FakeWorld(events), synchronous_mode=True, sleep_seconds=0.05)
+
+    assert loop._sleep_ns == 50_000_000
+    assert loop.run(max_ticks=3) == 3
+    assert events == ["tick", "sleep", "tick", "sleep", "tick"]
+    assert loop.run(max_ticks=0) == 0
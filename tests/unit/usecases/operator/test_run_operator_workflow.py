@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pytest
 
@@ -52,6 +52,7 @@ class _FakeOperatorRuntime:
     run_calls: list[int | None]
     step_calls: list[tuple[bool, bool]]
     events: list[str]
+    input_calls: list[int] = field(default_factory=list)
 
     def run(self, *, max_ticks: int | None = None) -> int:
         self.run_calls.append(max_ticks)
@@ -62,6 +63,10 @@ class _FakeOperatorRuntime:
         self.events.append("operator")
         return None
 
+    def step_input(self, step: int) -> None:
+        self.input_calls.append(step)
+        self.events.append("operator")
+
 
 @dataclass
 class _FakeControlLoop:
@@ -167,7 +172,8 @@ def test_run_operator_workflow_parallel_spawns_when_ref_missing() -> None:
     assert resolver.calls == [VehicleRef(scheme="first", value=None)]
     assert spawner.calls == [_spawn_request()]
     assert operator_runtime.run_calls == []
-    assert operator_runtime.step_calls == [(False, False), (False, False), (False, False)]
+    assert operator_runtime.step_calls == []
+    assert operator_runtime.input_calls == [1, 2, 3]
     assert control_loop.calls == [(9, 4.0, 3, True)]
     assert events == ["operator", "control", "operator", "control", "operator", "control"]
 
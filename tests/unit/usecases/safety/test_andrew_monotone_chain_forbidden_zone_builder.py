@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from vln_carla2.domain.model.point2d import Point2D
+from vln_carla2.usecases.scene._monotone_chain_numba import monotone_chain_kernel
 from vln_carla2.usecases.scene.andrew_monotone_chain_forbidden_zone_builder import (
     AndrewMonotoneChainForbiddenZoneBuilder,
 )
@@ -52,3 +54,34 @@ def test_build_rejects_collinear_points() -> None:
             ]
         )
 
+
+def test_monotone_chain_kernel_gives_same_hull_for_lists_and_arrays() -> None:
+    points = np.array(
+        sorted({((i * 7) % 13 - 6.0, (i * 5) % 11 - 5.0) for i in range(80)}),
+        dtype=np.float64,
+    )
+    list_hull = [0] * (2 * len(points))
+    array_hull = np.empty(2 * len(points), dtype=np.int64)
+
+    list_size = monotone_chain_kernel(points[:, 0].tolist(), points[:, 1].tolist(), list_hull)
+    array_size = monotone_chain_kernel(points[:, 0], points[:, 1], array_hull)
+
+    assert array_size == list_size
+    assert array_hull[:array_size].tolist() == list_hull[:list_size]
+
+
+def test_build_from_array_matches_point_input() -> None:
+    builder = AndrewMonotoneChainForbiddenZoneBuilder()
+    raw = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.5, 0.5), (1.0, 0.0)]
+
+    from_array = builder.build_from_array(np.array(raw))
+    from_points = builder.build([Point2D(x=x, y=y) for x, y in raw])
+
+    assert from_array == from_points
+
+
+def test_build_from_array_rejects_wrong_shape() -> None:
+    builder = AndrewMonotoneChainForbiddenZoneBuilder()
+
+    with pytest.raises(ValueError, match=r"shape \(N, 2\)"):
+        builder.build_from_array(np.zeros((4, 3)))
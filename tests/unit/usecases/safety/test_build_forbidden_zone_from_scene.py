@@ -33,6 +33,10 @@ class _FakeBuilder:
         self.calls.append(points)
         return self.zone
 
+    def build_from_array(self, xy):
+        self.calls.append([(float(x), float(y)) for x, y in xy.tolist()])
+        return self.zone
+
 
 def _template(*, map_name: str = "Town10HD_Opt", schema_version: int = 1) -> SceneTemplate:
     return SceneTemplate.from_iterable(
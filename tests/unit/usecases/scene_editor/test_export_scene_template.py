@@ -6,6 +6,7 @@ import pytest
 from vln_carla2.domain.model.episode_spec import EpisodeSpec
 from vln_carla2.domain.model.scene_template import SceneObject, SceneObjectKind, ScenePose, SceneTemplate
 from vln_carla2.usecases.scene.export_scene_template import ExportSceneTemplate
+from vln_carla2.usecases.scene.record_spawned_scene_object import RecordSpawnedSceneObject
 
 
 @dataclass
@@ -118,6 +119,25 @@ def test_export_scene_template_exports_episode_spec_with_strict_fields() -> None
     assert spec.seed == 123
 
 
+def test_export_scene_template_stores_recorder_snapshot_without_copying() -> None:
+    recorder = RecordSpawnedSceneObject()
+    recorder.record(
+        SceneObject(
+            kind=SceneObjectKind.BARREL,
+            blueprint_id="static.prop.barrel",
+            role_name="barrel",
+            pose=ScenePose(x=1.0, y=2.0, z=0.2, yaw=0.0),
+        )
+    )
+    store = _FakeStore()
+    usecase = ExportSceneTemplate(store=store, recorder=recorder, map_name="Town10HD_Opt")
+
+    usecase.run()
+
+    template, _ = store.calls[0]
+    assert template.objects is recorder.snapshot()
+
+
 def test_export_scene_template_requires_unique_goal_object_for_episode_spec() -> None:
     usecase = ExportSceneTemplate(
         store=_FakeStore(),
@@ -162,6 +182,25 @@ def test_export_scene_template_requires_unique_ego_for_episode_spec() -> None:
         usecase.run()
 
 
+def test_export_scene_template_reports_duplicate_ego_count() -> None:
+    ego = SceneObject(
+        kind=SceneObjectKind.VEHICLE,
+        blueprint_id="vehicle.tesla.model3",
+        role_name="ego",
+        pose=ScenePose(x=1.0, y=2.0, z=0.1, yaw=180.0),
+    )
+    usecase = ExportSceneTemplate(
+        store=_FakeStore(),
+        recorder=_FakeRecorder(objects=[ego, ego]),
+        map_name="Town10HD_Opt",
+        export_episode_spec=True,
+        episode_spec_store=_FakeEpisodeSpecStore(),
+    )
+
+    with pytest.raises(ValueError, match="requires exactly one role 'ego', got 2"):
+        usecase.run()
+
+
 def test_export_scene_template_uses_env_dir_when_scene_path_is_implicit() -> None:
     episode_store = _FakeEpisodeSpecStore()
     usecase = ExportSceneTemplate(
@@ -194,6 +233,8 @@ def test_export_scene_template_uses_env_dir_when_scene_path_is_implicit() -> Non
     assert len(episode_store.calls) == 1
     _, spec_path = episode_store.calls[0]
     assert spec_path == str(Path("datasets/town10hd_val_v1/episodes/ep_000002/episode_spec.json"))
+    spec, _ = episode_store.calls[0]
+    assert Path(spec.scene_json_path) == Path("../../../../saved/path.json")
 
 
 def test_export_scene_template_prefers_explicit_scene_path_over_env_dir() -> None:
@@ -111,3 +111,29 @@ def test_import_scene_template_skips_goal_vehicle_kind() -> None:
     assert imported == 2
     assert [obj.kind for obj in spawner.calls] == [SceneObjectKind.VEHICLE, SceneObjectKind.BARREL]
 
+
+class _FakeBatchSpawner(_FakeSpawner):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[SceneObject]] = []
+
+    def spawn_batch(self, objs: list[SceneObject]) -> int:
+        self.batches.append(list(objs))
+        return len(objs)
+
+
+def test_import_scene_template_submits_one_batch_when_spawner_supports_it() -> None:
+    spawner = _FakeBatchSpawner()
+    usecase = ImportSceneTemplate(
+        store=_FakeStore(_template(include_goal=True)),
+        spawner=spawner,
+        expected_map_name="Town10HD_Opt",
+    )
+
+    imported = usecase.run("scene.json")
+
+    assert imported == 2
+    assert spawner.calls == []
+    assert [[obj.kind for obj in batch] for batch in spawner.batches] == [
+        [SceneObjectKind.VEHICLE, SceneObjectKind.BARREL]
+    ]
@@ -0,0 +1,29 @@
+from vln_carla2.domain.model.scene_template import SceneObject, SceneObjectKind, ScenePose
+from vln_carla2.usecases.scene.record_spawned_scene_object import RecordSpawnedSceneObject
+
+
+def _barrel(role_name: str) -> SceneObject:
+    return SceneObject(
+        kind=SceneObjectKind.BARREL,
+        blueprint_id="static.prop.barrel",
+        role_name=role_name,
+        pose=ScenePose(x=1.0, y=2.0, z=0.2, yaw=0.0),
+    )
+
+
+def test_record_spawned_scene_object_snapshot_is_reused_until_next_record() -> None:
+    recorder = RecordSpawnedSceneObject()
+    first = _barrel("barrel_1")
+    second = _barrel("barrel_2")
+
+    assert recorder.snapshot() == ()
+    recorder.record(first)
+    snapshot = recorder.snapshot()
+
+    assert snapshot == (first,)
+    assert recorder.snapshot() is snapshot
+
+    recorder.run(second)
+
+    assert recorder.snapshot() == (first, second)
+    assert snapshot == (first,)
@@ -158,6 +158,30 @@ def test_free_mode_applies_held_move_delta() -> None:
     assert move.calls == [InputSnapshot(dx=1.0, dy=-2.0, dz=0.5)]
 
 
+def test_free_mode_keeps_moving_on_repeated_idle_snapshot() -> None:
+    move = _FakeMoveSpectator()
+    loop = _make_loop(
+        state=EditorState(mode=EditorMode.FREE, follow_vehicle_id=None, follow_z=20.0),
+        snapshots=[
+            EditorInputSnapshot(held_dx=1.0),
+            EditorInputSnapshot(),
+            EditorInputSnapshot(),
+            EditorInputSnapshot(held_dy=1.0),
+        ],
+        move_spectator=move,
+    )
+
+    for _ in range(4):
+        loop.step(with_tick=False, with_sleep=False)
+
+    assert move.calls == [
+        InputSnapshot(dx=1.0, dy=0.0, dz=0.0),
+        InputSnapshot(dx=0.0, dy=0.0, dz=0.0),
+        InputSnapshot(dx=0.0, dy=0.0, dz=0.0),
+        InputSnapshot(dx=0.0, dy=1.0, dz=0.0),
+    ]
+
+
 def test_toggle_free_to_follow_success_moves_immediately_and_skips_free_move() -> None:
     warnings: list[str] = []
     move = _FakeMoveSpectator()
@@ -502,3 +526,6 @@ def test_tick_observer_is_called_after_each_tick() -> None:
     assert observer.frames == [1, 2]
 
 
+def test_editor_input_snapshot_zero_is_shared_singleton() -> None:
+    assert EditorInputSnapshot.zero() is EditorInputSnapshot.zero()
+    assert EditorInputSnapshot.zero() == EditorInputSnapshot()
@@ -1,9 +1,22 @@
+import math
 from dataclasses import dataclass
 
+import pytest
+
+from vln_carla2.domain.errors import ActorMissingError
 from vln_carla2.domain.model.vehicle_id import VehicleId
 from vln_carla2.domain.model.vehicle_state import VehicleState
+from vln_carla2.usecases.tracking import run_tracking_loop as run_tracking_loop_module
+from vln_carla2.usecases.tracking._route_search_numba import route_search_kernel
 from vln_carla2.usecases.tracking.models import RoutePoint
-from vln_carla2.usecases.tracking.run_tracking_loop import RunTrackingLoop, TrackingRequest
+from vln_carla2.usecases.tracking.run_tracking_loop import (
+    _ARC_SKIP_SLACK_M,
+    RunTrackingLoop,
+    TrackingRequest,
+    _nearest_route_index,
+    _route_arrays,
+    _select_lookahead_index,
+)
 
 
 def _state(*, frame: int, x: float, y: float, yaw_deg: float, speed_mps: float) -> VehicleState:
@@ -28,7 +41,7 @@ class _FakeStateReader:
 
     def read(self, _vehicle_id: VehicleId) -> VehicleState:
         if self.fail_with_actor_missing:
-            raise RuntimeError("Vehicle actor not found: id=42")
+            raise ActorMissingError("Vehicle actor not found: id=42")
         state = self.states[self.index]
         if self.index < len(self.states) - 1:
             self.index += 1
@@ -58,8 +71,11 @@ class _FakeLogger:
     warns: list[str]
     errors: list[str]
 
-    def info(self, message: str) -> None:
-        self.infos.append(message)
+    def is_info_enabled(self) -> bool:
+        return True
+
+    def info(self, message: str, *args: object) -> None:
+        self.infos.append(message % args if args else message)
 
     def warn(self, message: str) -> None:
         self.warns.append(message)
@@ -89,7 +105,16 @@ class _FakeRoutePlanner:
         return self.route
 
 
-def test_tracking_loop_reaches_goal_and_stops() -> None:
+@pytest.mark.parametrize("use_search_kernel", [False, True])
+def test_tracking_loop_reaches_goal_and_stops(
+    monkeypatch: pytest.MonkeyPatch,
+    use_search_kernel: bool,
+) -> None:
+    monkeypatch.setattr(
+        run_tracking_loop_module,
+        "route_search_jit",
+        route_search_kernel if use_search_kernel else None,
+    )
     route = (
         RoutePoint(x=0.0, y=0.0, yaw_deg=0.0),
         RoutePoint(x=5.0, y=0.0, yaw_deg=0.0),
@@ -219,3 +244,201 @@ def test_tracking_loop_returns_route_failed_when_route_planner_raises() -> None:
     assert result.termination_reason == "route_failed"
     assert result.reached_goal is False
     assert result.step_traces == ()
+
+
+def test_route_searches_match_forward_scan_on_curved_route() -> None:
+    route_points = tuple(
+        RoutePoint(
+            x=10.0 * math.sin(0.2 * idx),
+            y=10.0 - 10.0 * math.cos(0.2 * idx),
+            yaw_deg=math.degrees(0.2 * idx),
+        )
+        for idx in range(40)
+    )
+    route = _route_arrays(route_points)
+
+    for x, y, start_index, lookahead_m in (
+        (0.0, 0.0, 0, 3.0),
+        (9.5, 9.0, 2, 4.5),
+        (-3.0, 19.0, 20, 6.0),
+        (0.5, 0.1, 39, 2.5),
+        (1.0, -1.0, 5, 50.0),
+    ):
+        distances = [math.hypot(p.x - x, p.y - y) for p in route_points]
+        expected_nearest = min(
+            range(start_index, len(route_points)),
+            key=distances.__getitem__,
+        )
+        expected_target = next(
+            (
+                idx
+                for idx in range(expected_nearest, len(route_points))
+                if distances[idx] >= lookahead_m
+            ),
+            len(route_points) - 1,
+        )
+
+        nearest = _nearest_route_index(route=route, x=x, y=y, start_index=start_index)
+        assert nearest == expected_nearest
+        assert (
+            _select_lookahead_index(
+                route=route,
+                nearest_index=nearest,
+                x=x,
+                y=y,
+                lookahead_distance_m=lookahead_m,
+            )
+            == expected_target
+        )
+        assert route_search_kernel(
+            route.xs,
+            route.ys,
+            route.arc_m,
+            x,
+            y,
+            start_index,
+            lookahead_m,
+            _ARC_SKIP_SLACK_M,
+        ) == (expected_nearest, expected_target)
+
+
+def test_lookahead_skip_keeps_point_exactly_at_lookahead_distance() -> None:
+    route = _route_arrays(
+        (
+            RoutePoint(x=0.028, y=0.0, yaw_deg=0.0),
+            RoutePoint(x=2.195, y=0.0, yaw_deg=0.0),
+            RoutePoint(x=4.228, y=0.0, yaw_deg=0.0),
+            RoutePoint(x=6.0, y=0.0, yaw_deg=0.0),
+        )
+    )
+    # Rounding leaves the arc length to point 2 just below its straight-line distance.
+    assert float(route.arc_m[2]) < 4.228 - 0.028
+
+    assert (
+        _select_lookahead_index(
+            route=route,
+            nearest_index=0,
+            x=0.028,
+            y=0.0,
+            lookahead_distance_m=4.228 - 0.028,
+        )
+        == 2
+    )
+
+
+def test_tracking_request_rejects_invalid_config_fields() -> None:
+    with pytest.raises(ValueError, match="max_brake must be in"):
+        TrackingRequest(
+            vehicle_id=VehicleId(42),
+            goal_x=10.0,
+            goal_y=0.0,
+            goal_yaw_deg=0.0,
+            max_brake=1.5,
+        )
+
+
+def test_tracking_loop_logs_each_step_with_formatted_args() -> None:
+    logger = _FakeLogger(infos=[], warns=[], errors=[])
+    loop = RunTrackingLoop(
+        state_reader=_FakeStateReader(
+            states=[_state(frame=1, x=0.0, y=0.0, yaw_deg=0.0, speed_mps=1.0)]
+        ),
+        motion_actuator=_FakeMotionActuator(applied=[]),
+        clock=_FakeClock(),
+        logger=logger,
+        route_planner=_FakeRoutePlanner(route=(RoutePoint(x=5.0, y=0.0, yaw_deg=0.0),)),
+    )
+
+    loop.run(
+        TrackingRequest(
+            vehicle_id=VehicleId(42),
+            goal_x=50.0,
+            goal_y=0.0,
+            goal_yaw_deg=0.0,
+            max_steps=2,
+            no_progress_max_steps=10,
+        )
+    )
+
+    assert [message.split(" ", 2)[:2] for message in logger.infos] == [
+        ["step=1", "frame=1"],
+        ["step=2", "frame=2"],
+    ]
+    assert "speed_mps=1.000" in logger.infos[0]
+
+
+def test_tracking_loop_prefers_apply_raw_when_actuator_supports_it() -> None:
+    @dataclass
+    class _FakeRawMotionActuator(_FakeMotionActuator):
+        raw: list[tuple[float, float, float]]
+
+        def apply_raw(
+            self,
+            _vehicle_id: VehicleId,
+            throttle: float,
+            brake: float,
+            steer: float,
+        ) -> None:
+            self.raw.append((throttle, brake, steer))
+
+    actuator = _FakeRawMotionActuator(applied=[], raw=[])
+    loop = RunTrackingLoop(
+        state_reader=_FakeStateReader(
+            states=[_state(frame=1, x=0.0, y=0.0, yaw_deg=0.0, speed_mps=0.0)]
+        ),
+        motion_actuator=actuator,
+        clock=_FakeClock(),
+        logger=_FakeLogger(infos=[], warns=[], errors=[]),
+        route_planner=_FakeRoutePlanner(route=(RoutePoint(x=5.0, y=0.0, yaw_deg=0.0),)),
+    )
+
+    result = loop.run(
+        TrackingRequest(
+            vehicle_id=VehicleId(42),
+            goal_x=50.0,
+            goal_y=0.0,
+            goal_yaw_deg=0.0,
+            max_steps=2,
+        )
+    )
+
+    assert actuator.applied == []
+    assert actuator.raw == [
+        (trace.throttle, trace.brake, trace.steer) for trace in result.step_traces
+    ]
+    assert len(actuator.raw) == 2
+
+
+def test_tracking_loop_shares_planner_route_points_and_normalises_others() -> None:
+    @dataclass(frozen=True)
+    class _ForeignPoint:
+        x: int
+        y: int
+        yaw_deg: int
+
+    planned_point = RoutePoint(x=5.0, y=0.0, yaw_deg=0.0)
+    loop = RunTrackingLoop(
+        state_reader=_FakeStateReader(
+            states=[_state(frame=1, x=0.0, y=0.0, yaw_deg=0.0, speed_mps=0.0)]
+        ),
+        motion_actuator=_FakeMotionActuator(applied=[]),
+        clock=_FakeClock(),
+        logger=_FakeLogger(infos=[], warns=[], errors=[]),
+        route_planner=_FakeRoutePlanner(route=[planned_point]),
+    )
+    request = TrackingRequest(
+        vehicle_id=VehicleId(42),
+        goal_x=50.0,
+        goal_y=0.0,
+        goal_yaw_deg=0.0,
+        max_steps=1,
+    )
+
+    shared = loop.run(request)
+    loop.route_planner = _FakeRoutePlanner(route=(_ForeignPoint(x=5, y=0, yaw_deg=0),))
+    converted = loop.run(request)
+
+    assert shared.route_points == (planned_point,)
+    assert shared.route_points[0] is planned_point
+    assert converted.route_points == (RoutePoint(x=5.0, y=0.0, yaw_deg=0.0),)
+    assert type(converted.route_points[0].x) is float